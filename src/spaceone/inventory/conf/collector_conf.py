@@ -27,6 +27,16 @@ UPDATED = 2
 ERROR = 3
 
 JOB_TASK_STAT_EXPIRE_TIME = 3600  # 1 hour
+CLEANUP_CHUNK_SIZE = 1000  # disconnected resources deleted at once
 WATCHDOG_WAITING_TIME = 30  # wait 30 seconds, before watchdog works
 
+# Admission of job tasks limited by plugin metadata (concurrency)
+ADMISSION_RETRY_INTERVAL = 5  # first retry of a rejected job task (seconds)
+ADMISSION_MAX_RETRY_INTERVAL = 60  # retry interval is doubled up to this value
+
+# Errors of resources grouped by error code and message template per job task
+JOB_TASK_ERROR_MAX_GROUPS = 100  # errors beyond this are grouped by error code
+JOB_TASK_ERROR_MAX_SAMPLES = 10  # additional data kept per error group
+JOB_TASK_ERROR_DETAIL_CHUNK_SIZE = 1000  # error details written at once
+
 MAX_MESSAGE_LENGTH = 2000
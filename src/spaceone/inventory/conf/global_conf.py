@@ -33,13 +33,47 @@ DEFAULT_DELETE_POLICIES = {
 }
 DEFAULT_DISCONNECTED_STATE_DELETE_POLICY = 3  # 3 Count
 DELETE_EXCLUDE_DOMAINS = []
+CLEANUP_TIME_BUDGET = 600  # Max seconds of a cleanup per resource type and domain
+CLEANUP_DRY_RUN = False  # Only count the resources to be deleted or terminated
+
+# Reference Name Cache Settings (project, service account and region names of exports)
+REFERENCE_CACHE_MAX_SIZE = 100  # Max number of cached domains per resource type
+REFERENCE_CACHE_TTL = 3600  # Full reload interval (seconds)
+REFERENCE_CACHE_REFRESH_INTERVAL = 60  # Incremental refresh interval (seconds)
+
+# Collector Settings
+COLLECTING_BATCH_SIZE = 100  # Number of cloud services upserted at once (0: disabled)
+COLLECTING_MATCH_INDEX_SIZE = 0  # Max cloud services indexed per job task (0: disabled)
+COLLECTING_STREAM_BUFFER_SIZE = 1000  # Resources prefetched from plugin (0: disabled)
+COLLECTOR_RULE_WARM_DOMAIN_SIZE = 0  # Max domain projects to preload (0: disabled)
+JOB_TASK_ERROR_DETAIL = False  # Keep every error of resources for 7 days
+COLLECT_SECRET_CONCURRENCY = 10  # Secrets resolved in parallel to create a job
+PLUGIN_ENDPOINT_CACHE_TTL = 60  # Plugin endpoint cache expiration (0: disabled)
+PLUGIN_ENDPOINT_CACHE_REFRESH_INTERVAL = 45  # Background refresh after (seconds)
+
+# Scheduler Settings
+SCHEDULE_SLOT_COUNT = 12  # Slots of an hour to spread domains over (1: on the hour)
+SCHEDULE_MAX_TASKS_PER_TICK = 100  # Tasks over it are deferred to the next minute
+SCHEDULE_LEASE_TTL = 3600  # Lease of a task between scheduler replicas (seconds)
+SCHEDULE_LARGE_DOMAINS = []  # Domains whose stages are pushed as separate tasks
 
 # Cloud Service Stats Schedule Settings
 STATS_SCHEDULE_HOUR = 15  # Hour (UTC)
+STATS_QUERY_SET_BATCH_SIZE = 100  # Query sets analyzed at once (1: disabled)
+STATS_INCREMENTAL = False  # Copy the last stats of unchanged cloud service types
+STATS_BULK_SIZE = 1000  # Stats inserted or deleted at once
+STATS_CACHE_WARMING_DAYS = 3  # Queries used in the last days are cached after a run
+STATS_CACHE_WARMING_MAX_QUERIES = 50  # Max queries cached per query set (0: disabled)
+STATS_STAGING_TIMEOUT = 2  # Hours before staged stats of an unfinished run are deleted
 
 # Metric Settings
 METRIC_SCHEDULE_HOUR = 0  # Hour (UTC)
 METRIC_QUERY_TTL = 3  # Days
+METRIC_DATA_BULK_SIZE = 1000  # Metric data inserted at once
+METRIC_RUN_WAIT_TIMEOUT = 0  # Seconds to wait for a queued metric job (0: no wait)
+METRIC_RUN_MAX_WAIT = 600  # Max seconds to wait for a queued metric job
+METRIC_RUN_LEASE_TTL = 3600  # Lease of a running metric job (seconds)
+METRIC_RUN_RETRY_INTERVAL = 30  # Seconds to retry while another job runs
 
 # Handler Settings
 HANDLERS = {
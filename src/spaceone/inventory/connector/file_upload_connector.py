@@ -1,6 +1,8 @@
 import abc
+import os
 import requests
 import logging
+import uuid
 
 from spaceone.core.connector import BaseConnector
 from spaceone.inventory.error.file_upload import *
@@ -10,6 +12,8 @@ __all__ = ["FileUploadConnector", "FilesUploadConnector"]
 
 _LOGGER = logging.getLogger(__name__)
 
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class FileUploadConnector(BaseConnector):
 
@@ -31,8 +35,10 @@ class FilesUploadConnector(FileUploadConnector):
         headers = self._make_request_header(self.transaction.get_meta("token"))
 
         with open(file_path, "rb") as f:
-            files = {"file": (file_name, f)}
-            response = requests.post(url, files=files, headers=headers)
+            # Multipart body is streamed from the file instead of being loaded in memory
+            body = _MultipartFileStream(f, file_name, os.path.getsize(file_path))
+            headers["Content-Type"] = body.content_type
+            response = requests.post(url, data=body, headers=headers)
 
             if response.status_code in [200, 204]:
                 _LOGGER.debug(
@@ -52,3 +58,45 @@ class FilesUploadConnector(FileUploadConnector):
             "Accept": "application/octet-stream",
         }
         return headers
+
+
+class _MultipartFileStream(object):
+    def __init__(self, file, file_name: str, file_size: int, field_name="file"):
+        boundary = uuid.uuid4().hex
+        file_name = file_name.replace('"', '\\"')
+
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._file = file
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{file_name}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        self._length = len(self._head) + file_size + len(self._tail)
+        self._parts = [self._head, None, self._tail]
+        self._buffer = b""
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length
+
+        while len(self._buffer) < size and self._parts:
+            part = self._parts[0]
+
+            if part is None:
+                chunk = self._file.read(max(size, _UPLOAD_CHUNK_SIZE))
+                if chunk:
+                    self._buffer += chunk
+                    continue
+            else:
+                self._buffer += part
+
+            self._parts.pop(0)
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
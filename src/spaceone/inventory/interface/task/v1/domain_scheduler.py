@@ -0,0 +1,198 @@
+"""
+Sharded scheduling of domain tasks
+
+Instead of pushing the tasks of all targets (domains or collectors) on the hour,
+a scheduler ticks every minute and spreads its targets over the slots of the
+hour (starting at the configured minute) by a stable hash of their keys, so a
+target is pushed in the same slot every hour. When several replicas of a
+scheduler run, a task is only pushed by the replica acquiring its lease in the
+cache. Tasks over the max number of a tick are deferred to the next tick, and
+the stages of large domains are pushed as separate tasks with their own slots.
+"""
+
+import abc
+import hashlib
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+import schedule
+from spaceone.core import cache, config
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core.locator import Locator
+from spaceone.core.logger import set_logger
+from spaceone.core.scheduler import HourlyScheduler
+
+__all__ = ["DomainScheduler"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DomainScheduler(HourlyScheduler, abc.ABC):
+    task_name = "domain_schedule"
+
+    def __init__(self, queue, interval, minute=":00"):
+        super().__init__(queue, interval, minute)
+        self.locator = Locator()
+        self._init_config()
+
+        self._last_tick: Tuple[str, int] = None
+        self._targets: Tuple[str, List[dict]] = (None, [])
+        self._deferred_tasks: List[dict] = []
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+
+        slot_count = config.get_global("SCHEDULE_SLOT_COUNT", 12)
+        self._slot_count = min(max(slot_count, 1), 60)
+        self._max_tasks = config.get_global("SCHEDULE_MAX_TASKS_PER_TICK", 100)
+        self._lease_ttl = config.get_global("SCHEDULE_LEASE_TTL", 3600)
+        self._large_domains = set(config.get_global("SCHEDULE_LARGE_DOMAINS", []))
+        self._start_minute = int(self.minute.strip(":") or 0) % 60
+
+    def run(self):
+        config.set_global_force(**self.global_config)
+
+        # Enable logging configuration
+        set_logger()
+
+        # Call push_task in every minute, tasks are pushed in their slots
+        schedule.every(1).minutes.at(":00").do(self.push_task)
+        while True:
+            schedule.run_pending()
+            time.sleep(1)
+
+    def create_task(self) -> List[dict]:
+        now = datetime.utcnow() - timedelta(minutes=self._start_minute)
+        period = now.strftime("%Y-%m-%dT%H")
+        slots = self._get_slots_to_run(period, now.minute * self._slot_count // 60)
+
+        tasks = self._deferred_tasks
+        if slots and self.is_schedule_hour(now.hour):
+            for target in self._get_targets(period, now.hour):
+                for key, stages in self._shard_stages(target):
+                    if self._get_slot(key) in slots and self._acquire_lease(
+                        period, key
+                    ):
+                        tasks.append(self._make_task(stages))
+
+        if self._max_tasks > 0:
+            tasks, self._deferred_tasks = (
+                tasks[: self._max_tasks],
+                tasks[self._max_tasks :],
+            )
+        else:
+            self._deferred_tasks = []
+
+        if tasks or self._deferred_tasks:
+            _LOGGER.debug(
+                f"[create_task] {self.task_name} (UTC {period}, slots = {slots}): "
+                f"tasks = {len(tasks)}, deferred = {len(self._deferred_tasks)}"
+            )
+
+        return tasks
+
+    def is_schedule_hour(self, current_hour: int) -> bool:
+        return True
+
+    def list_targets(self, current_hour: int) -> List[dict]:
+        return self.list_domains(current_hour)
+
+    def get_schedule_key(self, target: dict) -> str:
+        return target["domain_id"]
+
+    @abc.abstractmethod
+    def create_stages(self, target: dict) -> List[dict]:
+        pass
+
+    def list_domains(self, current_hour: int) -> List[dict]:
+        try:
+            cleanup_svc = self.locator.get_service(
+                "CleanupService", {"token": self._token}
+            )
+            response = cleanup_svc.list_domains({})
+            total_count = response.get("total_count", 0)
+
+            _LOGGER.debug(
+                f"[list_domains] total domain count (UTC {current_hour}): {total_count}"
+            )
+            return response.get("results", [])
+
+        except Exception as e:
+            _LOGGER.error(e)
+            return []
+
+    def is_large_domain(self, domain_id: str) -> bool:
+        return domain_id in self._large_domains
+
+    def make_stage(self, service: str, method: str, params: dict) -> dict:
+        return {
+            "locator": "SERVICE",
+            "name": service,
+            "metadata": {
+                "token": self._token,
+            },
+            "method": method,
+            "params": {"params": params},
+        }
+
+    def _make_task(self, stages: List[dict]) -> dict:
+        return {
+            "name": self.task_name,
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": stages,
+        }
+
+    def _get_slots_to_run(self, period: str, slot: int) -> List[int]:
+        last_tick = self._last_tick
+        self._last_tick = (period, slot)
+
+        if last_tick is None:
+            # started in the middle of the hour, previous slots are skipped
+            return [slot]
+        elif last_tick[0] == period:
+            return list(range(last_tick[1] + 1, slot + 1))
+        else:
+            return list(range(0, slot + 1))
+
+    def _get_targets(self, period: str, current_hour: int) -> List[dict]:
+        # targets are listed once in an hour
+        if self._targets[0] != period:
+            self._targets = (period, self.list_targets(current_hour))
+
+        return self._targets[1]
+
+    def _shard_stages(self, target: dict) -> List[Tuple[str, List[dict]]]:
+        key = self.get_schedule_key(target)
+        stages = self.create_stages(target)
+
+        if self.is_large_domain(target.get("domain_id")) and len(stages) > 1:
+            return [(f"{key}:{index}", [stage]) for index, stage in enumerate(stages)]
+
+        return [(key, stages)]
+
+    def _get_slot(self, key: str) -> int:
+        hashed = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return int(hashed[:8], 16) % self._slot_count
+
+    def _acquire_lease(self, period: str, key: str) -> bool:
+        if not cache.is_set():
+            return True
+
+        lease_key = f"inventory:schedule-lease:{self.task_name}:{period}:{key}"
+
+        try:
+            if cache.increment(lease_key) == 1:
+                cache.set(lease_key, 1, expire=self._lease_ttl)
+                return True
+
+            return False
+
+        except Exception as e:
+            # without the lease, the task may be pushed by several replicas
+            _LOGGER.warning(f"[_acquire_lease] {lease_key}: {e}")
+            return True
@@ -1,9 +1,6 @@
 import logging
-from datetime import datetime
-from spaceone.core.error import ERROR_CONFIGURATION
-from spaceone.core.locator import Locator
-from spaceone.core.scheduler import HourlyScheduler
-from spaceone.core import config, utils
+from typing import List
+from spaceone.inventory.interface.task.v1.domain_scheduler import DomainScheduler
 from spaceone.inventory.service.collector_service import CollectorService
 
 
@@ -12,24 +9,21 @@ __all__ = ["InventoryHourlyScheduler"]
 _LOGGER = logging.getLogger(__name__)
 
 
-class InventoryHourlyScheduler(HourlyScheduler):
-    def __init__(self, queue, interval, minute=":00"):
-        super().__init__(queue, interval, minute)
-        self.locator = Locator()
-        self._init_config()
+class InventoryHourlyScheduler(DomainScheduler):
+    task_name = "inventory_collect_schedule"
 
-    def _init_config(self):
-        self._token = config.get_global("TOKEN")
-        if self._token is None:
-            raise ERROR_CONFIGURATION(key="TOKEN")
-
-    def create_task(self):
-        current_hour = datetime.utcnow().hour
+    def list_targets(self, current_hour: int) -> List[dict]:
         return [
-            self._create_job_request(collector_vo)
+            {
+                "collector_id": collector_vo.collector_id,
+                "domain_id": collector_vo.domain_id,
+            }
             for collector_vo in self.list_schedule_collectors(current_hour)
         ]
 
+    def get_schedule_key(self, target: dict) -> str:
+        return target["collector_id"]
+
     def list_schedule_collectors(self, current_hour: int):
         try:
             collector_svc: CollectorService = self.locator.get_service(
@@ -46,29 +40,18 @@ class InventoryHourlyScheduler(HourlyScheduler):
             _LOGGER.error(e, exc_info=True)
             return []
 
-    def _create_job_request(self, collector_vo):
-        schedule_job = {
-            "locator": "SERVICE",
-            "name": "CollectorService",
-            "metadata": {
-                "token": self._token,
-            },
-            "method": "collect",
-            "params": {
-                "params": {
-                    "collector_id": collector_vo.collector_id,
-                    "domain_id": collector_vo.domain_id,
-                }
-            },
-        }
-
+    def create_stages(self, target: dict) -> List[dict]:
         _LOGGER.debug(
-            f"[_create_job_request] tasks: inventory_collect_schedule: {collector_vo.collector_id}"
+            f"[create_stages] tasks: {self.task_name}: {target['collector_id']}"
         )
 
-        return {
-            "name": "inventory_collect_schedule",
-            "version": "v1",
-            "executionEngine": "BaseWorker",
-            "stages": [schedule_job],
-        }
+        return [
+            self.make_stage(
+                "CollectorService",
+                "collect",
+                {
+                    "collector_id": target["collector_id"],
+                    "domain_id": target["domain_id"],
+                },
+            )
+        ]
@@ -1,58 +1,27 @@
 import logging
-from datetime import datetime
+from typing import List
 
-from spaceone.core.error import ERROR_CONFIGURATION
 from spaceone.core import config
-from spaceone.core import utils
-from spaceone.core.locator import Locator
-from spaceone.core.scheduler import HourlyScheduler
+from spaceone.inventory.interface.task.v1.domain_scheduler import DomainScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class MetricScheduler(HourlyScheduler):
-    def __init__(self, queue, interval, minute=":00"):
-        super().__init__(queue, interval, minute)
-        self.locator = Locator()
-        self._init_config()
+class MetricScheduler(DomainScheduler):
+    task_name = "metric_schedule"
 
     def _init_config(self):
-        self._token = config.get_global("TOKEN")
-        if self._token is None:
-            raise ERROR_CONFIGURATION(key="TOKEN")
+        super()._init_config()
         self._metric_schedule_hour = config.get_global("METRIC_SCHEDULE_HOUR", 0)
 
-    def create_task(self):
-        if datetime.utcnow().hour == self._metric_schedule_hour:
-            stp = {
-                "name": "metric_schedule",
-                "version": "v1",
-                "executionEngine": "BaseWorker",
-                "stages": [
-                    {
-                        "locator": "SERVICE",
-                        "name": "MetricService",
-                        "metadata": {
-                            "token": self._token,
-                        },
-                        "method": "run_all_metric_queries",
-                        "params": {"params": {}},
-                    }
-                ],
-            }
+    def is_schedule_hour(self, current_hour: int) -> bool:
+        return current_hour == self._metric_schedule_hour
 
-            print(
-                f"{utils.datetime_to_iso8601(datetime.now())} "
-                f"[INFO] [create_task] run_all_metric_queries => START"
+    def create_stages(self, target: dict) -> List[dict]:
+        return [
+            self.make_stage(
+                "MetricService",
+                "run_metric_queries_by_domain",
+                {"domain_id": target["domain_id"]},
             )
-            return [stp]
-        else:
-            print(
-                f"{utils.datetime_to_iso8601(datetime.now())} "
-                f"[INFO] [create_task] run_all_metric_queries => SKIP"
-            )
-            print(
-                f"{utils.datetime_to_iso8601(datetime.now())} [INFO] "
-                f"[create_task] run_all_metric_queries: {self._metric_schedule_hour} hour (UTC)"
-            )
-            return []
+        ]
@@ -0,0 +1,45 @@
+import logging
+from typing import List
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core.scheduler import IntervalScheduler
+
+__all__ = ["RetryScheduler"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryScheduler(IntervalScheduler):
+    """Pushes a task to push the delayed retries again, which are stored in the database,
+    so they are not lost when a worker is restarted. Retries are popped atomically,
+    several replicas of the scheduler don't push a retry twice.
+    """
+
+    task_name = "inventory_retry_schedule"
+
+    def __init__(self, queue, interval):
+        super().__init__(queue, interval)
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+
+    def create_task(self) -> List[dict]:
+        _LOGGER.debug(f"[create_task] tasks: {self.task_name}")
+
+        return [
+            {
+                "name": self.task_name,
+                "version": "v1",
+                "executionEngine": "BaseWorker",
+                "stages": [
+                    {
+                        "locator": "SERVICE",
+                        "name": "CleanupService",
+                        "metadata": {"token": self._token},
+                        "method": "push_retry_tasks",
+                        "params": {"params": {}},
+                    }
+                ],
+            }
+        ]
@@ -0,0 +1,231 @@
+"""
+Bulk write helpers for MongoModel
+
+These helpers follow the same rules as MongoModel.create() and MongoModel.update()
+(generate_id, auto_now, auto_now_add, updatable_fields and value trimming),
+but send all documents of a batch to the database with a single unordered request.
+Results are returned in the same order as the requests, and a failed item
+is returned as an exception instead of failing the whole batch.
+"""
+
+import logging
+from datetime import datetime
+from typing import List, Tuple, Union
+
+from pymongo import UpdateMany, UpdateOne
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, OperationFailure
+from spaceone.core import utils
+from spaceone.core.error import ERROR_DB_QUERY
+from spaceone.core.model.mongo_model import MongoModel
+
+_LOGGER = logging.getLogger(__name__)
+
+# error code of an aggregation stage unknown to the server (e.g. $merge < 4.2)
+_UNRECOGNIZED_PIPELINE_STAGE = 40324
+
+
+def make_create_data(model: MongoModel, data: dict) -> dict:
+    create_data = {}
+
+    for name, field in model._fields.items():
+        if name in data:
+            create_data[name] = data[name]
+        else:
+            generate_id = getattr(field, "generate_id", None)
+            if generate_id:
+                create_data[name] = utils.generate_id(generate_id)
+
+            if getattr(field, "auto_now", False):
+                create_data[name] = datetime.utcnow()
+            elif getattr(field, "auto_now_add", False):
+                create_data[name] = datetime.utcnow()
+
+    for key, value in create_data.items():
+        create_data[key] = model._trim_value(value)
+
+    return create_data
+
+
+def make_update_data(model: MongoModel, data: dict) -> dict:
+    updatable_fields = model._meta.get("updatable_fields", list(model._fields.keys()))
+    update_data = {}
+
+    for name, field in model._fields.items():
+        if getattr(field, "auto_now", False):
+            if name not in data.keys():
+                data[name] = datetime.utcnow()
+
+    for key, value in data.items():
+        if key in updatable_fields and key in model._fields:
+            field = model._fields[key]
+            value = model._trim_value(value)
+            update_data[field.db_field] = field.prepare_query_value("set", value)
+
+    return update_data
+
+
+def insert_many(
+    model: MongoModel, data_list: List[dict]
+) -> List[Union[MongoModel, Exception]]:
+    results: List[Union[MongoModel, Exception]] = [None] * len(data_list)
+    documents = []
+    indexes = []
+
+    for idx, data in enumerate(data_list):
+        try:
+            vo = model(**make_create_data(model, data))
+            vo.validate()
+            results[idx] = vo
+            documents.append(vo.to_mongo())
+            indexes.append(idx)
+        except Exception as e:
+            results[idx] = ERROR_DB_QUERY(reason=e)
+
+    if len(documents) > 0:
+        try:
+            model._get_collection().insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            _set_write_errors(results, indexes, e)
+        except Exception as e:
+            _LOGGER.error(f"[insert_many] {model.__name__} insert error: {e}")
+            for idx in indexes:
+                results[idx] = ERROR_DB_QUERY(reason=e)
+
+        for document, idx in zip(documents, indexes):
+            if isinstance(results[idx], MongoModel) and "_id" in document:
+                results[idx].pk = document["_id"]
+
+    return results
+
+
+def create_many(model: MongoModel, data_list: List[dict]) -> int:
+    """Insert all documents or raise the error of the first failed one"""
+
+    for result in insert_many(model, data_list):
+        if isinstance(result, Exception):
+            raise result
+
+    return len(data_list)
+
+
+def update_many_by_vos(
+    model: MongoModel, updates: List[Tuple[MongoModel, dict]]
+) -> List[Union[MongoModel, Exception]]:
+    results: List[Union[MongoModel, Exception]] = [None] * len(updates)
+    operations = []
+    indexes = []
+
+    for idx, (vo, data) in enumerate(updates):
+        results[idx] = vo
+
+        try:
+            update_data = make_update_data(model, data)
+        except Exception as e:
+            results[idx] = ERROR_DB_QUERY(reason=e)
+            continue
+
+        if update_data:
+            operations.append(UpdateOne({"_id": vo.pk}, {"$set": update_data}))
+            indexes.append(idx)
+
+    if len(operations) > 0:
+        try:
+            model._get_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            _set_write_errors(results, indexes, e)
+        except Exception as e:
+            _LOGGER.error(f"[update_many_by_vos] {model.__name__} update error: {e}")
+            for idx in indexes:
+                results[idx] = ERROR_DB_QUERY(reason=e)
+
+    return results
+
+
+def update_many(model: MongoModel, pks: list, data: dict) -> int:
+    if len(pks) == 0:
+        return 0
+
+    update_data = make_update_data(model, data)
+    result = model._get_collection().update_many(
+        {"_id": {"$in": pks}}, {"$set": update_data}
+    )
+
+    return result.modified_count
+
+
+def upsert_many(model: MongoModel, conditions_list: List[dict], data: dict) -> list:
+    """Update the documents matching each conditions or insert a new one
+
+    Returns:
+        pks (list): pks of the inserted documents
+    """
+
+    if len(conditions_list) == 0:
+        return []
+
+    update_data = make_update_data(model, data)
+    operations = []
+
+    for conditions in conditions_list:
+        query = {
+            model._fields[key].db_field: model._trim_value(value)
+            for key, value in conditions.items()
+        }
+        operations.append(UpdateMany(query, {"$set": update_data}, upsert=True))
+
+    result = model._get_collection().bulk_write(operations, ordered=False)
+
+    return list(result.upserted_ids.values())
+
+
+def aggregate_into(
+    collection: Collection, pipeline: list, into: Collection, match: dict
+) -> int:
+    """Insert the results of an aggregation into another collection
+
+    The results are merged in the database with $merge (MongoDB 4.2+).
+    If $merge is not supported, they are aggregated and inserted by the client.
+    If $merge fails otherwise, some results may have been merged already,
+    so the documents matching the query are deleted from the collection first.
+
+    Args:
+        collection (Collection): collection to aggregate
+        pipeline (list): aggregation pipeline without $merge
+        into (Collection): collection to insert the results into
+        match (dict): query matching all results in the collection
+
+    Returns:
+        int: number of the inserted documents (unknown with $merge: -1)
+    """
+
+    try:
+        merge = {
+            "$merge": {
+                "into": into.name,
+                "whenMatched": "fail",
+                "whenNotMatched": "insert",
+            }
+        }
+        collection.aggregate(pipeline + [merge], allowDiskUse=True)
+        return -1
+    except NotImplementedError as e:
+        _LOGGER.debug(f"[aggregate_into] $merge not supported: {e}")
+    except OperationFailure as e:
+        if e.code == _UNRECOGNIZED_PIPELINE_STAGE:
+            _LOGGER.debug(f"[aggregate_into] $merge not supported: {e}")
+        else:
+            _LOGGER.warning(f"[aggregate_into] $merge into {into.name} failed: {e}")
+            into.delete_many(match)
+
+    documents = list(collection.aggregate(pipeline, allowDiskUse=True))
+    if documents:
+        into.insert_many(documents, ordered=False)
+
+    return len(documents)
+
+
+def _set_write_errors(results: list, indexes: List[int], error: BulkWriteError):
+    for write_error in error.details.get("writeErrors", []):
+        idx = indexes[write_error["index"]]
+        results[idx] = ERROR_DB_QUERY(reason=write_error.get("errmsg"))
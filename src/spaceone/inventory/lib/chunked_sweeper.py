@@ -0,0 +1,177 @@
+"""
+Chunked sweep of garbage resources
+
+Resources matching a query are deleted (or soft-deleted) chunk by chunk in the
+order of an indexed key (e.g. updated_at of COMPOUND_INDEX_FOR_GC_2), instead
+of with a single unbounded statement. A sweep stops when its time budget is
+used up, and the order key of the last chunk is kept as a checkpoint in the
+cache, so the next sweep resumes from it. Swept resources must not match the
+query anymore, so a chunk is read from the checkpoint inclusively.
+
+In dry-run mode, the matching resources are only counted.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Callable, List, Union
+
+from spaceone.core import cache
+from spaceone.core.model.mongo_model import QuerySet
+
+_LOGGER = logging.getLogger(__name__)
+
+_CHECKPOINT_EXPIRE_TIME = 86400  # 1 day
+
+# action(documents) returns the number of swept resources
+SweepAction = Callable[[List[dict]], int]
+
+
+class ChunkedSweeper(object):
+    def __init__(self, name: str, chunk_size: int, time_budget: float):
+        """
+        Args:
+            name (str): name of the sweep used for the checkpoint,
+                e.g. 'delete_resources:inventory.CloudService:domain-abcde12345'
+            chunk_size (int): max number of resources swept at once
+            time_budget (float): max seconds of a sweep
+        """
+
+        self.name = name
+        self.chunk_size = chunk_size
+        self.time_budget = time_budget
+
+    def sweep(
+        self,
+        queryset: QuerySet,
+        order_key: str,
+        action: SweepAction,
+        fields: List[str] = None,
+        dry_run: bool = False,
+    ) -> dict:
+        """sweep the resources of the queryset
+
+        Args:
+            queryset (QuerySet): resources to be swept
+            order_key (str): indexed key, the chunks are read in the order of it
+            action (function): action(documents) sweeps a chunk,
+                documents include _id, order_key and fields
+            fields (list): fields of the documents for the action
+            dry_run (bool): only count the resources
+
+        Return:
+            sweep_info (dict): {
+                'swept_count': 'int',
+                'remained_count': 'int',    # estimated, if the sweep is stopped
+                'elapsed_time': 'float',
+                'throughput': 'float',      # resources per second
+                'is_completed': 'bool',
+                'dry_run': 'bool'
+            }
+        """
+
+        started_at = time.monotonic()
+
+        if dry_run:
+            return self._make_sweep_info(0, queryset.count(), started_at, False, True)
+
+        checkpoint = self._get_checkpoint()
+        swept_count = 0
+        is_completed = False
+
+        while time.monotonic() - started_at < self.time_budget:
+            chunk_queryset = queryset
+            if checkpoint is not None:
+                chunk_queryset = queryset.filter(**{f"{order_key}__gte": checkpoint})
+
+            documents = list(
+                chunk_queryset.order_by(order_key)
+                .only(order_key, *(fields or []))
+                .limit(self.chunk_size)
+                .as_pymongo()
+            )
+
+            if len(documents) == 0:
+                is_completed = True
+                break
+
+            chunk_swept_count = action(documents)
+            swept_count += chunk_swept_count
+            checkpoint = documents[-1].get(order_key)
+
+            if len(documents) < self.chunk_size:
+                is_completed = True
+                break
+
+            if chunk_swept_count == 0:
+                # swept resources still match the query, so the sweep can't progress
+                _LOGGER.warning(f"[sweep] {self.name}: no resources swept in a chunk")
+                break
+
+            self._set_checkpoint(checkpoint)
+
+        if is_completed:
+            self._delete_checkpoint()
+            remained_count = 0
+        else:
+            remained_count = queryset.count()
+
+        return self._make_sweep_info(
+            swept_count, remained_count, started_at, is_completed, False
+        )
+
+    def _get_checkpoint(self) -> Union[datetime, None]:
+        if not cache.is_set():
+            return None
+
+        try:
+            if checkpoint := cache.get(self._make_checkpoint_key()):
+                return datetime.fromisoformat(checkpoint)
+        except Exception as e:
+            _LOGGER.warning(f"[_get_checkpoint] {self.name}: {e}")
+
+        return None
+
+    def _set_checkpoint(self, checkpoint: any) -> None:
+        if not (cache.is_set() and isinstance(checkpoint, datetime)):
+            return
+
+        try:
+            cache.set(
+                self._make_checkpoint_key(),
+                checkpoint.isoformat(),
+                expire=_CHECKPOINT_EXPIRE_TIME,
+            )
+        except Exception as e:
+            _LOGGER.warning(f"[_set_checkpoint] {self.name}: {e}")
+
+    def _delete_checkpoint(self) -> None:
+        if not cache.is_set():
+            return
+
+        try:
+            cache.delete(self._make_checkpoint_key())
+        except Exception as e:
+            _LOGGER.warning(f"[_delete_checkpoint] {self.name}: {e}")
+
+    def _make_checkpoint_key(self) -> str:
+        return f"inventory:cleanup-checkpoint:{self.name}"
+
+    @staticmethod
+    def _make_sweep_info(
+        swept_count: int,
+        remained_count: int,
+        started_at: float,
+        is_completed: bool,
+        dry_run: bool,
+    ) -> dict:
+        elapsed_time = time.monotonic() - started_at
+
+        return {
+            "swept_count": swept_count,
+            "remained_count": remained_count,
+            "elapsed_time": round(elapsed_time, 3),
+            "throughput": round(swept_count / elapsed_time, 1) if elapsed_time else 0,
+            "is_completed": is_completed,
+            "dry_run": dry_run,
+        }
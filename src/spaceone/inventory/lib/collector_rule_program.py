@@ -0,0 +1,258 @@
+"""
+Compiled collector rules
+
+Collector rules are compiled once into predicates, instead of interpreting
+the conditions of every rule for every resource.
+
+- keys of conditions are split in advance
+- values of contain/not_contain conditions are lowered in advance
+- eq conditions with the same key are grouped into a set lookup
+- cheap conditions are evaluated first and evaluation stops as soon as
+  the result of ALL/ANY is decided
+
+The result of a rule is the same as the evaluation of its conditions one by one.
+"""
+
+import functools
+import logging
+from typing import Callable, Dict, List, Union
+
+from spaceone.inventory.model.collector_rule_model import (
+    CollectorRule,
+    CollectorRuleCondition,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+Predicate = Callable[[dict], bool]
+ChangeFunction = Callable[[dict, dict], dict]
+
+
+class CompiledRule(object):
+    __slots__ = ("collector_rule_id", "match", "actions", "stop_processing")
+
+    def __init__(self, collector_rule_vo: CollectorRule):
+        self.collector_rule_id = collector_rule_vo.collector_rule_id
+        self.match = compile_conditions(
+            collector_rule_vo.conditions, collector_rule_vo.conditions_policy
+        )
+        self.actions = collector_rule_vo.actions
+        self.stop_processing = collector_rule_vo.options.stop_processing
+
+
+class CollectorRuleProgram(object):
+    def __init__(self, collector_rule_vos: List[CollectorRule]):
+        self.rules = [
+            CompiledRule(collector_rule_vo) for collector_rule_vo in collector_rule_vos
+        ]
+
+    def apply(self, data: dict, change_fn: ChangeFunction) -> dict:
+        """apply the rules in order to a resource
+
+        Args:
+            data (dict): cloud service data
+            change_fn (function): change_fn(data, actions) returns changed data
+
+        Return:
+            data (dict): changed cloud service data
+        """
+
+        for rule in self.rules:
+            if rule.match(data):
+                data = change_fn(data, rule.actions)
+
+                if rule.stop_processing:
+                    break
+
+        return data
+
+    def apply_many(
+        self, data_list: List[Union[dict, Exception]], change_fn: ChangeFunction
+    ) -> List[Union[dict, Exception]]:
+        """apply the rules in order to the resources, rule by rule
+
+        Args:
+            data_list (list): list of cloud service data,
+                an exception in the list is skipped
+            change_fn (function): change_fn(data, actions) returns changed data
+
+        Return:
+            results (list): changed cloud service data or exception per resource
+        """
+
+        results = list(data_list)
+        active_indexes = [
+            idx for idx, data in enumerate(results) if not isinstance(data, Exception)
+        ]
+
+        for rule in self.rules:
+            if len(active_indexes) == 0:
+                break
+
+            next_indexes = []
+            for idx in active_indexes:
+                try:
+                    if rule.match(results[idx]):
+                        results[idx] = change_fn(results[idx], rule.actions)
+
+                        if rule.stop_processing:
+                            continue
+
+                    next_indexes.append(idx)
+                except Exception as e:
+                    results[idx] = e
+
+            active_indexes = next_indexes
+
+        return results
+
+
+def compile_conditions(
+    conditions: List[CollectorRuleCondition], conditions_policy: str
+) -> Predicate:
+    if conditions_policy == "ALWAYS":
+        return _always
+
+    is_all = conditions_policy == "ALL"
+    predicates = []
+
+    eq_values: Dict[str, List[str]] = {}
+    other_conditions = []
+    for condition in conditions:
+        if condition.operator == "eq":
+            eq_values.setdefault(condition.key, []).append(condition.value)
+        else:
+            other_conditions.append(condition)
+
+    for key, values in eq_values.items():
+        predicates.append(_compile_eq(_make_getter(key), values, is_all))
+
+    # 'not' is cheaper than 'contain' and 'not_contain' which lower the value
+    other_conditions.sort(key=lambda c: 0 if c.operator == "not" else 1)
+    for condition in other_conditions:
+        predicates.append(_compile_condition(condition))
+
+    if len(predicates) == 1:
+        return predicates[0]
+    elif is_all:
+        return functools.partial(_match_all, tuple(predicates))
+    else:
+        return functools.partial(_match_any, tuple(predicates))
+
+
+def _compile_eq(getter: Callable, values: List[str], is_all: bool) -> Predicate:
+    value_set = frozenset(values)
+
+    if len(value_set) == 1:
+        condition_value = values[0]
+
+        def _eq(data: dict) -> bool:
+            value = getter(data)
+            return value is not None and value == condition_value
+
+        return _eq
+
+    elif is_all:
+        # a value can't be equal to all of the different values
+        return _never
+
+    else:
+
+        def _in(data: dict) -> bool:
+            value = getter(data)
+            try:
+                return value is not None and value in value_set
+            except TypeError:
+                # unhashable values (e.g. list) are not equal to any string
+                return False
+
+        return _in
+
+
+def _compile_condition(condition: CollectorRuleCondition) -> Predicate:
+    getter = _make_getter(condition.key)
+    operator = condition.operator
+    condition_value = condition.value
+
+    if operator == "not":
+
+        def _not(data: dict) -> bool:
+            value = getter(data)
+            return value is not None and value != condition_value
+
+        return _not
+
+    elif operator == "contain":
+        lower_value = condition_value.lower()
+
+        def _contain(data: dict) -> bool:
+            value = getter(data)
+            return value is not None and lower_value in value.lower()
+
+        return _contain
+
+    elif operator == "not_contain":
+        lower_value = condition_value.lower()
+
+        def _not_contain(data: dict) -> bool:
+            value = getter(data)
+            return value is not None and lower_value not in value.lower()
+
+        return _not_contain
+
+    return _never
+
+
+def _make_getter(dotted_key: str) -> Callable:
+    keys = tuple(dotted_key.split("."))
+
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda data: data.get(key) if isinstance(data, dict) else None
+    else:
+        return functools.partial(_get_value, keys)
+
+
+def _get_value(keys: tuple, data: any) -> any:
+    # same as utils.get_dict_value() with a pre-split key
+    last_idx = len(keys) - 1
+
+    for idx, key in enumerate(keys):
+        if not isinstance(data, dict):
+            return None
+
+        if idx == last_idx:
+            return data.get(key)
+
+        if key not in data:
+            return None
+
+        data = data[key]
+
+        if isinstance(data, list):
+            rest_keys = keys[idx + 1 :]
+            return [_get_value(rest_keys, value) for value in data]
+
+
+def _match_all(predicates: tuple, data: dict) -> bool:
+    for predicate in predicates:
+        if not predicate(data):
+            return False
+
+    return True
+
+
+def _match_any(predicates: tuple, data: dict) -> bool:
+    for predicate in predicates:
+        if predicate(data):
+            return True
+
+    return False
+
+
+def _always(data: dict) -> bool:
+    return True
+
+
+def _never(data: dict) -> bool:
+    return False
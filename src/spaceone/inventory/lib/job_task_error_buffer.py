@@ -0,0 +1,150 @@
+"""
+In-memory buffer of job task errors
+
+Errors of the resources of a job task are grouped by error code and message
+template (the message with quoted values, ids and numbers masked), instead of
+being pushed to the job task one by one. A group keeps the first message, the
+number of errors and a capped sample of additional data, and all groups are
+written to the job task with a single update when the buffer is flushed.
+Errors can also be kept one by one, to be written as details.
+
+The first error of a group is logged as an error and the others as debug.
+"""
+
+import logging
+import re
+from typing import Dict, List, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+_QUOTED_PATTERN = re.compile(r"'[^']*'|\"[^\"]*\"")
+_WORD_PATTERN = re.compile(r"\b[0-9a-zA-Z]+(?:[-_.:/][0-9a-zA-Z]+)*\b")
+_DIGIT_PATTERN = re.compile(r"\d")
+
+
+class JobTaskErrorGroup(object):
+    __slots__ = ("error_code", "message", "count", "samples")
+
+    def __init__(self, error_code: str, message: str):
+        self.error_code = error_code
+        self.message = message
+        self.count = 0
+        self.samples: List[dict] = []
+
+    def to_error_info(self) -> dict:
+        error_info = {"error_code": self.error_code, "message": self.message}
+
+        if self.count == 1:
+            if self.samples:
+                error_info["additional"] = self.samples[0]
+        else:
+            additional = dict(self.samples[0]) if self.samples else {}
+            additional["error_count"] = self.count
+
+            if len(self.samples) > 1:
+                additional["samples"] = self.samples[1:]
+
+            error_info["additional"] = additional
+
+        return error_info
+
+
+class JobTaskErrorBuffer(object):
+    def __init__(
+        self,
+        job_task_id: str,
+        max_groups: int,
+        max_samples: int,
+        keep_details: bool = False,
+    ):
+        self.job_task_id = job_task_id
+        self.max_groups = max_groups
+        self.max_samples = max_samples
+        self.keep_details = keep_details
+        self.error_count = 0
+        self.details: List[dict] = []
+
+        self._groups: Dict[Tuple[str, str], JobTaskErrorGroup] = {}
+
+    def add(
+        self,
+        error_code: str,
+        error_message: str,
+        additional: dict = None,
+    ) -> None:
+        """add an error of a resource
+
+        Args:
+            error_code (str): e.g. 'ERROR_PLUGIN'
+            error_message (str): error message
+            additional (dict): additional data of the error (e.g. resource_type)
+        """
+
+        message = str(error_message).strip()
+        key = (error_code, make_message_template(message))
+
+        if key not in self._groups and len(self._groups) >= self.max_groups:
+            # errors beyond the max number of groups are grouped by error code
+            key = (error_code, "*")
+
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = JobTaskErrorGroup(error_code, message)
+            _LOGGER.error(
+                f"[add_error] {self.job_task_id}: {error_code} {message} "
+                f"(additional = {additional})"
+            )
+        else:
+            _LOGGER.debug(f"[add_error] {self.job_task_id}: {error_code} {message}")
+
+        group.count += 1
+        self.error_count += 1
+
+        if additional and len(group.samples) < self.max_samples:
+            group.samples.append(additional)
+
+        if self.keep_details:
+            error_info = {"error_code": error_code, "message": message}
+            if additional:
+                error_info["additional"] = additional
+
+            self.details.append(error_info)
+
+    def pop_errors(self) -> List[dict]:
+        """pop the error groups as error info of the job task"""
+
+        errors = [group.to_error_info() for group in self._groups.values()]
+        self._groups = {}
+        self.error_count = 0
+        return errors
+
+    def pop_details(self) -> List[dict]:
+        """pop the errors kept as details"""
+
+        details = self.details
+        self.details = []
+        return details
+
+    def __len__(self) -> int:
+        return self.error_count
+
+
+def make_message_template(message: str) -> str:
+    """mask the values of an error message
+
+    e.g. "Instance 'i-0abc' not found (region = us-east-1)"
+        => "Instance <str> not found (region = <id>)"
+    """
+
+    template = _QUOTED_PATTERN.sub("<str>", message)
+    return _WORD_PATTERN.sub(_mask_word, template)
+
+
+def _mask_word(match: re.Match) -> str:
+    word = match.group(0)
+
+    # only words with digits are regarded as values (ids, numbers, versions...)
+    if _DIGIT_PATTERN.search(word):
+        return "<id>"
+
+    return word
@@ -0,0 +1,190 @@
+"""
+In-memory index of existing resources for collector match rules
+
+The index is built for the resources of a collector scope (e.g. cloud services
+collected with the same collector_id and secret_id) and maps the values of
+match rules to the resource. It is loaded lazily, once per set of match rules,
+and only a unique match is answered from memory. Everything else (no match,
+multiple matches or values that can't be indexed) is reported as a miss,
+so the caller falls back to the database.
+
+The database query of a match rule is not limited to the collector scope, so
+the resources out of the scope with the same values are loaded into the index
+too. A value shared with such a resource is a multiple match, and it's found
+in the database, which raises ERROR_TOO_MANY_MATCH as before.
+"""
+
+import itertools
+import logging
+from typing import Dict, List, Tuple, Union
+
+from spaceone.inventory.lib import rule_matcher
+from spaceone.inventory.lib.resource_manager import ResourceManager
+
+_LOGGER = logging.getLogger(__name__)
+
+_LOAD_CHUNK_SIZE = 1000
+
+
+class MatchRecord(object):
+    __slots__ = ("resource_id",)
+
+    def __init__(self, resource_id: str):
+        self.resource_id = resource_id
+
+
+class MatchIndex(object):
+    def __init__(
+        self,
+        resource_manager: ResourceManager,
+        resource_ids: List[str],
+        domain_id: str,
+        workspace_id: str,
+    ):
+        self.resource_manager = resource_manager
+        self.resource_key = resource_manager.resource_keys[0]
+        self.domain_id = domain_id
+        self.workspace_id = workspace_id
+        self.hit_count = 0
+        self.miss_count = 0
+
+        self._resource_ids = resource_ids
+        self._records: Dict[str, MatchRecord] = {}
+        self._discarded_ids = set()
+        self._indexes: Dict[tuple, dict] = {}
+
+    def find(self, rules: List[str], resource_data: dict) -> Union[List[dict], None]:
+        """find a resource in the index with the match rules of one order
+
+        Args:
+            rules (list): e.g. ['reference.resource_id', 'provider']
+            resource_data (dict): resource data from plugin
+
+        Return:
+            match_resource (list): e.g. [{'cloud_service_id': 'cloud-svc-abcde12345'}]
+                or None, if the resource should be found in the database
+        """
+
+        keys = []
+        values = []
+        for rule in rules:
+            if value := rule_matcher.find_data(resource_data, rule):
+                keys.append(rule)
+                values.append(value)
+
+        if len(keys) == 0 or not all(
+            isinstance(value, (str, int, float)) for value in values
+        ):
+            self.miss_count += 1
+            return None
+
+        record = self._get_index(tuple(keys)).get(tuple(values))
+
+        if (
+            isinstance(record, MatchRecord)
+            and record.resource_id not in self._discarded_ids
+        ):
+            self.hit_count += 1
+            return [{self.resource_key: record.resource_id}]
+
+        self.miss_count += 1
+        return None
+
+    def discard(self, resource_id: str) -> None:
+        # match keys of the resource may have been changed by update
+        self._discarded_ids.add(resource_id)
+
+    def get_stats(self) -> dict:
+        return {
+            "indexed_count": len(self._resource_ids),
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+        }
+
+    def get_summary(self) -> dict:
+        # counters of the job task
+        return {
+            "match_index_hit_count": self.hit_count,
+            "match_index_miss_count": self.miss_count,
+        }
+
+    def _get_index(self, keys: Tuple[str]) -> dict:
+        if keys not in self._indexes:
+            self._indexes[keys] = self._load_index(list(keys))
+
+        return self._indexes[keys]
+
+    def _load_index(self, keys: List[str]) -> dict:
+        """
+        Return:
+            index (dict): {(value of key, ...): MatchRecord or tuple of MatchRecords}
+        """
+
+        index = {}
+
+        for idx in range(0, len(self._resource_ids), _LOAD_CHUNK_SIZE):
+            query = {
+                "filter": [
+                    {"k": "domain_id", "v": self.domain_id, "o": "eq"},
+                    {"k": "workspace_id", "v": self.workspace_id, "o": "eq"},
+                    {
+                        "k": self.resource_key,
+                        "v": self._resource_ids[idx : idx + _LOAD_CHUNK_SIZE],
+                        "o": "in",
+                    },
+                ]
+            }
+
+            self._add_results(index, keys, query)
+
+        # resources out of the scope with the indexed values, same as the match query
+        values_list = list(index.keys())
+        for idx in range(0, len(values_list), _LOAD_CHUNK_SIZE):
+            query = rule_matcher.make_batch_query(
+                keys,
+                values_list[idx : idx + _LOAD_CHUNK_SIZE],
+                self.domain_id,
+                self.workspace_id,
+            )
+
+            self._add_results(index, keys, query)
+
+        _LOGGER.debug(
+            f"[_load_index] load match index: keys = {keys}, count = {len(index)}"
+        )
+
+        return index
+
+    def _add_results(self, index: dict, keys: List[str], query: dict) -> None:
+        results = self.resource_manager.find_resources_by_match_keys(query, keys)
+
+        for resource, key_values in results:
+            record = self._get_record(resource[self.resource_key])
+
+            # array field matches each of its values, same as 'eq' query
+            values_list = []
+            for key in keys:
+                value = key_values[key]
+                values_list.append(value if isinstance(value, list) else [value])
+
+            for values in itertools.product(*values_list):
+                if all(isinstance(value, (str, int, float)) for value in values):
+                    self._add_record(index, values, record)
+
+    @staticmethod
+    def _add_record(index: dict, values: tuple, record: MatchRecord) -> None:
+        matched = index.get(values)
+
+        if matched is None:
+            index[values] = record
+        elif isinstance(matched, MatchRecord):
+            if matched is not record:
+                index[values] = (matched, record)
+        elif record not in matched:
+            index[values] = matched + (record,)
+
+    def _get_record(self, resource_id: str) -> MatchRecord:
+        if resource_id not in self._records:
+            self._records[resource_id] = MatchRecord(resource_id)
+
+        return self._records[resource_id]
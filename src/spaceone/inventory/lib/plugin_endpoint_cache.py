@@ -0,0 +1,170 @@
+"""
+Process-wide cache of plugin endpoints
+
+Endpoints are cached by key (e.g. (plugin_id, version, upgrade_mode, domain_id))
+for a short TTL and shared by all job tasks of the process. Concurrent misses
+of the same key are de-duplicated, so only one of them calls the plugin service
+and the others wait for its result. An entry used after the refresh time is
+refreshed in the background while the cached endpoint is still returned.
+Entries of an endpoint are invalidated, if a plugin call to it fails with a
+connection error.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+EndpointLoader = Callable[[], Tuple[str, str]]
+
+
+class PluginEndpointEntry(object):
+    __slots__ = ("value", "refresh_at", "expires_at")
+
+    def __init__(self, value: Tuple[str, str], now: float, ttl: int, refresh: int):
+        self.value = value
+        self.refresh_at = now + refresh
+        self.expires_at = now + ttl
+
+
+class PluginEndpointFlight(object):
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class PluginEndpointCache(object):
+    def __init__(self, ttl: int, refresh_interval: int):
+        self.ttl = ttl
+        self.refresh_interval = min(refresh_interval, ttl)
+
+        self._entries: Dict[tuple, PluginEndpointEntry] = {}
+        self._flights: Dict[tuple, PluginEndpointFlight] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "hit_count": 0,
+            "miss_count": 0,
+            "wait_count": 0,
+            "refresh_count": 0,
+            "invalidate_count": 0,
+        }
+
+    def get(self, key: tuple, loader: EndpointLoader) -> Tuple[str, str]:
+        """get the endpoint of the key, loading it if needed
+
+        Args:
+            key (tuple): e.g. ('plugin-abcde12345', '1.0', 'AUTO', 'domain-abcde12345')
+            loader (function): loader() returns (endpoint, updated_version)
+
+        Return:
+            endpoint (str)
+            updated_version (str)
+        """
+
+        if self.ttl <= 0:
+            return loader()
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            flight = self._flights.get(key)
+
+            if entry is not None and now < entry.expires_at:
+                self._stats["hit_count"] += 1
+
+                if now >= entry.refresh_at and flight is None:
+                    self._flights[key] = PluginEndpointFlight()
+                    self._stats["refresh_count"] += 1
+                    threading.Thread(
+                        target=self._refresh,
+                        args=(key, loader, self._flights[key]),
+                        daemon=True,
+                    ).start()
+
+                return entry.value
+
+            if flight is None:
+                flight = self._flights[key] = PluginEndpointFlight()
+                is_leader = True
+                self._stats["miss_count"] += 1
+            else:
+                is_leader = False
+                self._stats["wait_count"] += 1
+
+        if not is_leader:
+            flight.event.wait()
+
+            if flight.error is not None:
+                raise flight.error
+
+            return flight.value
+
+        return self._load(key, loader, flight)
+
+    def invalidate(self, endpoint: str) -> None:
+        """invalidate the entries of an endpoint, e.g. after a connection error"""
+
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry.value[0] == endpoint
+            ]
+
+            for key in keys:
+                del self._entries[key]
+
+            self._stats["invalidate_count"] += len(keys)
+
+        if keys:
+            _LOGGER.debug(f"[invalidate] invalidate plugin endpoint: {endpoint}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+
+        return stats
+
+    def _load(
+        self, key: tuple, loader: EndpointLoader, flight: PluginEndpointFlight
+    ) -> Tuple[str, str]:
+        try:
+            value = loader()
+            flight.value = value
+
+            with self._lock:
+                self._entries[key] = PluginEndpointEntry(
+                    value, time.monotonic(), self.ttl, self.refresh_interval
+                )
+
+            return value
+
+        except Exception as e:
+            flight.error = e
+            raise e
+
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+            flight.event.set()
+
+    def _refresh(
+        self, key: tuple, loader: EndpointLoader, flight: PluginEndpointFlight
+    ) -> None:
+        try:
+            self._load(key, loader, flight)
+        except Exception as e:
+            # the cached endpoint is used until it expires
+            _LOGGER.warning(f"[_refresh] failed to refresh plugin endpoint: {key} {e}")
@@ -0,0 +1,175 @@
+"""
+Process-wide cache of reference names (e.g. project names)
+
+Names are cached by key (e.g. ('identity.Project', domain_id)) and shared by
+all exports and reports of the process. An entry is fully reloaded after
+the TTL and refreshed in between with the resources updated since the last
+load or refresh. The least recently used entry is evicted, if the number of
+entries exceeds the max size.
+
+The names of an entry are never modified in place. They are replaced with
+a new dict, so the names returned to a caller don't change while it uses them.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Union
+
+_LOGGER = logging.getLogger(__name__)
+
+# Resources updated a little before the last refresh are loaded again for clock skew
+_REFRESH_MARGIN = timedelta(minutes=1)
+
+NameLoader = Callable[[Union[datetime, None]], Dict[str, str]]
+
+
+class ReferenceCacheEntry(object):
+    __slots__ = ("names", "loaded_at", "refreshed_at", "synced_at")
+
+    def __init__(self, names: Dict[str, str], now: float, synced_at: datetime):
+        self.names = names
+        self.loaded_at = now
+        self.refreshed_at = now
+        self.synced_at = synced_at
+
+
+class ReferenceCache(object):
+    def __init__(self, max_size: int, ttl: int, refresh_interval: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+
+        self._entries: Dict[tuple, ReferenceCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hit_count": 0,
+            "miss_count": 0,
+            "refresh_count": 0,
+            "refresh_error_count": 0,
+            "load_time": 0.0,
+            "refresh_time": 0.0,
+            "max_load_time": 0.0,
+            "max_refresh_time": 0.0,
+        }
+
+    def get_names(self, key: tuple, loader: NameLoader) -> Dict[str, str]:
+        """get names of the key, loading or refreshing them if needed
+
+        Args:
+            key (tuple): e.g. ('identity.Project', 'domain-abcde12345')
+            loader (function): loader(updated_since) returns {resource_id: name}.
+                updated_since is None for a full load.
+
+        Return:
+            names (dict): {resource_id: name}, it should not be modified
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None or now - entry.loaded_at >= self.ttl:
+            entry = self._load(key, loader)
+
+        elif now - entry.refreshed_at >= self.refresh_interval:
+            entry = self._refresh(key, entry, loader)
+
+        else:
+            self._increase_stat("hit_count")
+
+        return entry.names
+
+    def add_names(self, key: tuple, names: Dict[str, str]) -> None:
+        """add names found after the load"""
+
+        if not names:
+            return
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.names = {**entry.names, **names}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+
+        return stats
+
+    def _load(self, key: tuple, loader: NameLoader) -> ReferenceCacheEntry:
+        started_at = time.monotonic()
+        synced_at = datetime.utcnow()
+
+        names = loader(None)
+
+        load_time = time.monotonic() - started_at
+        entry = ReferenceCacheEntry(names, time.monotonic(), synced_at)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+            self._stats["miss_count"] += 1
+            self._stats["load_time"] += load_time
+            self._stats["max_load_time"] = max(self._stats["max_load_time"], load_time)
+
+        _LOGGER.debug(
+            f"[_load] load reference names: {key} (count = {len(names)}, "
+            f"time = {load_time:.3f}s)"
+        )
+
+        return entry
+
+    def _refresh(
+        self, key: tuple, entry: ReferenceCacheEntry, loader: NameLoader
+    ) -> ReferenceCacheEntry:
+        started_at = time.monotonic()
+        synced_at = datetime.utcnow()
+
+        try:
+            names = loader(entry.synced_at - _REFRESH_MARGIN)
+        except Exception as e:
+            _LOGGER.warning(f"[_refresh] failed to refresh reference names: {key} {e}")
+            self._increase_stat("refresh_error_count")
+            return self._load(key, loader)
+
+        refresh_time = time.monotonic() - started_at
+
+        with self._lock:
+            if names:
+                entry.names = {**entry.names, **names}
+
+            entry.refreshed_at = time.monotonic()
+            entry.synced_at = synced_at
+
+            self._stats["hit_count"] += 1
+            self._stats["refresh_count"] += 1
+            self._stats["refresh_time"] += refresh_time
+            self._stats["max_refresh_time"] = max(
+                self._stats["max_refresh_time"], refresh_time
+            )
+
+        _LOGGER.debug(
+            f"[_refresh] refresh reference names: {key} (count = {len(names)}, "
+            f"time = {refresh_time:.3f}s)"
+        )
+
+        return entry
+
+    def _increase_stat(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
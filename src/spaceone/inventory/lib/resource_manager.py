@@ -1,5 +1,6 @@
-from typing import Tuple
+from typing import Tuple, List
 from spaceone.core.error import *
+from spaceone.inventory.lib import rule_matcher
 
 
 class ResourceManager(object):
@@ -26,6 +27,25 @@ class ResourceManager(object):
 
         return resources, total_count
 
+    def find_resources_by_match_keys(
+        self, query: dict, match_keys: List[str]
+    ) -> List[Tuple[dict, dict]]:
+        """
+        Returns:
+            results (list): [(resource, {match_key: value, ...}), ...]
+        """
+
+        self._check_resource_finder_state()
+        query["only"] = self.resource_keys + match_keys
+
+        results = []
+        vos, total_count = getattr(self, self.query_method)(query)
+
+        for vo in vos:
+            results.append(self._make_match_key_result(vo, match_keys))
+
+        return results
+
     def delete_resources(self, query: dict) -> int:
         self._check_resource_finder_state()
         query["only"] = self.resource_keys + ["updated_at"]
@@ -35,6 +55,18 @@ class ResourceManager(object):
 
         return total_count
 
+    def _make_match_key_result(self, vo, match_keys: List[str]) -> Tuple[dict, dict]:
+        vo_data = vo.to_dict()
+        resource = {}
+        for key in self.resource_keys:
+            resource[key] = getattr(vo, key)
+
+        key_values = {}
+        for key in match_keys:
+            key_values[key] = rule_matcher.find_data(vo_data, key)
+
+        return resource, key_values
+
     def _check_resource_finder_state(self) -> None:
         if not (self.resource_keys and self.query_method):
             raise ERROR_UNKNOWN(message="ResourceManager is not set.")
@@ -49,3 +49,29 @@ def make_query(
     return {
         "filter": _filter,
     }
+
+
+def make_batch_query(
+    rules: list, values_list: list, domain_id: str, workspace_id: str
+) -> dict:
+    """
+    make a query to find resources of several resources at once
+    :param rules: e.g. ['reference.resource_id', 'provider']
+    :param values_list: e.g. [('i-1234', 'aws'), ('i-5678', 'aws')]
+    :return: query with 'eq' for a common value, otherwise 'in'
+    """
+    _filter = [
+        {"k": "domain_id", "v": domain_id, "o": "eq"},
+        {"k": "workspace_id", "v": workspace_id, "o": "eq"},
+    ]
+
+    for idx, rule in enumerate(rules):
+        values = list(dict.fromkeys([values[idx] for values in values_list]))
+        if len(values) == 1:
+            _filter.append({"k": rule, "v": values[0], "o": "eq"})
+        else:
+            _filter.append({"k": rule, "v": values, "o": "in"})
+
+    return {
+        "filter": _filter,
+    }
@@ -0,0 +1,211 @@
+"""
+Change tracker of cloud service types for incremental stats
+
+Writes of cloud services (collection, cleanup and user requests) mark the
+changed (domain_id, workspace_id, provider, cloud_service_group,
+cloud_service_type) keys with the time of the change in the cache. A key is
+also marked with the workspace '*', which is the workspace of the query sets
+of the domain resource group. When a query set is run, its start time is kept
+in the cache, so a query set whose cloud service type is not changed since the
+last run can reuse the stats of the last run.
+
+All marks are kept in the cache with an expiration. Marks are only trusted
+for the runs after the tracking is started in a domain, so if the cache is
+flushed or marks are expired, query sets are run again as if they were changed.
+Marks of a key are throttled in a process, so changes are compared with a margin.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Tuple, Union
+
+from spaceone.core import cache, config
+
+__all__ = [
+    "is_enabled",
+    "mark_changed",
+    "get_changed_at",
+    "get_last_run",
+    "set_last_run",
+    "start_tracking",
+    "is_tracked",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+_EXPIRE_TIME = 86400 * 7  # 7 days
+_CHANGE_MARGIN = timedelta(hours=1)
+_MARK_INTERVAL = 60  # seconds
+
+# (domain_id, workspace_id, provider, cloud_service_group, cloud_service_type)
+TypeKey = Tuple[str, str, str, str, str]
+
+_MARKED_AT: Dict[TypeKey, float] = {}
+_LOCK = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return config.get_global("STATS_INCREMENTAL", False) and cache.is_set()
+
+
+def mark_changed(type_keys: Iterable[TypeKey]) -> None:
+    """mark the cloud service types as changed
+
+    Args:
+        type_keys (list): e.g. [('domain-abcde12345', 'workspace-abcde12345',
+            'aws', 'EC2', 'Instance')]
+    """
+
+    if not is_enabled():
+        return
+
+    now = time.monotonic()
+    keys_to_mark = set()
+
+    with _LOCK:
+        for type_key in type_keys:
+            if None in type_key[2:]:
+                continue
+
+            for key in [type_key, (type_key[0], "*", *type_key[2:])]:
+                if now - _MARKED_AT.get(key, -_MARK_INTERVAL) >= _MARK_INTERVAL:
+                    _MARKED_AT[key] = now
+                    keys_to_mark.add(key)
+
+    if not keys_to_mark:
+        return
+
+    changed_at = datetime.utcnow().isoformat()
+
+    try:
+        for key in keys_to_mark:
+            cache.set(_make_change_key(*key), changed_at, expire=_EXPIRE_TIME)
+    except Exception as e:
+        # the tracking is stopped, so query sets of the domains are run again
+        _LOGGER.warning(f"[mark_changed] failed to mark changes: {e}")
+        for domain_id in {key[0] for key in keys_to_mark}:
+            _delete(_make_tracking_key(domain_id))
+
+        with _LOCK:
+            for key in keys_to_mark:
+                _MARKED_AT.pop(key, None)
+
+
+def get_changed_at(
+    domain_id: str,
+    workspace_id: str,
+    provider: str,
+    cloud_service_group: str,
+    cloud_service_type: str,
+) -> Union[datetime, None]:
+    return _get_datetime(
+        _make_change_key(
+            domain_id,
+            workspace_id,
+            provider,
+            cloud_service_group,
+            cloud_service_type,
+        )
+    )
+
+
+def get_last_run(domain_id: str, query_set_id: str) -> Union[datetime, None]:
+    return _get_datetime(_make_last_run_key(domain_id, query_set_id))
+
+
+def set_last_run(domain_id: str, query_set_id: str, started_at: datetime) -> None:
+    if not is_enabled():
+        return
+
+    _set_datetime(_make_last_run_key(domain_id, query_set_id), started_at)
+
+
+def start_tracking(domain_id: str, started_at: datetime) -> datetime:
+    """start (or extend) the tracking of a domain
+
+    Args:
+        domain_id (str): domain_id
+        started_at (datetime): start time of the tracking, if it's not started yet
+
+    Return:
+        tracked_since (datetime): start time of the tracking
+    """
+
+    tracking_key = _make_tracking_key(domain_id)
+    tracked_since = _get_datetime(tracking_key) or started_at
+    _set_datetime(tracking_key, tracked_since)
+    return tracked_since
+
+
+def is_tracked(
+    tracked_since: Union[datetime, None],
+    last_run: Union[datetime, None],
+    changed_at: Union[datetime, None],
+) -> bool:
+    """check if all changes since the last run are tracked and none of them is found
+
+    Args:
+        tracked_since (datetime): start time of the tracking of the domain
+        last_run (datetime): start time of the last run of the query set
+        changed_at (datetime): last change of the cloud service type
+    """
+
+    if tracked_since is None or last_run is None:
+        return False
+
+    if tracked_since > last_run:
+        return False
+
+    since = last_run - _CHANGE_MARGIN
+
+    if since < datetime.utcnow() - timedelta(seconds=_EXPIRE_TIME):
+        return False
+
+    return changed_at is None or changed_at < since
+
+
+def _get_datetime(key: str) -> Union[datetime, None]:
+    try:
+        if value := cache.get(key):
+            return datetime.fromisoformat(value)
+    except Exception as e:
+        _LOGGER.warning(f"[_get_datetime] {key}: {e}")
+
+    return None
+
+
+def _set_datetime(key: str, value: datetime) -> None:
+    try:
+        cache.set(key, value.isoformat(), expire=_EXPIRE_TIME)
+    except Exception as e:
+        _LOGGER.warning(f"[_set_datetime] {key}: {e}")
+
+
+def _delete(key: str) -> None:
+    try:
+        cache.delete(key)
+    except Exception as e:
+        _LOGGER.warning(f"[_delete] {key}: {e}")
+
+
+def _make_change_key(
+    domain_id: str,
+    workspace_id: str,
+    provider: str,
+    cloud_service_group: str,
+    cloud_service_type: str,
+) -> str:
+    return (
+        f"inventory:stats-change:{domain_id}:{workspace_id}:"
+        f"{provider}:{cloud_service_group}:{cloud_service_type}"
+    )
+
+
+def _make_last_run_key(domain_id: str, query_set_id: str) -> str:
+    return f"inventory:stats-last-run:{domain_id}:{query_set_id}"
+
+
+def _make_tracking_key(domain_id: str) -> str:
+    return f"inventory:stats-tracking:{domain_id}"
@@ -0,0 +1,165 @@
+"""
+Prefetcher of a response stream
+
+A reader thread drains the stream (e.g. the response stream of a plugin) into a
+bounded queue while the caller consumes it, so reading the stream and writing
+its data are overlapped. When the queue is full the reader waits for the caller
+(backpressure), and when it's empty the caller waits for the reader.
+Items are returned in the same order as the stream, and an error of the stream
+is raised to the caller after the items read before it.
+
+When the caller stops consuming, the call of the stream given by the caller
+(e.g. the gRPC call of a plugin) is cancelled, so the reader blocked in the
+stream doesn't keep the call open.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Iterable, Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+_PUT_TIMEOUT = 1
+
+
+class _StreamEnd(object):
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+
+
+class StreamPrefetcher(object):
+    def __init__(
+        self, stream: Iterable, max_size: int, name: str = "stream", call: any = None
+    ):
+        self.name = name
+
+        self._stream = stream
+        self._call = call
+        self._queue = queue.Queue(maxsize=max_size)
+        self._stopped = threading.Event()
+        self._thread = None
+        self._stats = {
+            "read_count": 0,
+            "read_time": 0.0,
+            "reader_wait_time": 0.0,
+            "consume_time": 0.0,
+            "consumer_wait_time": 0.0,
+            "max_queue_size": 0,
+        }
+
+    def __iter__(self) -> Iterator:
+        self._thread = threading.Thread(
+            target=self._read, name=f"{self.name}-reader", daemon=True
+        )
+        self._thread.start()
+
+        try:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    started_at = time.monotonic()
+                    item = self._queue.get()
+                    self._stats["consumer_wait_time"] += time.monotonic() - started_at
+
+                if isinstance(item, _StreamEnd):
+                    if item.error is not None:
+                        raise item.error
+
+                    break
+
+                started_at = time.monotonic()
+                yield item
+                self._stats["consume_time"] += time.monotonic() - started_at
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+        if self._thread is not None and self._thread.is_alive():
+            self._cancel_stream()
+
+    def get_stats(self) -> dict:
+        stats = dict(self._stats)
+        read_count = stats["read_count"]
+
+        # throughput of each stage, excluding the time waiting for the other
+        if stats["read_time"] > 0:
+            stats["read_per_second"] = round(read_count / stats["read_time"], 1)
+
+        if stats["consume_time"] > 0:
+            stats["consume_per_second"] = round(read_count / stats["consume_time"], 1)
+
+        for key in [
+            "read_time",
+            "reader_wait_time",
+            "consume_time",
+            "consumer_wait_time",
+        ]:
+            stats[key] = round(stats[key], 3)
+
+        return stats
+
+    def _cancel_stream(self) -> None:
+        try:
+            if self._call is not None:
+                self._call.cancel()
+            elif hasattr(self._stream, "close"):
+                self._stream.close()
+        except Exception as e:
+            # e.g. a generator can't be closed while the reader runs it
+            _LOGGER.debug(f"[_cancel_stream] {self.name} stream is not cancelled: {e}")
+
+    def _read(self) -> None:
+        end = _StreamEnd()
+        iterator = iter(self._stream)
+
+        try:
+            while not self._stopped.is_set():
+                started_at = time.monotonic()
+
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+
+                self._stats["read_time"] += time.monotonic() - started_at
+                self._stats["read_count"] += 1
+
+                if not self._put(item):
+                    return
+
+        except Exception as e:
+            end.error = e
+
+        self._put(end)
+
+    def _put(self, item: any) -> bool:
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            started_at = time.monotonic()
+
+            # wait for the consumer, unless it stops consuming
+            while not self._stopped.is_set():
+                try:
+                    self._queue.put(item, timeout=_PUT_TIMEOUT)
+                    break
+                except queue.Full:
+                    pass
+
+            self._stats["reader_wait_time"] += time.monotonic() - started_at
+
+            if self._stopped.is_set():
+                _LOGGER.debug(f"[_put] {self.name} reader is stopped by consumer")
+                return False
+
+        self._stats["max_queue_size"] = max(
+            self._stats["max_queue_size"], self._queue.qsize()
+        )
+        return True
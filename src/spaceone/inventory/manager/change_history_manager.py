@@ -1,5 +1,5 @@
 import logging
-from typing import Union
+from typing import Union, List, Tuple
 from operator import itemgetter
 from spaceone.core.manager import BaseManager
 from spaceone.core import utils
@@ -58,6 +58,27 @@ class ChangeHistoryManager(BaseManager):
         if len(set(new_keys) & set(DIFF_KEYS)) > 0:
             self._create_record(cloud_service_vo, new_data, old_data)
 
+    def add_new_histories(self, histories: List[Tuple[CloudService, dict]]) -> None:
+        records = []
+        for cloud_service_vo, new_data in histories:
+            if record_params := self._make_record_params(cloud_service_vo, new_data):
+                records.append(record_params)
+
+        self._create_records(records)
+
+    def add_update_histories(
+        self, histories: List[Tuple[CloudService, dict, dict]]
+    ) -> None:
+        records = []
+        for cloud_service_vo, new_data, old_data in histories:
+            if len(set(new_data.keys()) & set(DIFF_KEYS)) > 0:
+                if record_params := self._make_record_params(
+                    cloud_service_vo, new_data, old_data
+                ):
+                    records.append(record_params)
+
+        self._create_records(records)
+
     def add_delete_history(self, cloud_service_vo: CloudService) -> None:
         params = {
             "cloud_service_id": cloud_service_vo.cloud_service_id,
@@ -70,6 +91,21 @@ class ChangeHistoryManager(BaseManager):
     def _create_record(
         self, cloud_service_vo: CloudService, new_data: dict, old_data: dict = None
     ) -> None:
+        if params := self._make_record_params(cloud_service_vo, new_data, old_data):
+            self.record_mgr.create_record(params)
+
+    def _create_records(self, records: List[dict]) -> None:
+        if len(records) > 0:
+            results = self.record_mgr.create_records(records)
+            for result in results:
+                if isinstance(result, Exception):
+                    _LOGGER.error(
+                        f"[_create_records] failed to create record: {result}"
+                    )
+
+    def _make_record_params(
+        self, cloud_service_vo: CloudService, new_data: dict, old_data: dict = None
+    ) -> Union[dict, None]:
         if old_data:
             action = "UPDATE"
         else:
@@ -97,10 +133,13 @@ class ChangeHistoryManager(BaseManager):
             else:
                 params["user_id"] = self.user_id
 
-            self.record_mgr.create_record(params)
+            return params
+
+        return None
 
     def _make_diff(self, new_data: dict, old_data: dict, exclude_keys: list) -> list:
         diff = []
+
         for key in DIFF_KEYS:
             if key in new_data:
                 if old_data:
@@ -108,57 +147,49 @@ class ChangeHistoryManager(BaseManager):
                 else:
                     old_value = None
 
-                diff += self._get_diff_data(key, new_data[key], old_value, exclude_keys)
+                self._get_diff_data(diff, key, new_data[key], old_value, exclude_keys)
 
         return diff
 
     def _get_diff_data(
         self,
+        diff: list,
         key: str,
         new_value: any,
         old_value: any,
         exclude_keys: list,
         depth: int = 1,
         parent_key: str = None,
-    ) -> list:
-        diff = []
+    ) -> None:
+        # Identical values have no difference in any of their sub keys
+        if new_value == old_value:
+            return
 
-        if depth == MAX_KEY_DEPTH:
-            if new_value != old_value:
-                diff_data = self._generate_diff_data(
-                    key, parent_key, new_value, old_value, exclude_keys
-                )
-                if diff_data:
-                    diff.append(diff_data)
-        elif isinstance(new_value, dict):
+        if depth < MAX_KEY_DEPTH and isinstance(new_value, dict):
             if parent_key:
                 parent_key = f"{parent_key}.{key}"
             else:
                 parent_key = key
 
-            for sub_key, sub_value in new_value.items():
-                if isinstance(old_value, dict):
-                    sub_old_value = old_value.get(sub_key)
-                else:
-                    sub_old_value = None
+            if not isinstance(old_value, dict):
+                old_value = {}
 
-                diff += self._get_diff_data(
+            for sub_key, sub_value in new_value.items():
+                self._get_diff_data(
+                    diff,
                     sub_key,
                     sub_value,
-                    sub_old_value,
+                    old_value.get(sub_key),
                     exclude_keys,
                     depth + 1,
                     parent_key,
                 )
         else:
-            if new_value != old_value:
-                diff_data = self._generate_diff_data(
-                    key, parent_key, new_value, old_value, exclude_keys
-                )
-                if diff_data:
-                    diff.append(diff_data)
-
-        return diff
+            diff_data = self._generate_diff_data(
+                key, parent_key, new_value, old_value, exclude_keys
+            )
+            if diff_data:
+                diff.append(diff_data)
 
     def _generate_diff_data(
         self,
@@ -168,6 +199,11 @@ class ChangeHistoryManager(BaseManager):
         old_value: any,
         exclude_keys: list,
     ) -> Union[dict, None]:
+        diff_key = key if parent_key is None else f"{parent_key}.{key}"
+
+        if diff_key in exclude_keys:
+            return None
+
         if old_value is None:
             diff_type = "ADDED"
         else:
@@ -175,11 +211,8 @@ class ChangeHistoryManager(BaseManager):
 
         before = self._change_diff_value(old_value)
         after = self._change_diff_value(new_value)
-        diff_key = key if parent_key is None else f"{parent_key}.{key}"
 
-        if diff_key in exclude_keys:
-            return None
-        elif before == after:
+        if before == after:
             return None
         else:
             return {
@@ -190,6 +223,7 @@ class ChangeHistoryManager(BaseManager):
             }
 
     def _change_diff_value(self, value: any) -> any:
+        # Values are sorted into new objects, so that the data is not changed
         if isinstance(value, dict):
             return utils.dump_json(self._sort_dict_value(value))
         elif isinstance(value, list):
@@ -200,21 +234,26 @@ class ChangeHistoryManager(BaseManager):
             return str(value)
 
     def _sort_dict_value(self, value: dict) -> dict:
+        if not isinstance(value, dict):
+            return value
+
+        items = list(value.items())
+
         try:
-            for k, v in value.items():
+            for idx, (k, v) in enumerate(items):
                 if isinstance(v, dict):
-                    value[k] = self._sort_dict_value(v)
+                    items[idx] = (k, self._sort_dict_value(v))
                 elif isinstance(v, list):
-                    value[k] = self._sort_list_values(v)
+                    items[idx] = (k, self._sort_list_values(v))
 
-            return dict(sorted(value.items()))
+            return dict(sorted(items))
         except Exception as e:
             # _LOGGER.warning(
             #     f"[_sort_dict_value] dict value sort error: {e}", exc_info=True
             # )
             pass
 
-        return value
+        return dict(items)
 
     def _sort_list_values(self, values: list) -> list:
         if len(values) > 0:
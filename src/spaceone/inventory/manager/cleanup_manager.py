@@ -1,15 +1,25 @@
 import logging
-from typing import Tuple
+from typing import Generator, List, Tuple
 from datetime import datetime, timedelta
 
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
+from spaceone.core.model.mongo_model import QuerySet
+from spaceone.inventory.lib.chunked_sweeper import ChunkedSweeper
 from spaceone.inventory.manager.collection_state_manager import CollectionStateManager
 from spaceone.inventory.manager.cloud_service_manager import CloudServiceManager
+from spaceone.inventory.manager.record_manager import RecordManager
+from spaceone.inventory.manager.note_manager import NoteManager
 from spaceone.inventory.conf.collector_conf import *
 
 _LOGGER = logging.getLogger(__name__)
 
+_GC_FILTER_METHODS = {
+    "inventory.CloudService": "filter_cloud_services",
+    "inventory.CloudServiceType": "filter_cloud_service_types",
+    "inventory.Region": "filter_regions",
+}
+
 
 class CleanupManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -33,84 +43,187 @@ class CleanupManager(BaseManager):
             "deleted_count": deleted_count,
         }
 
-    def delete_resources_by_policy(self, resource_type, hour, domain_id):
+    def delete_resources_by_policy(
+        self, resource_type: str, hour: int, domain_id: str, dry_run: bool = False
+    ) -> int:
         updated_at = datetime.utcnow() - timedelta(hours=hour)
-        query = {
-            "filter": [
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "updated_at", "v": updated_at, "o": "lt"},
-            ]
-        }
-
-        if resource_type in ["inventory.CloudServiceType", "inventory.Region"]:
-            query["filter"].append({"k": "updated_by", "v": "manual", "o": "not"})
 
-        if resource_type not in RESOURCE_MAP:
+        if resource_type not in _GC_FILTER_METHODS:
             _LOGGER.error(f"[delete_resources_by_policy] not found {resource_type}")
             return 0
 
         resource_manager = self.locator.get_manager(RESOURCE_MAP[resource_type][1])
+        conditions = {"domain_id": domain_id, "updated_at__lt": updated_at}
 
-        try:
-            deleted_count = resource_manager.delete_resources(query)
-            if deleted_count > 0:
-                _LOGGER.debug(
-                    f"[delete_resources_by_policy] {deleted_count} in {domain_id}"
+        if resource_type == "inventory.CloudService":
+            # cloud services are soft-deleted, along COMPOUND_INDEX_FOR_GC_2
+            conditions["state"] = ["ACTIVE", "DISCONNECTED"]
+            fields = ["cloud_service_id"]
+
+            def _delete(documents: List[dict]) -> int:
+                return resource_manager.delete_resources_by_ids(
+                    [document["cloud_service_id"] for document in documents],
+                    domain_id,
                 )
 
-            return deleted_count
+        else:
+            conditions["updated_by__ne"] = "manual"
+            fields = []
+
+            def _delete(documents: List[dict]) -> int:
+                return queryset.filter(
+                    pk__in=[document["_id"] for document in documents]
+                ).delete()
+
+        queryset = getattr(resource_manager, _GC_FILTER_METHODS[resource_type])(
+            **conditions
+        )
 
+        try:
+            sweep_info = self._make_sweeper(
+                "delete_resources", resource_type, domain_id
+            ).sweep(queryset, "updated_at", _delete, fields, dry_run)
         except Exception as e:
             _LOGGER.error(f"[delete_resources] {e}", exc_info=True)
             return 0
 
+        self._log_sweep_info(
+            "delete_resources_by_policy", resource_type, domain_id, sweep_info
+        )
+        return sweep_info["swept_count"]
+
+    def terminate_cloud_services(
+        self, termination_time: int, domain_id: str, dry_run: bool = False
+    ) -> int:
+        cloud_svc_mgr: CloudServiceManager = self.locator.get_manager(
+            CloudServiceManager
+        )
+        record_mgr: RecordManager = self.locator.get_manager(RecordManager)
+        note_mgr: NoteManager = self.locator.get_manager(NoteManager)
+
+        # deleted cloud services are terminated along COMPOUND_INDEX_FOR_GC_3
+        queryset = cloud_svc_mgr.filter_cloud_services(
+            domain_id=domain_id,
+            state="DELETED",
+            deleted_at__lt=datetime.utcnow() - timedelta(days=termination_time),
+        )
+
+        def _terminate(documents: List[dict]) -> int:
+            cloud_service_ids = [document["cloud_service_id"] for document in documents]
+
+            # Cascade Delete Records and Notes
+            record_mgr.filter_records(
+                cloud_service_id=cloud_service_ids, domain_id=domain_id
+            ).delete()
+            note_mgr.filter_notes(
+                cloud_service_id=cloud_service_ids, domain_id=domain_id
+            ).delete()
+
+            return queryset.filter(
+                pk__in=[document["_id"] for document in documents]
+            ).delete()
+
+        sweep_info = self._make_sweeper(
+            "terminate_resources", "inventory.CloudService", domain_id
+        ).sweep(queryset, "deleted_at", _terminate, ["cloud_service_id"], dry_run)
+
+        self._log_sweep_info(
+            "terminate_cloud_services", "inventory.CloudService", domain_id, sweep_info
+        )
+        return sweep_info["swept_count"]
+
+    @staticmethod
+    def _make_sweeper(name: str, resource_type: str, domain_id: str) -> ChunkedSweeper:
+        return ChunkedSweeper(
+            f"{name}:{resource_type}:{domain_id}",
+            CLEANUP_CHUNK_SIZE,
+            config.get_global("CLEANUP_TIME_BUDGET", 600),
+        )
+
+    @staticmethod
+    def _log_sweep_info(
+        method: str, resource_type: str, domain_id: str, sweep_info: dict
+    ) -> None:
+        if sweep_info["swept_count"] > 0 or sweep_info["remained_count"] > 0:
+            log = _LOGGER.info if sweep_info["dry_run"] else _LOGGER.debug
+            log(
+                f"[{method}] {resource_type} ({domain_id}): "
+                f"swept = {sweep_info['swept_count']}, "
+                f"remained = {sweep_info['remained_count']}, "
+                f"throughput = {sweep_info['throughput']}/s, "
+                f"elapsed = {sweep_info['elapsed_time']}s, "
+                f"completed = {sweep_info['is_completed']}, "
+                f"dry_run = {sweep_info['dry_run']}"
+            )
+
     def _delete_resources_by_collector(
         self, state_mgr: CollectionStateManager, collector_id: str, domain_id: str
     ) -> int:
         disconnected_count = config.get_global(
             "DEFAULT_DISCONNECTED_STATE_DELETE_POLICY", 3
         )
+        cloud_svc_mgr: CloudServiceManager = self.locator.get_manager(
+            CloudServiceManager
+        )
 
-        query = {
-            "filter": [
-                {"k": "collector_id", "v": collector_id, "o": "eq"},
-                {"k": "disconnected_count", "v": disconnected_count, "o": "gte"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-            ],
-            "only": ["cloud_service_id"],
-        }
-
-        state_vos, total_count = state_mgr.list_collection_states(query)
+        # states are read with a cursor and deleted chunk by chunk
+        state_vos = (
+            state_mgr.filter_collection_states(
+                collector_id=collector_id,
+                disconnected_count__gte=disconnected_count,
+                domain_id=domain_id,
+            )
+            .only("cloud_service_id")
+            .no_cache()
+            .batch_size(CLEANUP_CHUNK_SIZE)
+        )
 
-        cloud_service_ids = [state_vo.cloud_service_id for state_vo in state_vos]
         total_deleted_count = 0
+        total_state_count = 0
 
-        if len(cloud_service_ids) > 0:
-            cloud_svc_mgr: CloudServiceManager = self.locator.get_manager(
-                CloudServiceManager
-            )
-
-            query = {
-                "filter": [
-                    {"k": "cloud_service_id", "v": cloud_service_ids, "o": "in"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ]
-            }
+        for cloud_service_ids in self._iter_cloud_service_id_chunks(state_vos):
+            total_state_count += len(cloud_service_ids)
 
             try:
-                deleted_count = cloud_svc_mgr.delete_resources(query)
-                _LOGGER.debug(
-                    f"[_delete_resources_by_collector] delete cloud service {deleted_count} in {domain_id}"
+                total_deleted_count += cloud_svc_mgr.delete_resources_by_ids(
+                    cloud_service_ids, domain_id
                 )
-                total_deleted_count = deleted_count
             except Exception as e:
                 _LOGGER.error(
                     f"[_delete_resources_by_collector] delete cloud service error: {e}",
                     exc_info=True,
                 )
+                continue
+
+            _LOGGER.debug(
+                f"[_delete_resources_by_collector] delete cloud service in progress "
+                f"({collector_id}): deleted = {total_deleted_count}, "
+                f"checked = {total_state_count}"
+            )
+
+        if total_deleted_count > 0:
+            _LOGGER.debug(
+                f"[_delete_resources_by_collector] delete cloud service {total_deleted_count} in {domain_id}"
+            )
 
         return total_deleted_count
 
+    @staticmethod
+    def _iter_cloud_service_id_chunks(
+        state_vos: QuerySet,
+    ) -> Generator[List[str], None, None]:
+        cloud_service_ids = set()
+
+        for state_vo in state_vos:
+            cloud_service_ids.add(state_vo.cloud_service_id)
+
+            if len(cloud_service_ids) >= CLEANUP_CHUNK_SIZE:
+                yield list(cloud_service_ids)
+                cloud_service_ids = set()
+
+        if len(cloud_service_ids) > 0:
+            yield list(cloud_service_ids)
+
     @staticmethod
     def _increment_disconnected_count_by_collector(
         state_mgr: CollectionStateManager,
@@ -1,8 +1,9 @@
 import logging
 import copy
+import itertools
 import math
 import pytz
-from typing import Tuple, List
+from typing import Iterator, Tuple, List, Union
 from datetime import datetime
 
 from spaceone.core.model.mongo_model import QuerySet
@@ -10,6 +11,7 @@ from spaceone.core.manager import BaseManager
 from spaceone.core import utils
 from spaceone.inventory.model.cloud_service_model import CloudService
 from spaceone.inventory.lib.resource_manager import ResourceManager
+from spaceone.inventory.lib import bulk_writer, stats_change_tracker
 from spaceone.inventory.manager.collection_state_manager import CollectionStateManager
 from spaceone.inventory.manager.reference_manager import ReferenceManager
 from spaceone.inventory.manager.identity_manager import IdentityManager
@@ -30,6 +32,13 @@ MERGE_KEYS = [
     "data",
 ]
 
+CONTENT_HASH_KEYS = MERGE_KEYS + [
+    "cloud_service_group",
+    "cloud_service_type",
+    "tags",
+    "metadata",
+]
+
 SIZE_MAP = {
     "KB": 1024,
     "MB": 1024 * 1024,
@@ -45,6 +54,17 @@ PAGE_LIMIT_VALUES = [
     "CSPM"
 ]
 
+EXPORT_BATCH_SIZE = 1000
+
+# Keys of the changes tracked for incremental stats
+_TYPE_KEYS = [
+    "domain_id",
+    "workspace_id",
+    "provider",
+    "cloud_service_group",
+    "cloud_service_type",
+]
+
 
 class CloudServiceManager(BaseManager, ResourceManager):
     resource_keys = ["cloud_service_id"]
@@ -64,6 +84,8 @@ class CloudServiceManager(BaseManager, ResourceManager):
         cloud_svc_vo: CloudService = self.cloud_svc_model.create(params)
         self.transaction.add_rollback(_rollback, cloud_svc_vo)
 
+        self._mark_changed_types([cloud_svc_vo])
+
         return cloud_svc_vo
 
     def update_cloud_service_by_vo(
@@ -74,13 +96,95 @@ class CloudServiceManager(BaseManager, ResourceManager):
             cloud_svc_vo.update(old_data)
 
         self.transaction.add_rollback(_rollback, cloud_svc_vo.to_dict())
+        old_type_key = self._make_type_key(cloud_svc_vo)
         cloud_svc_vo: CloudService = cloud_svc_vo.update(params)
+        stats_change_tracker.mark_changed(
+            [old_type_key, self._make_type_key(cloud_svc_vo)]
+        )
 
         return cloud_svc_vo
 
-    @staticmethod
-    def delete_cloud_service_by_vo(cloud_svc_vo: CloudService) -> None:
+    def create_cloud_services(
+        self, params_list: List[dict]
+    ) -> List[Union[CloudService, Exception]]:
+        def _rollback(cloud_service_ids: List[str]):
+            _LOGGER.info(f"[ROLLBACK] Delete Cloud Services : {cloud_service_ids}")
+            self.filter_cloud_services(cloud_service_id=cloud_service_ids).delete()
+
+        results = bulk_writer.insert_many(self.cloud_svc_model, params_list)
+        created_ids = [
+            vo.cloud_service_id for vo in results if isinstance(vo, CloudService)
+        ]
+
+        if len(created_ids) > 0:
+            self.transaction.add_rollback(_rollback, created_ids)
+
+        self._mark_changed_types([vo for vo in results if isinstance(vo, CloudService)])
+
+        return results
+
+    def update_cloud_services_by_vos(
+        self, updates: List[Tuple[CloudService, dict]]
+    ) -> List[Union[CloudService, Exception]]:
+        def _rollback(old_data_list: List[Tuple[CloudService, dict]]):
+            _LOGGER.info(
+                f"[ROLLBACK] Revert Data : {len(old_data_list)} cloud services"
+            )
+            bulk_writer.update_many_by_vos(self.cloud_svc_model, old_data_list)
+
+        self.transaction.add_rollback(
+            _rollback,
+            [
+                (cloud_svc_vo, cloud_svc_vo.to_dict())
+                for cloud_svc_vo, params in updates
+            ],
+        )
+
+        results = bulk_writer.update_many_by_vos(self.cloud_svc_model, updates)
+
+        # cloud service types before and after the update are marked
+        stats_change_tracker.mark_changed(
+            [self._make_type_key(cloud_svc_vo) for cloud_svc_vo, params in updates]
+            + [
+                self._make_type_key(cloud_svc_vo, params)
+                for cloud_svc_vo, params in updates
+            ]
+        )
+
+        return results
+
+    def update_collection_info_by_vos(
+        self, cloud_svc_vos: List[CloudService], collection_info: dict
+    ) -> int:
+        def _rollback(old_data_list: List[Tuple[CloudService, dict]]):
+            _LOGGER.info(
+                f"[ROLLBACK] Revert Collection Info : {len(old_data_list)} cloud services"
+            )
+            bulk_writer.update_many_by_vos(self.cloud_svc_model, old_data_list)
+
+        self.transaction.add_rollback(
+            _rollback,
+            [
+                (
+                    cloud_svc_vo,
+                    {
+                        "collection_info": cloud_svc_vo.collection_info.to_dict(),
+                        "updated_at": cloud_svc_vo.updated_at,
+                    },
+                )
+                for cloud_svc_vo in cloud_svc_vos
+            ],
+        )
+
+        return bulk_writer.update_many(
+            self.cloud_svc_model,
+            [cloud_svc_vo.pk for cloud_svc_vo in cloud_svc_vos],
+            {"collection_info": collection_info},
+        )
+
+    def delete_cloud_service_by_vo(self, cloud_svc_vo: CloudService) -> None:
         cloud_svc_vo.delete()
+        self._mark_changed_types([cloud_svc_vo])
 
     def terminate_cloud_service(
         self, cloud_service_id: str, domain_id: str, workspace_id: str = None
@@ -89,6 +193,7 @@ class CloudServiceManager(BaseManager, ResourceManager):
             cloud_service_id, domain_id, workspace_id
         )
         cloud_svc_vo.terminate()
+        self._mark_changed_types([cloud_svc_vo])
 
     def get_cloud_service(
         self,
@@ -274,22 +379,42 @@ class CloudServiceManager(BaseManager, ResourceManager):
         domain_id: str,
         workspace_id: str,
         ref_mgr: ReferenceManager,
-    ):
+    ) -> Iterator[dict]:
         _LOGGER.debug(f"[export] search_query: {query}")
-        cloud_service_vos, total_count = self.list_cloud_services(
-            query, change_filter=True, domain_id=domain_id
-        )
-        results = []
 
         fields = query.get("fields")
         if fields is None:
             raise ERROR_REQUIRED_PARAMETER(key="options[].search_query.fields")
 
+        cloud_service_vos, total_count = self.list_cloud_services(
+            query, change_filter=True, domain_id=domain_id
+        )
+
+        # Results are made while exporting, so that all rows are not kept in memory
+        return self._iter_search_query_results(
+            cloud_service_vos.no_cache().batch_size(EXPORT_BATCH_SIZE),
+            fields,
+            timezone,
+            domain_id,
+            workspace_id,
+            ref_mgr,
+        )
+
+    def _iter_search_query_results(
+        self,
+        cloud_service_vos: QuerySet,
+        fields: list,
+        timezone: str,
+        domain_id: str,
+        workspace_id: str,
+        ref_mgr: ReferenceManager,
+    ) -> Iterator[dict]:
         tz = pytz.timezone(timezone)
         tz_offset = tz.utcoffset(datetime.utcnow())
 
-        for cloud_service_vo in cloud_service_vos:
-            cloud_service_data = cloud_service_vo.to_dict()
+        for cloud_service_data in self._iter_cloud_service_data(
+            cloud_service_vos, fields, domain_id, ref_mgr
+        ):
 
             result = {}
             for field in fields:
@@ -350,9 +475,45 @@ class CloudServiceManager(BaseManager, ResourceManager):
                     source_unit=source_unit,
                 )
 
-            results.append(result)
+            yield result
 
-        return results
+    def _iter_cloud_service_data(
+        self,
+        cloud_service_vos: QuerySet,
+        fields: list,
+        domain_id: str,
+        ref_mgr: ReferenceManager,
+    ) -> Iterator[dict]:
+        reference_fields = []
+        for field in fields:
+            if isinstance(field, dict):
+                if resource_type := field.get("reference", {}).get("resource_type"):
+                    key = field["key"]
+                    if key.startswith("tags."):
+                        key = self._get_hashed_key(key)
+
+                    reference_fields.append((key, resource_type))
+
+        # iter() of a queryset restarts the query, so it's read by a generator
+        cloud_service_vos = (vo for vo in cloud_service_vos)
+
+        while chunk := [
+            vo.to_dict()
+            for vo in itertools.islice(cloud_service_vos, EXPORT_BATCH_SIZE)
+        ]:
+            # names missing in the cache are loaded once per chunk
+            for key, resource_type in reference_fields:
+                resource_ids = set()
+                for cloud_service_data in chunk:
+                    value = utils.get_dict_value(cloud_service_data, key)
+                    if isinstance(value, list):
+                        resource_ids.update(v for v in value if isinstance(v, str))
+                    elif isinstance(value, str):
+                        resource_ids.add(value)
+
+                ref_mgr.load_unknown_names(resource_type, resource_ids, domain_id)
+
+            yield from chunk
 
     def _get_analyze_query_results(self, query: dict, domain_id: str) -> List[dict]:
         _LOGGER.debug(f"[export] analyze_query: {query}")
@@ -387,6 +548,20 @@ class CloudServiceManager(BaseManager, ResourceManager):
 
         return new_data
 
+    @staticmethod
+    def make_content_hash(
+        data: dict, provider: str, secret_project_id: str = None
+    ) -> Union[str, None]:
+        content = {key: data[key] for key in CONTENT_HASH_KEYS if key in data}
+        content["provider"] = provider
+        content["secret_project_id"] = secret_project_id
+
+        try:
+            return utils.dict_to_hash(content)
+        except Exception as e:
+            _LOGGER.debug(f"[make_content_hash] failed to make content hash: {e}")
+            return None
+
     def find_resources(self, query: dict) -> Tuple[List[dict], int]:
         query["only"] = ["cloud_service_id"]
         query["filter"].append({"k": "state", "v": "DELETED", "o": "not"})
@@ -401,15 +576,35 @@ class CloudServiceManager(BaseManager, ResourceManager):
 
         return resources, total_count
 
+    def find_resources_by_match_keys(
+        self, query: dict, match_keys: List[str]
+    ) -> List[Tuple[dict, dict]]:
+        query["only"] = self.resource_keys + match_keys
+        query["filter"].append({"k": "state", "v": "DELETED", "o": "not"})
+
+        results = []
+        cloud_svc_vos, total_count = self.list_cloud_services(
+            query, target="SECONDARY_PREFERRED"
+        )
+
+        for cloud_svc_vo in cloud_svc_vos:
+            results.append(self._make_match_key_result(cloud_svc_vo, match_keys))
+
+        return results
+
     def delete_resources(self, query: dict) -> int:
-        query["only"] = self.resource_keys
+        query["only"] = self.resource_keys + _TYPE_KEYS
         query["filter"].append({"k": "state", "v": "DELETED", "o": "not"})
 
         vos, total_count = self.list_cloud_services(query)
 
         cloud_service_ids = []
+        type_keys = set()
         for vo in vos:
             cloud_service_ids.append(vo.cloud_service_id)
+            type_keys.add(self._make_type_key(vo))
+
+        stats_change_tracker.mark_changed(type_keys)
 
         vos.update({"state": "DELETED", "deleted_at": datetime.utcnow()})
 
@@ -420,6 +615,61 @@ class CloudServiceManager(BaseManager, ResourceManager):
 
         return total_count
 
+    def delete_resources_by_ids(
+        self, cloud_service_ids: List[str], domain_id: str
+    ) -> int:
+        """Delete cloud services and collection states of the ids with a single update
+
+        Returns:
+            deleted_count (int): number of cloud services changed to DELETED
+        """
+
+        if len(cloud_service_ids) == 0:
+            return 0
+
+        match = {
+            "cloud_service_id": {"$in": cloud_service_ids},
+            "domain_id": domain_id,
+            "state": {"$ne": "DELETED"},
+        }
+
+        if stats_change_tracker.is_enabled():
+            self._mark_changed_types_by_match(match)
+
+        result = self.cloud_svc_model._get_collection().update_many(
+            match,
+            {"$set": {"state": "DELETED", "deleted_at": datetime.utcnow()}},
+        )
+
+        state_mgr: CollectionStateManager = self.locator.get_manager(
+            "CollectionStateManager"
+        )
+        state_mgr.delete_collection_state_by_cloud_service_ids(cloud_service_ids)
+
+        return result.modified_count
+
+    def _mark_changed_types(self, cloud_svc_vos: List[CloudService]) -> None:
+        stats_change_tracker.mark_changed(
+            [self._make_type_key(cloud_svc_vo) for cloud_svc_vo in cloud_svc_vos]
+        )
+
+    def _mark_changed_types_by_match(self, match: dict) -> None:
+        results = self.cloud_svc_model._get_collection().aggregate(
+            [
+                {"$match": match},
+                {"$group": {"_id": {key: f"${key}" for key in _TYPE_KEYS}}},
+            ]
+        )
+
+        stats_change_tracker.mark_changed(
+            [tuple(result["_id"].get(key) for key in _TYPE_KEYS) for result in results]
+        )
+
+    @staticmethod
+    def _make_type_key(cloud_svc_vo: CloudService, params: dict = None) -> tuple:
+        params = params or {}
+        return tuple(params.get(key, getattr(cloud_svc_vo, key)) for key in _TYPE_KEYS)
+
     @staticmethod
     def _append_state_query(query: dict) -> dict:
         state_default_filter = {"key": "state", "value": "ACTIVE", "operator": "eq"}
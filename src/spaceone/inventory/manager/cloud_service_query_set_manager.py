@@ -1,13 +1,16 @@
 import copy
 import logging
-from typing import Tuple, Union
-from datetime import datetime
+from collections import defaultdict
+from typing import Dict, List, Tuple, Union
+from datetime import datetime, timedelta
+from bson import ObjectId
 from dateutil.relativedelta import relativedelta
 
-from spaceone.core import cache, utils, queue
+from spaceone.core import cache, config, utils, queue
 from spaceone.core.manager import BaseManager
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.inventory.error.cloud_service_query_set import *
+from spaceone.inventory.lib import stats_change_tracker
 from spaceone.inventory.model.cloud_service_query_set_model import CloudServiceQuerySet
 from spaceone.inventory.manager.cloud_service_manager import CloudServiceManager
 from spaceone.inventory.manager.cloud_service_stats_manager import (
@@ -26,6 +29,12 @@ _DEFAULT_GROUP_BY = [
     "workspace_id",
 ]
 
+# Query options which can't be evaluated for several cloud service types at once
+_UNSHARED_QUERY_OPTIONS = ["page", "field_group"]
+
+# Keys of cloud services which are changed without changes of the cloud services
+_VOLATILE_QUERY_KEYS = ["collection_info", "created_at", "updated_at", "deleted_at"]
+
 
 class CloudServiceQuerySetManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -187,8 +196,56 @@ class CloudServiceQuerySetManager(BaseManager):
     def stat_cloud_service_query_sets(self, query: dict) -> dict:
         return self.cloud_svc_query_set_model.stat(**query)
 
+    def run_cloud_service_query_sets(
+        self,
+        cloud_svc_query_set_vos: List[CloudServiceQuerySet],
+        incremental: bool = False,
+    ) -> None:
+        """Run query sets in order, sharing a scan of cloud services between them
+
+        Query sets with the same query options, which differ only in their cloud
+        service types, are analyzed in a single query grouped by the cloud
+        service types. The results are partitioned to each query set.
+
+        In incremental mode, the stats of the last run are copied for query sets
+        whose cloud service types are not changed since then, instead of running them.
+        """
+
+        started_at = datetime.utcnow()
+
+        if incremental and stats_change_tracker.is_enabled():
+            cloud_svc_query_set_vos = self._copy_unchanged_query_sets(
+                cloud_svc_query_set_vos, started_at
+            )
+
+        batches = self._plan_query_set_batches(cloud_svc_query_set_vos)
+        batch_results = {}
+
+        for cloud_svc_query_set_vo in cloud_svc_query_set_vos:
+            query_set_id = cloud_svc_query_set_vo.query_set_id
+
+            if query_set_id not in batches:
+                self.run_cloud_service_query_set(cloud_svc_query_set_vo)
+            else:
+                batch_index, batch_vos = batches[query_set_id]
+                if batch_index not in batch_results:
+                    batch_results[batch_index] = self._run_shared_analyze_query(
+                        batch_vos
+                    )
+
+                results = batch_results[batch_index].get(
+                    self._get_cloud_service_type_key(cloud_svc_query_set_vo), []
+                )
+                self.run_cloud_service_query_set(cloud_svc_query_set_vo, results)
+
+            stats_change_tracker.set_last_run(
+                cloud_svc_query_set_vo.domain_id, query_set_id, started_at
+            )
+
     def run_cloud_service_query_set(
-        self, cloud_svc_query_set_vo: CloudServiceQuerySet
+        self,
+        cloud_svc_query_set_vo: CloudServiceQuerySet,
+        results: List[dict] = None,
     ) -> None:
         if cloud_svc_query_set_vo.state == "DISABLED":
             raise ERROR_CLOUD_SERVICE_QUERY_SET_STATE(
@@ -203,12 +260,17 @@ class CloudServiceQuerySetManager(BaseManager):
             f"[run_cloud_service_query_set] run query set: {cloud_svc_query_set_vo.query_set_id} "
             f"({cloud_svc_query_set_vo.domain_id})"
         )
-        results = self._run_analyze_query(cloud_svc_query_set_vo)
 
+        if results is None:
+            results = self._run_analyze_query(cloud_svc_query_set_vo)
+
+        stats_job_id = utils.generate_id("stats-job")
         created_at = datetime.utcnow()
 
         try:
-            self._save_query_results(cloud_svc_query_set_vo, results, created_at)
+            self._save_query_results(
+                cloud_svc_query_set_vo, results, created_at, stats_job_id
+            )
             self._delete_changed_cloud_service_stats(cloud_svc_query_set_vo, created_at)
             self._delete_changed_monthly_cloud_service_stats(
                 cloud_svc_query_set_vo, created_at
@@ -218,17 +280,24 @@ class CloudServiceQuerySetManager(BaseManager):
                 f"[run_cloud_service_query_set] Failed to save query result: {e}",
                 exc_info=True,
             )
-            self._rollback_query_results(cloud_svc_query_set_vo, created_at)
+            self._rollback_query_results(
+                cloud_svc_query_set_vo, created_at, stats_job_id
+            )
             raise ERROR_CLOUD_SERVICE_QUERY_SET_RUN_FAILED(
                 query_set_id=cloud_svc_query_set_vo.query_set_id
             )
 
-        self._update_status(cloud_svc_query_set_vo, created_at)
-        self._delete_invalid_cloud_service_stats(cloud_svc_query_set_vo)
+        self._update_status(cloud_svc_query_set_vo, created_at, stats_job_id)
+        self._delete_invalid_cloud_service_stats(
+            cloud_svc_query_set_vo, created_at, stats_job_id
+        )
         self._delete_old_cloud_service_stats(cloud_svc_query_set_vo)
         self._remove_analyze_cache(
             cloud_svc_query_set_vo.domain_id, cloud_svc_query_set_vo.query_set_id
         )
+        self._warm_analyze_cache(
+            cloud_svc_query_set_vo.domain_id, cloud_svc_query_set_vo.query_set_id
+        )
 
     def test_cloud_service_query_set(
         self, cloud_svc_query_set_vo: CloudServiceQuerySet
@@ -249,26 +318,60 @@ class CloudServiceQuerySetManager(BaseManager):
         return {"results": self._run_analyze_query(cloud_svc_query_set_vo)}
 
     def _run_analyze_query(self, cloud_svc_query_set_vo: CloudServiceQuerySet) -> list:
+        query_filter = self._make_query_filter(
+            cloud_svc_query_set_vo.domain_id,
+            cloud_svc_query_set_vo.provider,
+            cloud_svc_query_set_vo.cloud_service_group,
+            cloud_svc_query_set_vo.cloud_service_type,
+            self._get_workspace_id(cloud_svc_query_set_vo),
+        )
+
+        return self._analyze_cloud_services(cloud_svc_query_set_vo, query_filter)
+
+    def _run_shared_analyze_query(
+        self, cloud_svc_query_set_vos: List[CloudServiceQuerySet]
+    ) -> Dict[tuple, list]:
+        cloud_svc_query_set_vo = cloud_svc_query_set_vos[0]
+        query_filter = self._make_query_filter(
+            cloud_svc_query_set_vo.domain_id,
+            workspace_id=self._get_workspace_id(cloud_svc_query_set_vo),
+        )
+
+        for key in ["provider", "cloud_service_group", "cloud_service_type"]:
+            values = {getattr(vo, key) for vo in cloud_svc_query_set_vos}
+            query_filter.append({"k": key, "v": sorted(values), "o": "in"})
+
+        _LOGGER.debug(
+            f"[_run_shared_analyze_query] run query sets at once: "
+            f"{[vo.query_set_id for vo in cloud_svc_query_set_vos]}"
+        )
+
+        # results are grouped by cloud service types with _DEFAULT_GROUP_BY
+        results_by_type = defaultdict(list)
+        for result in self._analyze_cloud_services(
+            cloud_svc_query_set_vo, query_filter
+        ):
+            key = (
+                result.get("provider"),
+                result.get("cloud_service_group"),
+                result.get("cloud_service_type"),
+            )
+            results_by_type[key].append(result)
+
+        return results_by_type
+
+    def _analyze_cloud_services(
+        self, cloud_svc_query_set_vo: CloudServiceQuerySet, query_filter: list
+    ) -> list:
         cloud_svc_mgr: CloudServiceManager = self.locator.get_manager(
             "CloudServiceManager"
         )
 
         analyze_query = copy.deepcopy(cloud_svc_query_set_vo.query_options)
-        provider = cloud_svc_query_set_vo.provider
-        cloud_service_group = cloud_svc_query_set_vo.cloud_service_group
-        cloud_service_type = cloud_svc_query_set_vo.cloud_service_type
         domain_id = cloud_svc_query_set_vo.domain_id
-        resource_group = cloud_svc_query_set_vo.resource_group
-
-        if resource_group == "WORKSPACE":
-            workspace_id = cloud_svc_query_set_vo.workspace_id
-        else:
-            workspace_id = None
 
         analyze_query["filter"] = analyze_query.get("filter", [])
-        analyze_query["filter"] += self._make_query_filter(
-            domain_id, provider, cloud_service_group, cloud_service_type, workspace_id
-        )
+        analyze_query["filter"] += query_filter
 
         analyze_query["group_by"] = (
             analyze_query.get("group_by", []) + _DEFAULT_GROUP_BY
@@ -286,31 +389,227 @@ class CloudServiceQuerySetManager(BaseManager):
         )
         return response.get("results", [])
 
-    def _delete_invalid_cloud_service_stats(
-        self, cloud_svc_query_set_vo: CloudServiceQuerySet
-    ) -> None:
+    def _copy_unchanged_query_sets(
+        self, cloud_svc_query_set_vos: List[CloudServiceQuerySet], started_at: datetime
+    ) -> List[CloudServiceQuerySet]:
+        """Copy the stats of unchanged query sets and return the query sets to run"""
+
+        self.cloud_svc_stats_mgr: CloudServiceStatsManager = self.locator.get_manager(
+            "CloudServiceStatsManager"
+        )
+
+        created_at = datetime.utcnow()
+        created_date = created_at.strftime("%Y-%m-%d")
+        vos_to_run = []
+        unchanged_vos_by_domain = defaultdict(list)
+        tracked_since_by_domain = {}
+
+        for cloud_svc_query_set_vo in cloud_svc_query_set_vos:
+            domain_id = cloud_svc_query_set_vo.domain_id
+            if domain_id not in tracked_since_by_domain:
+                tracked_since_by_domain[domain_id] = (
+                    stats_change_tracker.start_tracking(domain_id, started_at)
+                )
+
+            if self._is_unchanged(
+                cloud_svc_query_set_vo, tracked_since_by_domain[domain_id]
+            ):
+                unchanged_vos_by_domain[domain_id].append(cloud_svc_query_set_vo)
+            else:
+                vos_to_run.append(cloud_svc_query_set_vo)
+
+        for domain_id, unchanged_vos in unchanged_vos_by_domain.items():
+            last_dates = self.cloud_svc_stats_mgr.get_last_created_dates(
+                domain_id, [vo.query_set_id for vo in unchanged_vos]
+            )
+
+            query_set_dates = {}
+            vos_to_copy = []
+            for cloud_svc_query_set_vo in unchanged_vos:
+                last_date = last_dates.get(cloud_svc_query_set_vo.query_set_id)
+
+                if last_date is None:
+                    # no stats to be copied
+                    vos_to_run.append(cloud_svc_query_set_vo)
+                elif last_date < created_date:
+                    query_set_dates[cloud_svc_query_set_vo.query_set_id] = last_date
+                    vos_to_copy.append(cloud_svc_query_set_vo)
+
+            if len(vos_to_copy) == 0:
+                continue
+
+            try:
+                self.cloud_svc_stats_mgr.copy_cloud_service_stats(
+                    domain_id, query_set_dates, created_at
+                )
+            except Exception as e:
+                _LOGGER.error(
+                    f"[_copy_unchanged_query_sets] Failed to copy stats, "
+                    f"run query sets instead ({domain_id}): {e}",
+                    exc_info=True,
+                )
+                vos_to_run += vos_to_copy
+                continue
+
+            for cloud_svc_query_set_vo in vos_to_copy:
+                self._delete_old_cloud_service_stats(cloud_svc_query_set_vo)
+                self._remove_analyze_cache(
+                    domain_id, cloud_svc_query_set_vo.query_set_id
+                )
+                self._warm_analyze_cache(domain_id, cloud_svc_query_set_vo.query_set_id)
+
+        _LOGGER.debug(
+            f"[_copy_unchanged_query_sets] query sets: {len(cloud_svc_query_set_vos)}, "
+            f"to run: {len(vos_to_run)}"
+        )
+
+        # query sets are run in the same order
+        query_set_ids_to_run = {vo.query_set_id for vo in vos_to_run}
+        return [
+            vo
+            for vo in cloud_svc_query_set_vos
+            if vo.query_set_id in query_set_ids_to_run
+        ]
+
+    def _is_unchanged(
+        self, cloud_svc_query_set_vo: CloudServiceQuerySet, tracked_since: datetime
+    ) -> bool:
+        if cloud_svc_query_set_vo.state == "DISABLED":
+            return False
+
+        type_key = self._get_cloud_service_type_key(cloud_svc_query_set_vo)
+        if None in type_key:
+            return False
+
+        query_options = utils.dump_json(cloud_svc_query_set_vo.query_options or {})
+        for key in _VOLATILE_QUERY_KEYS:
+            if key in query_options:
+                return False
+
         domain_id = cloud_svc_query_set_vo.domain_id
-        query_set_id = cloud_svc_query_set_vo.query_set_id
+        changed_at = stats_change_tracker.get_changed_at(
+            domain_id, cloud_svc_query_set_vo.workspace_id, *type_key
+        )
+        updated_at = cloud_svc_query_set_vo.updated_at
 
-        cloud_stats_vos = self.cloud_svc_stats_mgr.filter_cloud_service_stats(
-            query_set_id=query_set_id, domain_id=domain_id, status="IN_PROGRESS"
+        if changed_at is None or (updated_at and updated_at > changed_at):
+            changed_at = updated_at
+
+        return stats_change_tracker.is_tracked(
+            tracked_since,
+            stats_change_tracker.get_last_run(
+                domain_id, cloud_svc_query_set_vo.query_set_id
+            ),
+            changed_at,
         )
 
-        if cloud_stats_vos.count() > 0:
+    def _plan_query_set_batches(
+        self, cloud_svc_query_set_vos: List[CloudServiceQuerySet]
+    ) -> Dict[str, Tuple[int, List[CloudServiceQuerySet]]]:
+        batch_size = max(config.get_global("STATS_QUERY_SET_BATCH_SIZE", 100), 1)
+        query_set_groups = defaultdict(list)
+
+        for cloud_svc_query_set_vo in cloud_svc_query_set_vos:
+            if group_key := self._get_batch_key(cloud_svc_query_set_vo):
+                query_set_groups[group_key].append(cloud_svc_query_set_vo)
+
+        batches = {}
+        batch_count = 0
+        for group_vos in query_set_groups.values():
+            for idx in range(0, len(group_vos), batch_size):
+                batch_vos = group_vos[idx : idx + batch_size]
+
+                # a query set alone is run by itself
+                if len(batch_vos) > 1:
+                    for vo in batch_vos:
+                        batches[vo.query_set_id] = (batch_count, batch_vos)
+
+                    batch_count += 1
+
+        _LOGGER.debug(
+            f"[_plan_query_set_batches] query sets: {len(cloud_svc_query_set_vos)}, "
+            f"shared scans: {batch_count} ({len(batches)} query sets)"
+        )
+
+        return batches
+
+    def _get_batch_key(
+        self, cloud_svc_query_set_vo: CloudServiceQuerySet
+    ) -> Union[tuple, None]:
+        query_options = cloud_svc_query_set_vo.query_options or {}
+
+        if cloud_svc_query_set_vo.state == "DISABLED":
+            return None
+
+        if None in self._get_cloud_service_type_key(cloud_svc_query_set_vo):
+            return None
+
+        for key in _UNSHARED_QUERY_OPTIONS:
+            if key in query_options:
+                return None
+
+        return (
+            utils.dict_to_hash(query_options),
+            cloud_svc_query_set_vo.domain_id,
+            self._get_workspace_id(cloud_svc_query_set_vo),
+        )
+
+    @staticmethod
+    def _get_cloud_service_type_key(
+        cloud_svc_query_set_vo: CloudServiceQuerySet,
+    ) -> tuple:
+        return (
+            cloud_svc_query_set_vo.provider,
+            cloud_svc_query_set_vo.cloud_service_group,
+            cloud_svc_query_set_vo.cloud_service_type,
+        )
+
+    @staticmethod
+    def _get_workspace_id(
+        cloud_svc_query_set_vo: CloudServiceQuerySet,
+    ) -> Union[str, None]:
+        if cloud_svc_query_set_vo.resource_group == "WORKSPACE":
+            return cloud_svc_query_set_vo.workspace_id
+        else:
+            return None
+
+    def _delete_invalid_cloud_service_stats(
+        self,
+        cloud_svc_query_set_vo: CloudServiceQuerySet,
+        created_at: datetime,
+        stats_job_id: str,
+    ) -> None:
+        """Delete the stats left IN_PROGRESS by the runs which didn't finish
+
+        A run of the same query set may be still saving its stats, so only
+        the stats saved before the staging timeout are deleted. The save
+        time is taken from the ObjectId, which is also set on legacy stats.
+        """
+
+        timeout = config.get_global("STATS_STAGING_TIMEOUT", 2)
+        staged_before = ObjectId.from_datetime(created_at - timedelta(hours=timeout))
+
+        match = {
+            "query_set_id": cloud_svc_query_set_vo.query_set_id,
+            "domain_id": cloud_svc_query_set_vo.domain_id,
+            "stats_job_id": {"$ne": stats_job_id},
+            "status": "IN_PROGRESS",
+            "_id": {"$lt": staged_before},
+        }
+
+        deleted_count = self.cloud_svc_stats_mgr.delete_cloud_service_stats_many(match)
+        if deleted_count > 0:
             _LOGGER.debug(
-                f"[_delete_invalid_cloud_service_stats] delete stats count: {cloud_stats_vos.count()}"
+                f"[_delete_invalid_cloud_service_stats] delete stats count: {deleted_count}"
             )
-            cloud_stats_vos.delete()
 
-        monthly_stats_vos = self.cloud_svc_stats_mgr.filter_monthly_cloud_service_stats(
-            query_set_id=query_set_id, domain_id=domain_id, status="IN_PROGRESS"
+        deleted_count = (
+            self.cloud_svc_stats_mgr.delete_monthly_cloud_service_stats_many(match)
         )
-
-        if monthly_stats_vos.count() > 0:
+        if deleted_count > 0:
             _LOGGER.debug(
-                f"[_delete_invalid_cloud_service_stats] delete monthly stats count: {monthly_stats_vos.count()}"
+                f"[_delete_invalid_cloud_service_stats] delete monthly stats count: {deleted_count}"
             )
-            monthly_stats_vos.delete()
 
     def _delete_old_cloud_service_stats(
         self, cloud_svc_query_set_vo: CloudServiceQuerySet
@@ -321,47 +620,39 @@ class CloudServiceQuerySetManager(BaseManager):
         old_created_month = (now - relativedelta(months=12)).strftime("%Y-%m")
         old_created_year = (now - relativedelta(months=36)).strftime("%Y")
 
-        delete_query = {
-            "filter": [
-                {"k": "created_month", "v": old_created_month, "o": "lt"},
-                {"k": "query_set_id", "v": query_set_id, "o": "eq"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-            ]
-        }
-
-        stats_vos, total_count = self.cloud_svc_stats_mgr.list_cloud_service_stats(
-            delete_query
+        deleted_count = self.cloud_svc_stats_mgr.delete_cloud_service_stats_many(
+            {
+                "query_set_id": query_set_id,
+                "domain_id": domain_id,
+                "created_month": {"$lt": old_created_month},
+            }
         )
 
-        if total_count > 0:
+        if deleted_count > 0:
             _LOGGER.debug(
-                f"[delete_old_cloud_service_stats] delete stats count: {total_count}"
+                f"[delete_old_cloud_service_stats] delete stats count: {deleted_count}"
             )
-            stats_vos.delete()
 
-        monthly_delete_query = {
-            "filter": [
-                {"k": "created_year", "v": old_created_year, "o": "lt"},
-                {"k": "query_set_id", "v": query_set_id, "o": "eq"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-            ]
-        }
-
-        (
-            monthly_stats_vos,
-            total_count,
-        ) = self.cloud_svc_stats_mgr.list_monthly_cloud_service_stats(
-            monthly_delete_query
+        deleted_count = (
+            self.cloud_svc_stats_mgr.delete_monthly_cloud_service_stats_many(
+                {
+                    "query_set_id": query_set_id,
+                    "domain_id": domain_id,
+                    "created_year": {"$lt": old_created_year},
+                }
+            )
         )
 
-        if total_count > 0:
+        if deleted_count > 0:
             _LOGGER.debug(
-                f"[_delete_old_cloud_service_stats] delete monthly stats count: {total_count}"
+                f"[_delete_old_cloud_service_stats] delete monthly stats count: {deleted_count}"
             )
-            monthly_stats_vos.delete()
 
     def _update_status(
-        self, cloud_svc_query_set_vo: CloudServiceQuerySet, created_at: datetime
+        self,
+        cloud_svc_query_set_vo: CloudServiceQuerySet,
+        created_at: datetime,
+        stats_job_id: str,
     ) -> None:
         domain_id = cloud_svc_query_set_vo.domain_id
         query_set_id = cloud_svc_query_set_vo.query_set_id
@@ -372,6 +663,7 @@ class CloudServiceQuerySetManager(BaseManager):
             query_set_id=query_set_id,
             domain_id=domain_id,
             created_date=created_date,
+            stats_job_id=stats_job_id,
             status="IN_PROGRESS",
         )
         cloud_stats_vos.update({"status": "DONE"})
@@ -380,6 +672,7 @@ class CloudServiceQuerySetManager(BaseManager):
             query_set_id=query_set_id,
             domain_id=domain_id,
             created_month=created_month,
+            stats_job_id=stats_job_id,
             status="IN_PROGRESS",
         )
         monthly_stats_vos.update({"status": "DONE"})
@@ -387,75 +680,87 @@ class CloudServiceQuerySetManager(BaseManager):
     def _delete_changed_cloud_service_stats(
         self, cloud_svc_query_set_vo: CloudServiceQuerySet, created_at: datetime
     ) -> None:
-        domain_id = cloud_svc_query_set_vo.domain_id
-        query_set_id = cloud_svc_query_set_vo.query_set_id
-        created_date = created_at.strftime("%Y-%m-%d")
-
-        cloud_stats_vos = self.cloud_svc_stats_mgr.filter_cloud_service_stats(
-            query_set_id=query_set_id,
-            domain_id=domain_id,
-            created_date=created_date,
-            status="DONE",
+        deleted_count = self.cloud_svc_stats_mgr.delete_cloud_service_stats_many(
+            {
+                "query_set_id": cloud_svc_query_set_vo.query_set_id,
+                "domain_id": cloud_svc_query_set_vo.domain_id,
+                "created_date": created_at.strftime("%Y-%m-%d"),
+                "status": "DONE",
+            }
         )
 
         _LOGGER.debug(
-            f"[_delete_old_cloud_service_stats] delete count: {cloud_stats_vos.count()}"
+            f"[_delete_changed_cloud_service_stats] delete count: {deleted_count}"
         )
-        cloud_stats_vos.delete()
 
     def _delete_changed_monthly_cloud_service_stats(
         self, cloud_svc_query_set_vo: CloudServiceQuerySet, created_at: datetime
     ):
-        domain_id = cloud_svc_query_set_vo.domain_id
-        query_set_id = cloud_svc_query_set_vo.query_set_id
-        created_month = created_at.strftime("%Y-%m")
-
-        monthly_stats_vos = self.cloud_svc_stats_mgr.filter_monthly_cloud_service_stats(
-            query_set_id=query_set_id,
-            domain_id=domain_id,
-            created_month=created_month,
-            status="DONE",
+        deleted_count = (
+            self.cloud_svc_stats_mgr.delete_monthly_cloud_service_stats_many(
+                {
+                    "query_set_id": cloud_svc_query_set_vo.query_set_id,
+                    "domain_id": cloud_svc_query_set_vo.domain_id,
+                    "created_month": created_at.strftime("%Y-%m"),
+                    "status": "DONE",
+                }
+            )
         )
 
         _LOGGER.debug(
-            f"[_delete_old_monthly_cloud_service_stats] delete count: {monthly_stats_vos.count()}"
+            f"[_delete_changed_monthly_cloud_service_stats] delete count: {deleted_count}"
         )
-        monthly_stats_vos.delete()
 
     def _rollback_query_results(
-        self, cloud_svc_query_set_vo: CloudServiceQuerySet, created_at: datetime
+        self,
+        cloud_svc_query_set_vo: CloudServiceQuerySet,
+        created_at: datetime,
+        stats_job_id: str,
     ):
         _LOGGER.debug(
             f"[_rollback_query_results] Rollback Query Results: {cloud_svc_query_set_vo.query_set_id}"
         )
-        query_set_id = cloud_svc_query_set_vo.query_set_id
-        domain_id = cloud_svc_query_set_vo.domain_id
+        match = {
+            "query_set_id": cloud_svc_query_set_vo.query_set_id,
+            "domain_id": cloud_svc_query_set_vo.domain_id,
+            "stats_job_id": stats_job_id,
+            "status": "IN_PROGRESS",
+        }
 
-        cloud_service_stats_vo = self.cloud_svc_stats_mgr.filter_cloud_service_stats(
-            query_set_id=query_set_id,
-            domain_id=domain_id,
-            created_date=created_at.strftime("%Y-%m-%d"),
-            status="IN_PROGRESS",
+        self.cloud_svc_stats_mgr.delete_cloud_service_stats_many(
+            {**match, "created_date": created_at.strftime("%Y-%m-%d")}
         )
-        cloud_service_stats_vo.delete()
-
-        monthly_stats_vo = self.cloud_svc_stats_mgr.filter_monthly_cloud_service_stats(
-            query_set_id=query_set_id,
-            domain_id=domain_id,
-            created_month=created_at.strftime("%Y-%m"),
-            status="IN_PROGRESS",
+        self.cloud_svc_stats_mgr.delete_monthly_cloud_service_stats_many(
+            {**match, "created_month": created_at.strftime("%Y-%m")}
         )
-        monthly_stats_vo.delete()
 
     def _save_query_results(
-        self, query_set_vo: CloudServiceQuerySet, results: list, created_at: datetime
+        self,
+        query_set_vo: CloudServiceQuerySet,
+        results: list,
+        created_at: datetime,
+        stats_job_id: str,
     ) -> None:
-        for result in results:
-            self._save_query_result(result, query_set_vo, created_at)
+        bulk_size = max(config.get_global("STATS_BULK_SIZE", 1000), 1)
+
+        for idx in range(0, len(results), bulk_size):
+            data_list = [
+                self._make_cloud_service_stats(
+                    result, query_set_vo, created_at, stats_job_id
+                )
+                for result in results[idx : idx + bulk_size]
+            ]
 
-    def _save_query_result(
-        self, result: dict, query_set_vo: CloudServiceQuerySet, created_at: datetime
-    ) -> None:
+            self.cloud_svc_stats_mgr.create_cloud_service_stats_many(data_list)
+            self.cloud_svc_stats_mgr.create_monthly_cloud_service_stats_many(data_list)
+
+    def _make_cloud_service_stats(
+        self,
+        result: dict,
+        query_set_vo: CloudServiceQuerySet,
+        created_at: datetime,
+        stats_job_id: str,
+    ) -> dict:
         provider = result["provider"]
         cloud_service_group = result["cloud_service_group"]
         cloud_service_type = result["cloud_service_type"]
@@ -472,6 +777,7 @@ class CloudServiceQuerySetManager(BaseManager):
 
         data = {
             "query_set_id": query_set_id,
+            "stats_job_id": stats_job_id,
             "data": {},
             "unit": {},
             "provider": provider,
@@ -502,8 +808,20 @@ class CloudServiceQuerySetManager(BaseManager):
         for key in query_set_vo.additional_info_keys:
             data["additional_info"][key] = result.get(key)
 
-        self.cloud_svc_stats_mgr.create_cloud_service_stats(data, False)
-        self.cloud_svc_stats_mgr.create_monthly_cloud_service_stats(data, False)
+        return data
+
+    def _warm_analyze_cache(self, domain_id: str, query_set_id: str) -> None:
+        try:
+            cached_count = self.cloud_svc_stats_mgr.warm_analyze_cache(
+                domain_id, query_set_id
+            )
+
+            if cached_count > 0:
+                _LOGGER.debug(
+                    f"[_warm_analyze_cache] cached queries ({query_set_id}): {cached_count}"
+                )
+        except Exception as e:
+            _LOGGER.warning(f"[_warm_analyze_cache] Failed to warm cache: {e}")
 
     @staticmethod
     def _remove_analyze_cache(domain_id: str, query_set_id: str) -> None:
@@ -1,13 +1,15 @@
 import logging
 import copy
-from typing import Tuple
+from collections import defaultdict
+from typing import Dict, List, Tuple
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
 
-from spaceone.core.model.mongo_model import QuerySet
+from spaceone.core.model.mongo_model import MongoModel, QuerySet
 from spaceone.core.manager import BaseManager
-from spaceone.core import utils, cache
+from spaceone.core import config, utils, cache
 from spaceone.inventory.error.cloud_service_stats import *
+from spaceone.inventory.lib import bulk_writer
 from spaceone.inventory.model.cloud_service_stats_model import (
     CloudServiceStats,
     MonthlyCloudServiceStats,
@@ -65,6 +67,149 @@ class CloudServiceStatsManager(BaseManager):
 
         return monthly_stats_vo
 
+    def create_cloud_service_stats_many(self, data_list: List[dict]) -> int:
+        return bulk_writer.create_many(self.cloud_svc_stats_model, data_list)
+
+    def create_monthly_cloud_service_stats_many(self, data_list: List[dict]) -> int:
+        return bulk_writer.create_many(self.monthly_stats_model, data_list)
+
+    def delete_cloud_service_stats_many(self, match: dict) -> int:
+        return self._delete_many(self.cloud_svc_stats_model, match)
+
+    def delete_monthly_cloud_service_stats_many(self, match: dict) -> int:
+        return self._delete_many(self.monthly_stats_model, match)
+
+    def get_last_created_dates(
+        self, domain_id: str, query_set_ids: List[str]
+    ) -> Dict[str, str]:
+        """Get the last created_date of the stats of each query set"""
+
+        if len(query_set_ids) == 0:
+            return {}
+
+        results = self.cloud_svc_stats_model._get_collection().aggregate(
+            [
+                {
+                    "$match": {
+                        "domain_id": domain_id,
+                        "query_set_id": {"$in": query_set_ids},
+                        "status": "DONE",
+                    }
+                },
+                {
+                    "$group": {
+                        "_id": "$query_set_id",
+                        "created_date": {"$max": "$created_date"},
+                    }
+                },
+            ]
+        )
+
+        return {result["_id"]: result["created_date"] for result in results}
+
+    def copy_cloud_service_stats(
+        self, domain_id: str, query_set_dates: Dict[str, str], created_at: datetime
+    ) -> None:
+        """Copy the stats of query sets from their last dates to the date of created_at
+
+        The daily stats are copied in the database with $merge (MongoDB 4.4+), and
+        the monthly stats are copied from them, if the month is changed.
+        If $merge is not supported, the stats are inserted by the manager.
+        If $merge fails otherwise, the stats it may have merged are deleted
+        before they are inserted by the manager.
+
+        Args:
+            domain_id (str): domain_id
+            query_set_dates (dict): {query_set_id: last created_date}
+            created_at (datetime): time of the copied stats
+        """
+
+        created_date = created_at.strftime("%Y-%m-%d")
+        created_month = created_at.strftime("%Y-%m")
+        created_year = created_at.strftime("%Y")
+        query_set_ids = list(query_set_dates.keys())
+
+        query_set_ids_by_date = defaultdict(list)
+        for query_set_id, last_date in query_set_dates.items():
+            query_set_ids_by_date[last_date].append(query_set_id)
+
+        daily_conditions = []
+        monthly_conditions = []
+        for last_date, ids in query_set_ids_by_date.items():
+            condition = {"created_date": last_date, "query_set_id": {"$in": ids}}
+            daily_conditions.append(condition)
+
+            if not last_date.startswith(created_month):
+                monthly_conditions.append(condition)
+
+        stats_job_id = utils.generate_id("stats-job")
+        collection = self.cloud_svc_stats_model._get_collection()
+        match = {"domain_id": domain_id, "status": "DONE"}
+        job_match = {
+            "domain_id": domain_id,
+            "query_set_id": {"$in": query_set_ids},
+            "stats_job_id": stats_job_id,
+            "status": "IN_PROGRESS",
+        }
+
+        try:
+            bulk_writer.aggregate_into(
+                collection,
+                [
+                    {"$match": {**match, "$or": daily_conditions}},
+                    {"$project": {"_id": 0}},
+                    {
+                        "$addFields": {
+                            "stats_job_id": stats_job_id,
+                            "status": "IN_PROGRESS",
+                            "created_year": created_year,
+                            "created_month": created_month,
+                            "created_date": created_date,
+                        }
+                    },
+                ],
+                collection,
+                job_match,
+            )
+
+            if monthly_conditions:
+                bulk_writer.aggregate_into(
+                    collection,
+                    [
+                        {"$match": {**match, "$or": monthly_conditions}},
+                        {"$project": {"_id": 0, "created_date": 0}},
+                        {
+                            "$addFields": {
+                                "stats_job_id": stats_job_id,
+                                "status": "IN_PROGRESS",
+                                "created_year": created_year,
+                                "created_month": created_month,
+                            }
+                        },
+                    ],
+                    self.monthly_stats_model._get_collection(),
+                    job_match,
+                )
+
+                self.delete_monthly_cloud_service_stats_many(
+                    {
+                        "domain_id": domain_id,
+                        "query_set_id": {"$in": query_set_ids},
+                        "created_month": created_month,
+                        "status": "DONE",
+                    }
+                )
+
+        except Exception as e:
+            self.delete_cloud_service_stats_many(job_match)
+            self.delete_monthly_cloud_service_stats_many(job_match)
+            raise e
+
+        collection.update_many(job_match, {"$set": {"status": "DONE"}})
+        self.monthly_stats_model._get_collection().update_many(
+            job_match, {"$set": {"status": "DONE"}}
+        )
+
     def filter_cloud_service_stats(self, **conditions) -> QuerySet:
         return self.cloud_svc_stats_model.filter(**conditions)
 
@@ -183,6 +328,72 @@ class CloudServiceStatsManager(BaseManager):
 
         return response
 
+    def warm_analyze_cache(self, domain_id: str, query_set_id: str) -> int:
+        """Cache the results of the queries recently used for the stats of a query set
+
+        Queries are replayed from the query history on the primary, since the
+        secondaries may not have the new stats yet.
+
+        Returns:
+            int: number of the cached queries
+        """
+
+        if not cache.is_set():
+            return 0
+
+        warming_days = config.get_global("STATS_CACHE_WARMING_DAYS", 3)
+        max_queries = config.get_global("STATS_CACHE_WARMING_MAX_QUERIES", 50)
+
+        if warming_days <= 0 or max_queries <= 0:
+            return 0
+
+        history_model: CloudServiceStatsQueryHistory = self.locator.get_model(
+            "CloudServiceStatsQueryHistory"
+        )
+        history_vos = (
+            history_model.filter(
+                domain_id=domain_id,
+                query_set_id=query_set_id,
+                updated_at__gte=datetime.utcnow() - relativedelta(days=warming_days),
+            )
+            .order_by("-updated_at")
+            .limit(max_queries)
+        )
+
+        cached_count = 0
+        for history_vo in history_vos:
+            query = copy.deepcopy(history_vo.query_options)
+
+            try:
+                self._check_date_range(query)
+                granularity = query["granularity"]
+
+                if granularity == "DAILY":
+                    analyze_with_cache = self.analyze_cloud_service_stats_with_cache
+                elif granularity == "MONTHLY":
+                    analyze_with_cache = (
+                        self.analyze_monthly_cloud_service_stats_with_cache
+                    )
+                else:
+                    analyze_with_cache = (
+                        self.analyze_yearly_cloud_service_stats_with_cache
+                    )
+
+                analyze_with_cache(
+                    query,
+                    history_vo.query_hash,
+                    domain_id,
+                    query_set_id,
+                    target="PRIMARY",
+                )
+                cached_count += 1
+            except Exception as e:
+                _LOGGER.debug(
+                    f"[warm_analyze_cache] skip query ({history_vo.query_hash}): {e}"
+                )
+
+        return cached_count
+
     @cache.cacheable(
         key="inventory:stats-query-history:{domain_id}:{query_set_id}:{query_hash}",
         expire=600,
@@ -316,6 +527,30 @@ class CloudServiceStatsManager(BaseManager):
         except Exception as e:
             raise ERROR_INVALID_PARAMETER_TYPE(key=key, type=date_type)
 
+    @staticmethod
+    def _delete_many(model: MongoModel, match: dict) -> int:
+        """Delete the stats matching a query in batches of ids"""
+
+        bulk_size = max(config.get_global("STATS_BULK_SIZE", 1000), 1)
+        collection = model._get_collection()
+        deleted_count = 0
+
+        while True:
+            ids = [
+                document["_id"]
+                for document in collection.find(match, {"_id": 1}).limit(bulk_size)
+            ]
+
+            if len(ids) == 0:
+                break
+
+            deleted_count += collection.delete_many({"_id": {"$in": ids}}).deleted_count
+
+            if len(ids) < bulk_size:
+                break
+
+        return deleted_count
+
     @staticmethod
     def _append_status_filter(query: dict) -> dict:
         query_filter = query.get("filter", [])
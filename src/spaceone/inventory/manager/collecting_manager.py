@@ -1,12 +1,20 @@
 import logging
+import itertools
+import random
 import time
-from typing import Generator
-from spaceone.core import utils
+from typing import Generator, List, Tuple, Union
+from spaceone.core import config, utils
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.lib.resource_manager import ResourceManager
+from spaceone.inventory.lib.match_index import MatchIndex
+from spaceone.inventory.lib.job_task_error_buffer import JobTaskErrorBuffer
+from spaceone.inventory.lib.stream_prefetcher import StreamPrefetcher
 from spaceone.inventory.manager.job_manager import JobManager
 from spaceone.inventory.manager.job_task_manager import JobTaskManager
 from spaceone.inventory.manager.collector_manager import CollectorManager
+from spaceone.inventory.manager.collection_state_manager import (
+    CollectionStateManager,
+)
 from spaceone.inventory.manager.plugin_manager import PluginManager
 from spaceone.inventory.manager.collector_plugin_manager import CollectorPluginManager
 from spaceone.inventory.manager.namespace_manager import NamespaceManager
@@ -31,6 +39,9 @@ class CollectingManager(BaseManager):
 
         self.db_queue = DB_QUEUE_NAME
         self._service_and_manager_map = {}
+        self._match_index: Union[MatchIndex, None] = None
+        self._error_buffer: Union[JobTaskErrorBuffer, None] = None
+        self._stream_prefetcher: Union[StreamPrefetcher, None] = None
 
     def collecting_resources(self, params: dict) -> bool:
         """Execute collecting task to get resources from plugin
@@ -76,105 +87,139 @@ class CollectingManager(BaseManager):
         else:
             _LOGGER.debug(f"[collecting_resources] start job task: {job_task_id}")
 
-        if not self._check_concurrency(collector_id, job_id, domain_id):
-            time.sleep(60)
-            _LOGGER.debug(f"[collecting_resources] retry sub task: {job_task_id}")
-            self.job_task_mgr.push_job_task(params)
-            return True
+        max_concurrency = self._get_max_concurrency(collector_id, domain_id)
+        lease_id = None
 
-        job_task_vo = self.job_task_mgr.get(job_task_id, domain_id)
+        if max_concurrency:
+            lease_id = self._acquire_task_slot(params, max_concurrency)
+            if lease_id is None:
+                return True
 
-        # add workspace_id to params from secret_info
-        params["workspace_id"] = secret_info["workspace_id"]
+        try:
+            job_task_vo = self.job_task_mgr.get(job_task_id, domain_id)
 
-        if self.job_mgr.check_cancel(job_id, domain_id):
-            self.job_task_mgr.add_error(
-                job_task_vo,
-                "ERROR_COLLECT_CANCELED",
-                "The job has been canceled.",
-            )
-            self.job_task_mgr.make_failure_by_vo(job_task_vo)
-            raise ERROR_COLLECT_CANCELED(job_id=job_id)
+            # add workspace_id to params from secret_info
+            params["workspace_id"] = secret_info["workspace_id"]
 
-        self.job_task_mgr.make_inprogress_by_vo(job_task_vo)
+            if self.job_mgr.check_cancel(job_id, domain_id):
+                self.job_task_mgr.add_error(
+                    job_task_vo,
+                    "ERROR_COLLECT_CANCELED",
+                    "The job has been canceled.",
+                )
+                self.job_task_mgr.make_failure_by_vo(job_task_vo)
+                raise ERROR_COLLECT_CANCELED(job_id=job_id)
 
-        try:
-            # get plugin endpoint from plugin manager
-            endpoint, updated_version = plugin_manager.get_endpoint(
-                plugin_info["plugin_id"],
-                domain_id,
-                plugin_info.get("upgrade_mode", "AUTO"),
-                plugin_info.get("version"),
-            )
+            self.job_task_mgr.make_inprogress_by_vo(job_task_vo)
+            endpoint = None
 
-            # collect data from plugin
-            resources = collector_plugin_mgr.collect(
-                endpoint,
-                plugin_info["options"],
-                secret_data.get("data", {}),
-                task_options,
-            )
+            try:
+                # get plugin endpoint from plugin manager
+                endpoint, updated_version = plugin_manager.get_endpoint(
+                    plugin_info["plugin_id"],
+                    domain_id,
+                    plugin_info.get("upgrade_mode", "AUTO"),
+                    plugin_info.get("version"),
+                )
 
-            # delete secret_data in params for security
-            del params["secret_data"]
-        except Exception as e:
-            if isinstance(e, ERROR_BASE):
-                error_message = e.message
-            else:
-                error_message = str(e)
+                # collect data from plugin
+                resources, call = collector_plugin_mgr.collect(
+                    endpoint,
+                    plugin_info["options"],
+                    secret_data.get("data", {}),
+                    task_options,
+                )
 
-            _LOGGER.error(
-                f"[collecting_resources] plugin collecting error ({job_task_id}): {error_message}",
-                exc_info=True,
-            )
-            self.job_task_mgr.add_error(
-                job_task_vo, "ERROR_COLLECTOR_PLUGIN", error_message
-            )
+                # delete secret_data in params for security
+                del params["secret_data"]
+            except Exception as e:
+                if isinstance(e, ERROR_BASE):
+                    error_message = e.message
+                else:
+                    error_message = str(e)
 
-            self.job_task_mgr.make_failure_by_vo(job_task_vo, {"failure_count": 1})
-            raise ERROR_COLLECTOR_COLLECTING(plugin_info=plugin_info)
+                _LOGGER.error(
+                    f"[collecting_resources] plugin collecting error ({job_task_id}): {error_message}",
+                    exc_info=True,
+                )
+                self._invalidate_plugin_endpoint(e, endpoint)
+                self.job_task_mgr.add_error(
+                    job_task_vo, "ERROR_COLLECTOR_PLUGIN", error_message
+                )
 
-        job_task_status = "SUCCESS"
+                self.job_task_mgr.make_failure_by_vo(job_task_vo, {"failure_count": 1})
+                raise ERROR_COLLECTOR_COLLECTING(plugin_info=plugin_info)
 
-        try:
-            collecting_count_info = self._upsert_collecting_resources(
-                resources, params, job_task_vo
-            )
+            job_task_status = "SUCCESS"
 
-            if collecting_count_info["failure_count"] > 0:
+            try:
+                collecting_count_info = self._upsert_collecting_resources(
+                    resources, params, job_task_vo, call
+                )
+
+                if collecting_count_info["failure_count"] > 0:
+                    job_task_status = "FAILURE"
+
+            except Exception as e:
+                if isinstance(e, ERROR_BASE):
+                    error_message = e.message
+                else:
+                    error_message = str(e)
+
+                _LOGGER.error(
+                    f"[collecting_resources] upsert resources error ({job_task_id}): {error_message}",
+                    exc_info=True,
+                )
+                self._invalidate_plugin_endpoint(e, endpoint)
+                self.job_task_mgr.add_error(
+                    job_task_vo, "ERROR_COLLECTOR_PLUGIN", error_message
+                )
                 job_task_status = "FAILURE"
+                collecting_count_info = {"failure_count": 1}
 
-        except Exception as e:
-            if isinstance(e, ERROR_BASE):
-                error_message = e.message
-            else:
-                error_message = str(e)
+            finally:
+                self._flush_errors(job_task_vo)
 
-            _LOGGER.error(
-                f"[collecting_resources] upsert resources error ({job_task_id}): {error_message}",
-                exc_info=True,
-            )
-            self.job_task_mgr.add_error(
-                job_task_vo, "ERROR_COLLECTOR_PLUGIN", error_message
+            _LOGGER.debug(
+                f"[collecting_resources] job task summary ({job_task_id}: {job_task_status}) "
+                f"=> {collecting_count_info}"
             )
-            job_task_status = "FAILURE"
-            collecting_count_info = {"failure_count": 1}
 
-        _LOGGER.debug(
-            f"[collecting_resources] job task summary ({job_task_id}: {job_task_status}) "
-            f"=> {collecting_count_info}"
-        )
+            if self._match_index:
+                _LOGGER.debug(
+                    f"[collecting_resources] job task match index summary ({job_task_id}) "
+                    f"=> {self._match_index.get_stats()}"
+                )
+                collecting_count_info.update(self._match_index.get_summary())
 
-        if job_task_status == "SUCCESS":
-            self.job_task_mgr.decrease_remained_sub_tasks(
-                job_task_vo, collecting_count_info
-            )
-        else:
-            self.job_task_mgr.make_failure_by_vo(job_task_vo, collecting_count_info)
+            if self._stream_prefetcher:
+                _LOGGER.debug(
+                    f"[collecting_resources] job task stream summary ({job_task_id}) "
+                    f"=> {self._stream_prefetcher.get_stats()}"
+                )
+
+            if job_task_status == "SUCCESS":
+                self.job_task_mgr.decrease_remained_sub_tasks(
+                    job_task_vo, collecting_count_info
+                )
+            else:
+                self.job_task_mgr.make_failure_by_vo(job_task_vo, collecting_count_info)
+        finally:
+            if lease_id:
+                self.job_mgr.release_task_slot(job_id, domain_id, lease_id)
 
         return True
 
-    def _check_concurrency(self, collector_id: str, job_id: str, domain_id: str):
+    @staticmethod
+    def _invalidate_plugin_endpoint(error: Exception, endpoint: str = None) -> None:
+        # the plugin may be moved to another endpoint
+        if endpoint and isinstance(error, ERROR_GRPC_CONNECTION):
+            PluginManager.invalidate_endpoint(endpoint)
+            CollectorPluginManager.release_plugin_connector(endpoint)
+
+    def _get_max_concurrency(
+        self, collector_id: str, domain_id: str
+    ) -> Union[int, None]:
         collector_mgr: CollectorManager = self.locator.get_manager(CollectorManager)
         try:
             collector_vo = collector_mgr.get_collector(collector_id, domain_id)
@@ -182,27 +227,105 @@ class CollectingManager(BaseManager):
             metadata = plugin_info.get("metadata", {})
         except Exception as e:
             _LOGGER.warning(
-                f"[_check_concurrency] failed to get collector metadata: {e}"
+                f"[_get_max_concurrency] failed to get collector metadata: {e}"
             )
             metadata = {}
 
         max_concurrency = metadata.get("concurrency")
         if max_concurrency and isinstance(max_concurrency, int):
-            job_task_vos = self.job_task_mgr.filter_job_tasks(
-                job_id=job_id, domain_id=domain_id, status="IN_PROGRESS"
-            )
-            current_concurrency = job_task_vos.count()
-            if job_task_vos.count() >= max_concurrency:
+            return max_concurrency
+
+        return None
+
+    def _acquire_task_slot(
+        self, params: dict, max_concurrency: int
+    ) -> Union[str, None]:
+        """Acquire a slot of the job for the job task, or push it again to retry later
+        Args:
+            params (dict): same as collecting_resources
+            max_concurrency (int): max number of running job tasks in the job
+
+        Returns:
+            lease_id (str): lease of the slot, or None if the job task is not admitted
+        """
+
+        job_id = params["job_id"]
+        job_task_id = params["job_task_id"]
+        domain_id = params["domain_id"]
+        admission = params.get("admission", {})
+        lease_id = utils.generate_id("task-lease")
+        now = time.time()
+
+        is_acquired = self.job_mgr.acquire_task_slot(
+            job_id, domain_id, max_concurrency, lease_id
+        )
+
+        if not is_acquired:
+            try:
+                job_vo = self.job_mgr.get_job(job_id, domain_id)
+            except Exception as e:
+                _LOGGER.warning(
+                    f"[_acquire_task_slot] drop job task ({job_task_id}): {e}"
+                )
+                return None
+
+            if job_vo.status != "IN_PROGRESS":
+                # the job is canceled or timed out while the job task is waiting
                 _LOGGER.debug(
-                    f"[_check_concurrency] job task concurrency exceeded ({job_id}): "
-                    f"{current_concurrency}/{max_concurrency}"
+                    f"[_acquire_task_slot] drop job task ({job_task_id}): "
+                    f"job status = {job_vo.status}"
                 )
-                return False
+                return None
 
-        return True
+            if self.job_mgr.release_expired_task_slots(job_vo) > 0:
+                is_acquired = self.job_mgr.acquire_task_slot(
+                    job_id, domain_id, max_concurrency, lease_id
+                )
+
+        if is_acquired:
+            if admission:
+                wait_time = now - admission["rejected_at"]
+                self.job_task_mgr.add_admission_info(
+                    job_task_id, domain_id, wait_time=wait_time
+                )
+                _LOGGER.debug(
+                    f"[_acquire_task_slot] job task admitted ({job_task_id}): "
+                    f"rejected_count = {admission['attempt']}, "
+                    f"wait_time = {wait_time:.1f}s"
+                )
+
+            return lease_id
+
+        attempt = admission.get("attempt", 0) + 1
+        retry_interval = min(
+            ADMISSION_RETRY_INTERVAL * 2 ** (attempt - 1),
+            ADMISSION_MAX_RETRY_INTERVAL,
+        )
+        params["admission"] = {
+            "attempt": attempt,
+            "rejected_at": admission.get("rejected_at", now),
+        }
+
+        self.job_task_mgr.add_admission_info(job_task_id, domain_id, rejected_count=1)
+
+        _LOGGER.debug(
+            f"[_acquire_task_slot] job task concurrency exceeded ({job_id}): "
+            f"job_task_id = {job_task_id}, max_concurrency = {max_concurrency}, "
+            f"rejected_count = {attempt}, retry_interval = {retry_interval}s"
+        )
+
+        # Workers handle other tasks until the job task is pushed again
+        self.job_task_mgr.push_job_task(
+            params, delay=retry_interval * random.uniform(0.8, 1.2)
+        )
+        return None
 
     def _upsert_collecting_resources(
-        self, resources: Generator[dict, None, None], params: dict, job_task_vo: JobTask
+        self,
+        resources: Generator[dict, None, None],
+        params: dict,
+        job_task_vo: JobTask,
+        call: any = None,
     ):
         """
         Args:
@@ -223,7 +346,23 @@ class CollectingManager(BaseManager):
         failure_count = 0
         total_count = 0
 
+        batch_size = config.get_global("COLLECTING_BATCH_SIZE", 0)
+        cloud_service_batch = []
+
         self._set_transaction_meta(params)
+        self._match_index = self._make_match_index(params)
+
+        if (buffer_size := config.get_global("COLLECTING_STREAM_BUFFER_SIZE", 0)) > 0:
+            # the plugin stream is read while the resources are upserted
+            resources = self._stream_prefetcher = StreamPrefetcher(
+                resources, buffer_size, name=params["job_task_id"], call=call
+            )
+        self._error_buffer = JobTaskErrorBuffer(
+            params["job_task_id"],
+            JOB_TASK_ERROR_MAX_GROUPS,
+            JOB_TASK_ERROR_MAX_SAMPLES,
+            config.get_global("JOB_TASK_ERROR_DETAIL", False),
+        )
 
         for resource_data in resources:
             resource_type = resource_data.get("resource_type")
@@ -233,6 +372,17 @@ class CollectingManager(BaseManager):
                 if resource_type in ["inventory.Namespace", "inventory.Metric"]:
                     self._upsert_metric_and_namespace(resource_data, params)
                     total_count -= 1
+                elif resource_type == "inventory.CloudService" and batch_size > 1:
+                    cloud_service_batch.append(resource_data)
+
+                    if len(cloud_service_batch) >= batch_size:
+                        batch_results = self._upsert_cloud_service_batch(
+                            cloud_service_batch, params, job_task_vo
+                        )
+                        created_count += batch_results.count(CREATED)
+                        updated_count += batch_results.count(UPDATED)
+                        failure_count += batch_results.count(ERROR)
+                        cloud_service_batch = []
                 else:
                     upsert_result = self._upsert_resource(
                         resource_data, params, job_task_vo
@@ -250,11 +400,11 @@ class CollectingManager(BaseManager):
                         failure_count += 1
 
             except Exception as e:
-                _LOGGER.error(
+                _LOGGER.debug(
                     f"[_upsert_collecting_resources] upsert resource error: {e}",
                     exc_info=True,
                 )
-                self.job_task_mgr.add_error(
+                self._add_error(
                     job_task_vo,
                     "ERROR_UNKNOWN",
                     f"failed to upsert {resource_type}: {e}",
@@ -262,6 +412,14 @@ class CollectingManager(BaseManager):
                 )
                 failure_count += 1
 
+        if len(cloud_service_batch) > 0:
+            batch_results = self._upsert_cloud_service_batch(
+                cloud_service_batch, params, job_task_vo
+            )
+            created_count += batch_results.count(CREATED)
+            updated_count += batch_results.count(UPDATED)
+            failure_count += batch_results.count(ERROR)
+
         return {
             "total_count": total_count,
             "created_count": created_count,
@@ -360,11 +518,9 @@ class CollectingManager(BaseManager):
             3: ERROR
         """
 
-        job_task_id = params["job_task_id"]
         domain_id = params["domain_id"]
         workspace_id = params["workspace_id"]
         resource_type = resource_data.get("resource_type")
-        resource_state = resource_data.get("state")
         match_rules = resource_data.get("match_rules")
         request_data = resource_data.get("resource", {})
         request_data["domain_id"] = domain_id
@@ -374,111 +530,381 @@ class CollectingManager(BaseManager):
 
         response = ERROR
 
+        if not self._check_resource_data(resource_data, params, job_task_vo):
+            return ERROR
+
+        match_result = self._match_resource(
+            request_data, match_rules, resource_type, manager, params, job_task_vo
+        )
+
+        if match_result is None:
+            return ERROR
+
+        match_resource, total_count = match_result
+
+        try:
+            if total_count == 0:
+                # Create resource
+                service.create_resource(request_data)
+                response = CREATED
+            elif total_count == 1:
+                # Update resource
+                request_data.update(match_resource[0])
+                service.update_resource(request_data)
+                response = UPDATED
+
+                if self._match_index and resource_type == "inventory.CloudService":
+                    # request_data is changed by the service
+                    self._match_index.discard(match_resource[0]["cloud_service_id"])
+            else:
+                response = ERROR
+
+        except Exception as e:
+            self._add_upsert_error(
+                e, resource_type, total_count, request_data, params, job_task_vo
+            )
+            response = ERROR
+
+        finally:
+            if response in [CREATED, UPDATED]:
+                if resource_type in ["inventory.CloudServiceType", "inventory.Region"]:
+                    response = NOT_COUNT
+
+            return response
+
+    def _upsert_cloud_service_batch(
+        self, resources: List[dict], params: dict, job_task_vo: JobTask
+    ) -> List[int]:
+        """Upsert cloud services in batch
+        Args:
+            resources (list): list of cloud service resources from plugin
+            params(dict): same as _upsert_resource
+
+        Returns:
+            results (list): upsert result (CREATED, UPDATED or ERROR) per resource
+        """
+
+        domain_id = params["domain_id"]
+        workspace_id = params["workspace_id"]
+        resource_type = "inventory.CloudService"
+
+        service, manager = self._get_resource_map(resource_type)
+
+        results = [ERROR] * len(resources)
+        create_requests = []
+        update_requests = []
+        deferred_indexes = []
+        created_match_keys = set()
+        updated_cloud_service_ids = set()
+        match_requests = []
+
+        for idx, resource_data in enumerate(resources):
+            request_data = resource_data.get("resource", {})
+            request_data["domain_id"] = domain_id
+            request_data["workspace_id"] = workspace_id
+
+            if self._check_resource_data(resource_data, params, job_task_vo):
+                match_requests.append(
+                    (idx, request_data, resource_data.get("match_rules"))
+                )
+
+        try:
+            match_results = self._query_with_match_rules_in_batch(
+                [
+                    (request_data, match_rules)
+                    for idx, request_data, match_rules in match_requests
+                ],
+                domain_id,
+                workspace_id,
+                manager,
+                self._match_index,
+            )
+        except Exception as e:
+            match_results = [e] * len(match_requests)
+
+        for (idx, request_data, match_rules), match_result in zip(
+            match_requests, match_results
+        ):
+            if isinstance(match_result, Exception):
+                self._add_match_error(match_result, resource_type, params, job_task_vo)
+                continue
+
+            match_resource, total_count = match_result
+
+            if total_count == 0:
+                match_keys = self._make_match_keys(request_data, match_rules)
+
+                # A resource matching another new resource of this batch is
+                # upserted after the batch is written, same as sequential upsert.
+                if created_match_keys & match_keys:
+                    deferred_indexes.append(idx)
+                else:
+                    created_match_keys |= match_keys
+                    create_requests.append((idx, request_data))
+
+            elif total_count == 1:
+                cloud_service_id = match_resource[0]["cloud_service_id"]
+
+                if cloud_service_id in updated_cloud_service_ids:
+                    deferred_indexes.append(idx)
+                else:
+                    updated_cloud_service_ids.add(cloud_service_id)
+                    request_data.update(match_resource[0])
+                    update_requests.append((idx, request_data))
+
+        for requests, method, response, total_count in [
+            (create_requests, service.create_resources, CREATED, 0),
+            (update_requests, service.update_resources, UPDATED, 1),
+        ]:
+            if len(requests) == 0:
+                continue
+
+            try:
+                upsert_results = method(
+                    [request_data for idx, request_data in requests]
+                )
+            except Exception as e:
+                upsert_results = [e] * len(requests)
+
+            for (idx, request_data), upsert_result in zip(requests, upsert_results):
+                if isinstance(upsert_result, Exception):
+                    self._add_upsert_error(
+                        upsert_result,
+                        resource_type,
+                        total_count,
+                        request_data,
+                        params,
+                        job_task_vo,
+                    )
+                else:
+                    results[idx] = response
+
+                    if response == UPDATED and self._match_index:
+                        self._match_index.discard(request_data["cloud_service_id"])
+
+        if len(deferred_indexes) > 0:
+            deferred_results = self._upsert_cloud_service_batch(
+                [resources[idx] for idx in deferred_indexes], params, job_task_vo
+            )
+
+            for idx, deferred_result in zip(deferred_indexes, deferred_results):
+                results[idx] = deferred_result
+
+        return results
+
+    def _check_resource_data(
+        self, resource_data: dict, params: dict, job_task_vo: JobTask
+    ) -> bool:
+        job_task_id = params["job_task_id"]
+        resource_type = resource_data.get("resource_type")
+        resource_state = resource_data.get("state")
+        match_rules = resource_data.get("match_rules")
+        request_data = resource_data.get("resource", {})
+
         if resource_state == "FAILURE":
             error_message = resource_data.get("message", "Unknown error.")
-            _LOGGER.error(
+            _LOGGER.debug(
                 f"[_upsert_resource] plugin response error ({job_task_id}): {error_message}"
             )
 
-            self.job_task_mgr.add_error(
-                job_task_vo, "ERROR_PLUGIN", error_message, request_data
-            )
+            self._add_error(job_task_vo, "ERROR_PLUGIN", error_message, request_data)
 
-            return ERROR
+            return False
 
         if not match_rules:
             error_message = "Match rule is not defined."
-            _LOGGER.error(
+            _LOGGER.debug(
                 f"[_upsert_resource] match rule error ({job_task_id}): {error_message}"
             )
-            self.job_task_mgr.add_error(
+            self._add_error(
                 job_task_vo,
                 "ERROR_MATCH_RULE",
                 error_message,
                 {"resource_type": resource_type},
             )
-            return ERROR
+            return False
+
+        return True
+
+    def _match_resource(
+        self,
+        request_data: dict,
+        match_rules: dict,
+        resource_type: str,
+        manager: ResourceManager,
+        params: dict,
+        job_task_vo: JobTask,
+    ) -> Union[Tuple[list, int], None]:
+        if resource_type == "inventory.CloudService":
+            match_index = self._match_index
+        else:
+            match_index = None
 
         try:
-            match_resource, total_count = self._query_with_match_rules(
-                request_data, match_rules, domain_id, workspace_id, manager
+            return self._query_with_match_rules(
+                request_data,
+                match_rules,
+                params["domain_id"],
+                params["workspace_id"],
+                manager,
+                match_index,
             )
+        except Exception as e:
+            self._add_match_error(e, resource_type, params, job_task_vo)
 
-        except ERROR_TOO_MANY_MATCH as e:
-            _LOGGER.error(
-                f"[_upsert_resource] match resource error ({job_task_id}): {e}"
+        return None
+
+    def _add_match_error(
+        self, error: Exception, resource_type: str, params: dict, job_task_vo: JobTask
+    ) -> None:
+        job_task_id = params["job_task_id"]
+
+        if isinstance(error, ERROR_TOO_MANY_MATCH):
+            _LOGGER.debug(
+                f"[_upsert_resource] match resource error ({job_task_id}): {error}"
             )
-            self.job_task_mgr.add_error(
+            self._add_error(
                 job_task_vo,
-                e.error_code,
-                e.message,
+                error.error_code,
+                error.message,
                 {"resource_type": resource_type},
             )
-            return ERROR
-        except Exception as e:
-            if isinstance(e, ERROR_BASE):
-                error_message = e.message
+        else:
+            if isinstance(error, ERROR_BASE):
+                error_message = error.message
             else:
-                error_message = str(e)
+                error_message = str(error)
 
-            _LOGGER.error(
+            _LOGGER.debug(
                 f"[_upsert_resource] match resource error ({job_task_id}): {error_message}",
                 exc_info=True,
             )
-            self.job_task_mgr.add_error(
+            self._add_error(
                 job_task_vo,
                 "ERROR_UNKNOWN",
                 f"Failed to match resource: {error_message}",
                 {"resource_type": resource_type},
             )
-            return ERROR
 
-        try:
-            if total_count == 0:
-                # Create resource
-                service.create_resource(request_data)
-                response = CREATED
-            elif total_count == 1:
-                # Update resource
-                request_data.update(match_resource[0])
-                service.update_resource(request_data)
-                response = UPDATED
-            else:
-                response = ERROR
+    def _add_upsert_error(
+        self,
+        error: Exception,
+        resource_type: str,
+        total_count: int,
+        request_data: dict,
+        params: dict,
+        job_task_vo: JobTask,
+    ) -> None:
+        job_task_id = params["job_task_id"]
 
-        except ERROR_BASE as e:
-            _LOGGER.error(
-                f"[_upsert_resource] resource upsert error ({job_task_id}): {e.message}"
+        if isinstance(error, ERROR_BASE):
+            _LOGGER.debug(
+                f"[_upsert_resource] resource upsert error ({job_task_id}): {error.message}"
             )
             additional = self._set_error_addition_info(
                 resource_type, total_count, request_data
             )
-            self.job_task_mgr.add_error(
-                job_task_vo, e.error_code, e.message, additional
-            )
-            response = ERROR
-
-        except Exception as e:
-            error_message = str(e)
+            self._add_error(job_task_vo, error.error_code, error.message, additional)
+        else:
+            error_message = str(error)
 
             _LOGGER.debug(
                 f"[_upsert_resource] unknown error ({job_task_id}): {error_message}",
                 exc_info=True,
             )
-            self.job_task_mgr.add_error(
+            self._add_error(
                 job_task_vo,
                 "ERROR_UNKNOWN",
                 error_message,
                 {"resource_type": resource_type},
             )
-            response = ERROR
 
-        finally:
-            if response in [CREATED, UPDATED]:
-                if resource_type in ["inventory.CloudServiceType", "inventory.Region"]:
-                    response = NOT_COUNT
+    def _add_error(
+        self,
+        job_task_vo: JobTask,
+        error_code: str,
+        error_message: str,
+        additional: dict = None,
+    ) -> None:
+        if self._error_buffer is None:
+            self.job_task_mgr.add_error(
+                job_task_vo, error_code, error_message, additional
+            )
+            return
 
-            return response
+        self._error_buffer.add(error_code, error_message, additional)
+
+        if len(self._error_buffer.details) >= JOB_TASK_ERROR_DETAIL_CHUNK_SIZE:
+            self.job_task_mgr.flush_error_details(job_task_vo, self._error_buffer)
+
+    def _flush_errors(self, job_task_vo: JobTask) -> None:
+        if self._error_buffer is None:
+            return
+
+        error_count = len(self._error_buffer)
+
+        try:
+            self.job_task_mgr.flush_errors(job_task_vo, self._error_buffer)
+        except Exception as e:
+            _LOGGER.error(
+                f"[_flush_errors] failed to write errors ({job_task_vo.job_task_id}): {e}",
+                exc_info=True,
+            )
+
+        if error_count > 0:
+            _LOGGER.debug(
+                f"[_flush_errors] job task errors ({job_task_vo.job_task_id}): "
+                f"error_count = {error_count}"
+            )
+
+    @staticmethod
+    def _make_match_keys(resource_data: dict, match_rules: dict) -> set:
+        match_keys = set()
+        match_rules = rule_matcher.dict_key_int_parser(match_rules)
+
+        for order, rules in match_rules.items():
+            values = tuple(
+                (rule, str(rule_matcher.find_data(resource_data, rule)))
+                for rule in rules
+                if rule_matcher.find_data(resource_data, rule)
+            )
+
+            if len(values) > 0:
+                match_keys.add((order, values))
+
+        return match_keys
+
+    def _make_match_index(self, params: dict) -> Union[MatchIndex, None]:
+        max_size = config.get_global("COLLECTING_MATCH_INDEX_SIZE", 0)
+
+        if max_size <= 0:
+            return None
+
+        domain_id = params["domain_id"]
+        state_mgr: CollectionStateManager = self.locator.get_manager(
+            CollectionStateManager
+        )
+        state_vos = state_mgr.filter_collection_states(
+            collector_id=params["collector_id"],
+            secret_id=params["secret_info"]["secret_id"],
+            domain_id=domain_id,
+        )
+
+        state_count = state_vos.count()
+        if state_count == 0 or state_count > max_size:
+            _LOGGER.debug(
+                f"[_make_match_index] skip match index ({params['job_task_id']}): "
+                f"{state_count}/{max_size}"
+            )
+            return None
+
+        service, manager = self._get_resource_map("inventory.CloudService")
+        return MatchIndex(
+            manager,
+            state_vos.distinct("cloud_service_id"),
+            domain_id,
+            params["workspace_id"],
+        )
 
     def _set_transaction_meta(self, params):
         secret_info = params["secret_info"]
@@ -548,12 +974,14 @@ class CollectingManager(BaseManager):
         domain_id: str,
         workspace_id: str,
         resource_manager: ResourceManager,
+        match_index: MatchIndex = None,
     ):
         """match resource based on match rules
 
         Args:
             resource_data (dict): resource data from plugin
             match_rules (list): e.g. {1:['reference.resource_id'], 2:['name']}
+            match_index (MatchIndex): in-memory index checked before the database
 
         Return:
             match_resource (dict) : resource_id for update (e.g. {'cloud_service_id': 'cloud-svc-abcde12345'})
@@ -566,6 +994,12 @@ class CollectingManager(BaseManager):
         match_rules = rule_matcher.dict_key_int_parser(match_rules)
 
         for order in sorted(match_rules.keys()):
+            if match_index:
+                if index_resource := match_index.find(
+                    match_rules[order], resource_data
+                ):
+                    return index_resource, 1
+
             query = rule_matcher.make_query(
                 order, match_rules, resource_data, domain_id, workspace_id
             )
@@ -582,3 +1016,139 @@ class CollectingManager(BaseManager):
                 return match_resource, total_count
 
         return match_resource, total_count
+
+    @staticmethod
+    def _query_with_match_rules_in_batch(
+        resources: List[Tuple[dict, dict]],
+        domain_id: str,
+        workspace_id: str,
+        resource_manager: ResourceManager,
+        match_index: MatchIndex = None,
+    ) -> List[Union[Tuple[list, int], Exception]]:
+        """match resources in batch based on match rules
+
+        Resources are grouped by match rule order and matched keys, and each group
+        is resolved with a single query ('in' operator for the values of the group).
+        Only resources that didn't match fall through to the next order.
+
+        Args:
+            resources (list): [(resource_data, match_rules), ...]
+
+        Return:
+            results (list): (match_resource, total_count) or ERROR_TOO_MANY_MATCH per resource
+        """
+
+        results = [([], 0)] * len(resources)
+        match_rules_list = []
+        orders = set()
+
+        for resource_data, match_rules in resources:
+            match_rules = rule_matcher.dict_key_int_parser(match_rules)
+            match_rules_list.append(match_rules)
+            orders.update(match_rules.keys())
+
+        remained_indexes = list(range(len(resources)))
+
+        for order in sorted(orders):
+            groups = {}
+            next_indexes = []
+
+            for idx in remained_indexes:
+                resource_data = resources[idx][0]
+                match_rules = match_rules_list[idx]
+
+                if order not in match_rules:
+                    next_indexes.append(idx)
+                    continue
+
+                if match_index:
+                    if index_resource := match_index.find(
+                        match_rules[order], resource_data
+                    ):
+                        results[idx] = (index_resource, 1)
+                        continue
+
+                rules = []
+                values = []
+                for rule in match_rules[order]:
+                    if value := rule_matcher.find_data(resource_data, rule):
+                        rules.append(rule)
+                        values.append(value)
+
+                if len(rules) > 0 and all(
+                    isinstance(value, (str, int, float)) for value in values
+                ):
+                    groups.setdefault(tuple(rules), []).append((idx, tuple(values)))
+                else:
+                    # not able to match in batch, find resources one by one
+                    query = rule_matcher.make_query(
+                        order, match_rules, resource_data, domain_id, workspace_id
+                    )
+                    match_resource, total_count = resource_manager.find_resources(query)
+                    groups.setdefault(None, []).append(
+                        (idx, (match_resource, total_count))
+                    )
+
+            for rules, group in groups.items():
+                if rules is None:
+                    matched = group
+                else:
+                    query = rule_matcher.make_batch_query(
+                        list(rules),
+                        [values for idx, values in group],
+                        domain_id,
+                        workspace_id,
+                    )
+                    match_map = CollectingManager._make_match_map(
+                        resource_manager, query, list(rules)
+                    )
+
+                    matched = []
+                    for idx, values in group:
+                        match_resource = list(match_map.get(values, {}).values())
+                        matched.append((idx, (match_resource, len(match_resource))))
+
+                for idx, (match_resource, total_count) in matched:
+                    resource_data = resources[idx][0]
+                    results[idx] = (match_resource, total_count)
+
+                    if total_count > 1:
+                        if data := resource_data.get("data"):
+                            results[idx] = ERROR_TOO_MANY_MATCH(
+                                match_key=match_rules_list[idx][order],
+                                resources=match_resource,
+                                more=data,
+                            )
+                        else:
+                            next_indexes.append(idx)
+                    elif total_count == 0:
+                        next_indexes.append(idx)
+
+            remained_indexes = next_indexes
+
+        return results
+
+    @staticmethod
+    def _make_match_map(
+        resource_manager: ResourceManager, query: dict, rules: List[str]
+    ) -> dict:
+        """
+        Return:
+            match_map (dict): {(value of rule, ...): {resource_key: resource}}
+        """
+
+        match_map = {}
+        for resource, key_values in resource_manager.find_resources_by_match_keys(
+            query, rules
+        ):
+            # array field matches each of its values, same as 'eq' query
+            values_list = []
+            for rule in rules:
+                value = key_values[rule]
+                values_list.append(value if isinstance(value, list) else [value])
+
+            resource_key = tuple(resource.values())
+            for values in itertools.product(*values_list):
+                match_map.setdefault(values, {})[resource_key] = resource
+
+        return match_map
@@ -4,6 +4,7 @@ from typing import Union, Tuple, List
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.model.collection_state_model import CollectionState
+from spaceone.inventory.lib import bulk_writer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +39,71 @@ class CollectionStateManager(BaseManager):
             state_vo = self.collection_state_model.create(state_data)
             self.transaction.add_rollback(_rollback, state_vo)
 
+    def create_collection_states(
+        self, cloud_service_ids: List[str], domain_id: str
+    ) -> None:
+        def _rollback(state_ids: list):
+            _LOGGER.info(
+                f"[ROLLBACK] Delete collection states: collector_id = {self.collector_id}, "
+                f"count = {len(state_ids)}"
+            )
+            self.filter_collection_states(pk=state_ids).delete()
+
+        if self.collector_id and self.job_task_id and self.secret_id:
+            state_data_list = [
+                {
+                    "collector_id": self.collector_id,
+                    "job_task_id": self.job_task_id,
+                    "secret_id": self.secret_id,
+                    "cloud_service_id": cloud_service_id,
+                    "domain_id": domain_id,
+                }
+                for cloud_service_id in cloud_service_ids
+            ]
+
+            results = bulk_writer.insert_many(
+                self.collection_state_model, state_data_list
+            )
+            state_ids = [vo.pk for vo in results if isinstance(vo, CollectionState)]
+
+            if len(state_ids) > 0:
+                self.transaction.add_rollback(_rollback, state_ids)
+
+    def reset_collection_states(
+        self, cloud_service_ids: List[str], domain_id: str
+    ) -> None:
+
+        def _rollback(state_ids: list):
+            _LOGGER.info(
+                f"[ROLLBACK] Delete collection states: collector_id = {self.collector_id}, "
+                f"count = {len(state_ids)}"
+            )
+            self.filter_collection_states(pk=state_ids).delete()
+
+        if not (self.collector_id and self.job_task_id and self.secret_id):
+            return
+
+        if len(cloud_service_ids) == 0:
+            return
+
+        # Reset existing states and create missing ones in a single bulk write
+        state_ids = bulk_writer.upsert_many(
+            self.collection_state_model,
+            [
+                {
+                    "collector_id": self.collector_id,
+                    "secret_id": self.secret_id,
+                    "cloud_service_id": cloud_service_id,
+                    "domain_id": domain_id,
+                }
+                for cloud_service_id in set(cloud_service_ids)
+            ],
+            {"disconnected_count": 0, "job_task_id": self.job_task_id},
+        )
+
+        if len(state_ids) > 0:
+            self.transaction.add_rollback(_rollback, state_ids)
+
     def update_collection_state_by_vo(
         self, params: dict, state_vo: CollectionState
     ) -> CollectionState:
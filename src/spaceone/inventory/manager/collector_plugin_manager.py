@@ -1,5 +1,8 @@
+import inspect
 import logging
-from typing import Generator, Union
+from typing import Dict, Generator, Tuple, Union
+
+import grpc
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
 
@@ -7,18 +10,17 @@ __ALL__ = ["CollectorPluginManager"]
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connectors of plugin endpoints are reused by all tasks of the process
+_PLUGIN_CONNECTORS: Dict[Tuple[str, str], SpaceConnector] = {}
+
 
 class CollectorPluginManager(BaseManager):
     def init_plugin(self, endpoint: str, options: dict) -> dict:
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
+        plugin_connector = self._get_plugin_connector(endpoint)
         return plugin_connector.dispatch("Collector.init", {"options": options})
 
     def verify_plugin(self, endpoint: str, options: dict, secret_data: dict) -> None:
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
+        plugin_connector = self._get_plugin_connector(endpoint)
         params = {"options": options, "secret_data": secret_data}
         plugin_connector.dispatch("Collector.verify", params)
 
@@ -28,22 +30,69 @@ class CollectorPluginManager(BaseManager):
         options: dict,
         secret_data: dict,
         task_options: dict = None,
-    ) -> Generator[dict, None, None]:
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
+    ) -> Tuple[Generator[dict, None, None], Union[grpc.Call, None]]:
+        """Collect resources from the plugin
+
+        Returns:
+            resources (Generator): resources of the response stream
+            call (grpc.Call): gRPC call of the stream to cancel it (None if unknown)
+        """
+
+        plugin_connector = self._get_plugin_connector(endpoint, return_type="grpc")
 
         params = {"options": options, "secret_data": secret_data, "filter": {}}
 
         if task_options:
             params["task_options"] = task_options
 
-        return plugin_connector.dispatch("Collector.collect", params)
+        response_iterator = plugin_connector.dispatch("Collector.collect", params)
+        return (
+            self._generate_resources(response_iterator),
+            self._get_call(response_iterator),
+        )
 
     def get_tasks(self, endpoint: str, secret_data: dict, options: dict) -> dict:
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
+        plugin_connector = self._get_plugin_connector(endpoint)
 
         params = {"options": options, "secret_data": secret_data}
         return plugin_connector.dispatch("Job.get_tasks", params)
+
+    def _get_plugin_connector(
+        self, endpoint: str, return_type: str = "dict"
+    ) -> SpaceConnector:
+        key = (endpoint, return_type)
+
+        if key not in _PLUGIN_CONNECTORS:
+            _PLUGIN_CONNECTORS[key] = self.locator.get_connector(
+                "SpaceConnector",
+                endpoint=endpoint,
+                token="NO_TOKEN",
+                return_type=return_type,
+            )
+
+        return _PLUGIN_CONNECTORS[key]
+
+    @staticmethod
+    def _generate_resources(response_iterator) -> Generator[dict, None, None]:
+        for response in response_iterator:
+            yield SpaceConnector._change_message(response)
+
+    @staticmethod
+    def _get_call(response_iterator) -> Union[grpc.Call, None]:
+        if isinstance(response_iterator, grpc.Call):
+            return response_iterator
+
+        # the call is passed to the generator checking errors of the gRPC client
+        if inspect.isgenerator(response_iterator):
+            call = inspect.getgeneratorlocals(response_iterator).get(
+                "response_iterator"
+            )
+            if isinstance(call, grpc.Call):
+                return call
+
+        return None
+
+    @staticmethod
+    def release_plugin_connector(endpoint: str) -> None:
+        for return_type in ["dict", "grpc"]:
+            _PLUGIN_CONNECTORS.pop((endpoint, return_type), None)
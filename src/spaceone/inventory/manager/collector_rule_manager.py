@@ -1,17 +1,17 @@
 import logging
 import functools
-from typing import Tuple
-from spaceone.core import utils
+from typing import Dict, List, Tuple, Union
+from spaceone.core import config, utils
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.core.manager import BaseManager
+from spaceone.inventory.lib.collector_rule_program import CollectorRuleProgram
 from spaceone.inventory.manager.identity_manager import IdentityManager
-from spaceone.inventory.model.collector_rule_model import (
-    CollectorRule,
-    CollectorRuleCondition,
-)
+from spaceone.inventory.model.collector_rule_model import CollectorRule
 
 _LOGGER = logging.getLogger(__name__)
 
+_PREFETCH_CHUNK_SIZE = 1000
+
 
 class CollectorRuleManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -23,6 +23,8 @@ class CollectorRuleManager(BaseManager):
         self._project_info = {}
         self._service_account_info = {}
         self._collector_rule_info = {}
+        self._domain_projects = {}
+        self._domain_service_accounts = {}
 
     def create_collector_rule(self, params: dict) -> CollectorRule:
         def _rollback(vo: CollectorRule):
@@ -80,38 +82,115 @@ class CollectorRuleManager(BaseManager):
     def change_cloud_service_data(
         self, collector_id: str, domain_id: str, cloud_service_data: dict
     ) -> dict:
-        (
-            managed_collector_rule_vos,
-            custom_collector_rule_vos,
-        ) = self._get_collector_rules(collector_id, domain_id)
+        managed_program, custom_program = self._get_collector_rule_programs(
+            collector_id, domain_id
+        )
+        change_fn = functools.partial(
+            self._change_cloud_service_data_with_actions, domain_id=domain_id
+        )
+
+        cloud_service_data = managed_program.apply(cloud_service_data, change_fn)
+        cloud_service_data = custom_program.apply(cloud_service_data, change_fn)
+
+        return cloud_service_data
 
-        cloud_service_data = self._apply_collector_rule_to_cloud_service_data(
-            cloud_service_data, managed_collector_rule_vos, domain_id
+    def change_cloud_service_data_list(
+        self, collector_id: str, domain_id: str, cloud_service_data_list: List[dict]
+    ) -> List[Union[dict, Exception]]:
+        managed_program, custom_program = self._get_collector_rule_programs(
+            collector_id, domain_id
+        )
+        change_fn = functools.partial(
+            self._change_cloud_service_data_with_actions, domain_id=domain_id
         )
 
-        cloud_service_data = self._apply_collector_rule_to_cloud_service_data(
-            cloud_service_data, custom_collector_rule_vos, domain_id
+        results = managed_program.apply_many(cloud_service_data_list, change_fn)
+        results = custom_program.apply_many(results, change_fn)
+
+        return results
+
+    def prefetch_targets(
+        self, collector_id: str, domain_id: str, cloud_service_data_list: List[dict]
+    ) -> None:
+        """resolve the projects and service accounts of rule actions in advance
+
+        Every distinct value used by change_project, match_project and
+        match_service_account actions in the resources is resolved with one
+        'in' query per target key, or with all projects and service accounts
+        of the domain if the domain is small enough (COLLECTOR_RULE_WARM_DOMAIN_SIZE).
+        Results are cached in the same way as _get_project() and _get_service_account().
+        """
+
+        managed_program, custom_program = self._get_collector_rule_programs(
+            collector_id, domain_id
         )
 
-        return cloud_service_data
+        project_values = {}
+        service_account_values = {}
+        for rule in managed_program.rules + custom_program.rules:
+            for action, value in rule.actions.items():
+                if action == "change_project":
+                    self._add_target_value(project_values, "project_id", value)
+
+                elif action == "match_project":
+                    target_key = value.get("target", "project_id")
+                    for cloud_service_data in cloud_service_data_list:
+                        target_value = utils.get_dict_value(
+                            cloud_service_data, value["source"]
+                        )
+                        self._add_target_value(project_values, target_key, target_value)
+
+                elif action == "match_service_account":
+                    target_key = value.get("target", "service_account_id")
+                    for cloud_service_data in cloud_service_data_list:
+                        target_value = utils.get_dict_value(
+                            cloud_service_data, value["source"]
+                        )
+                        self._add_target_value(
+                            service_account_values, target_key, target_value
+                        )
+
+        for target_key, target_values in project_values.items():
+            target_values = [
+                target_value
+                for target_value in target_values
+                if self._make_project_cache_key(domain_id, target_key, target_value)
+                not in self._project_info
+            ]
 
-    def _apply_collector_rule_to_cloud_service_data(
-        self, cloud_service_data: dict, collector_rule_vos: QuerySet, domain_id: str
-    ) -> dict:
-        for collector_rule_vo in collector_rule_vos:
-            is_match = self._change_cloud_service_data_by_rule(
-                cloud_service_data, collector_rule_vo
-            )
+            if target_values:
+                project_map = self._get_project_map(
+                    target_key, target_values, domain_id
+                )
 
-            if is_match:
-                cloud_service_data = self._change_cloud_service_data_with_actions(
-                    cloud_service_data, collector_rule_vo.actions, domain_id
+                for target_value in target_values:
+                    self._project_info[
+                        self._make_project_cache_key(
+                            domain_id, target_key, target_value
+                        )
+                    ] = project_map.get(target_value)
+
+        for target_key, target_values in service_account_values.items():
+            target_values = [
+                target_value
+                for target_value in target_values
+                if self._make_service_account_cache_key(
+                    domain_id, target_key, target_value
                 )
+                not in self._service_account_info
+            ]
 
-            if is_match and collector_rule_vo.options.stop_processing:
-                break
+            if target_values:
+                service_account_map = self._get_service_account_map(
+                    target_key, target_values, domain_id
+                )
 
-        return cloud_service_data
+                for target_value in target_values:
+                    self._service_account_info[
+                        self._make_service_account_cache_key(
+                            domain_id, target_key, target_value
+                        )
+                    ] = service_account_map.get(target_value)
 
     def _change_cloud_service_data_with_actions(
         self, cloud_service_data: dict, actions: dict, domain_id: str
@@ -164,13 +243,11 @@ class CollectorRuleManager(BaseManager):
     def _get_service_account(
         self, target_key: str, target_value: any, domain_id: str
     ) -> dict:
-        if (
-            f"inventory:service-account:{domain_id}:{target_key}:{target_value}"
-            in self._service_account_info
-        ):
-            return self._service_account_info[
-                f"inventory:service-account:{domain_id}:{target_key}:{target_value}"
-            ]
+        cache_key = self._make_service_account_cache_key(
+            domain_id, target_key, target_value
+        )
+        if cache_key in self._service_account_info:
+            return self._service_account_info[cache_key]
 
         query = {
             "filter": [
@@ -190,19 +267,13 @@ class CollectorRuleManager(BaseManager):
         if total_count > 0:
             service_account_info = results[0]
 
-        self._service_account_info[
-            f"inventory:service-account:{domain_id}:{target_key}:{target_value}"
-        ] = service_account_info
+        self._service_account_info[cache_key] = service_account_info
         return service_account_info
 
     def _get_project(self, target_key: str, target_value: str, domain_id: str) -> dict:
-        if (
-            f"identity:project:{domain_id}:{target_key}:{target_value}"
-            in self._project_info
-        ):
-            return self._project_info[
-                f"identity:project:{domain_id}:{target_key}:{target_value}"
-            ]
+        cache_key = self._make_project_cache_key(domain_id, target_key, target_value)
+        if cache_key in self._project_info:
+            return self._project_info[cache_key]
 
         query = {
             "filter": [{"k": target_key, "v": target_value, "o": "eq"}],
@@ -220,72 +291,135 @@ class CollectorRuleManager(BaseManager):
         if total_count > 0:
             project_info = results[0]
 
-        self._project_info[
-            f"identity:project:{domain_id}:{target_key}:{target_value}"
-        ] = project_info
+        self._project_info[cache_key] = project_info
         return project_info
 
-    def _change_cloud_service_data_by_rule(
-        self, cloud_service_data: dict, collector_rule_vo: CollectorRule
-    ) -> bool:
-        conditions_policy = collector_rule_vo.conditions_policy
-
-        if conditions_policy == "ALWAYS":
-            return True
-        else:
-            results = list(
-                map(
-                    functools.partial(self._check_condition, cloud_service_data),
-                    collector_rule_vo.conditions,
+    def _get_project_map(
+        self, target_key: str, target_values: List[str], domain_id: str
+    ) -> Dict[str, dict]:
+        only = ["project_id", "workspace_id", target_key]
+
+        if projects := self._get_domain_projects(domain_id):
+            return self._make_target_map(projects, target_key, target_values)
+
+        projects = []
+        for idx in range(0, len(target_values), _PREFETCH_CHUNK_SIZE):
+            query = {
+                "filter": [
+                    {
+                        "k": target_key,
+                        "v": target_values[idx : idx + _PREFETCH_CHUNK_SIZE],
+                        "o": "in",
+                    }
+                ],
+                "only": only,
+            }
+            response = self.identity_mgr.list_projects({"query": query}, domain_id)
+            projects += response.get("results", [])
+
+        return self._make_target_map(projects, target_key, target_values)
+
+    def _get_service_account_map(
+        self, target_key: str, target_values: List[str], domain_id: str
+    ) -> Dict[str, dict]:
+        only = ["service_account_id", "project_id", "workspace_id", target_key]
+
+        if service_accounts := self._get_domain_service_accounts(domain_id):
+            return self._make_target_map(service_accounts, target_key, target_values)
+
+        service_accounts = []
+        for idx in range(0, len(target_values), _PREFETCH_CHUNK_SIZE):
+            query = {
+                "filter": [
+                    {
+                        "k": target_key,
+                        "v": target_values[idx : idx + _PREFETCH_CHUNK_SIZE],
+                        "o": "in",
+                    }
+                ],
+                "only": only,
+            }
+            response = self.identity_mgr.list_service_accounts(query, domain_id)
+            service_accounts += response.get("results", [])
+
+        return self._make_target_map(service_accounts, target_key, target_values)
+
+    def _get_domain_projects(self, domain_id: str) -> Union[List[dict], None]:
+        if domain_id not in self._domain_projects:
+            self._domain_projects[domain_id] = None
+            max_size = config.get_global("COLLECTOR_RULE_WARM_DOMAIN_SIZE", 0)
+
+            if max_size > 0:
+                response = self.identity_mgr.list_projects(
+                    {"query": {"count_only": True}}, domain_id
                 )
-            )
+                if 0 < response.get("total_count", max_size + 1) <= max_size:
+                    response = self.identity_mgr.list_projects({"query": {}}, domain_id)
+                    self._domain_projects[domain_id] = response.get("results", [])
+
+        return self._domain_projects[domain_id]
+
+    def _get_domain_service_accounts(self, domain_id: str) -> Union[List[dict], None]:
+        if domain_id not in self._domain_service_accounts:
+            self._domain_service_accounts[domain_id] = None
+            max_size = config.get_global("COLLECTOR_RULE_WARM_DOMAIN_SIZE", 0)
+
+            if max_size > 0:
+                response = self.identity_mgr.list_service_accounts(
+                    {"count_only": True}, domain_id
+                )
+                if 0 < response.get("total_count", max_size + 1) <= max_size:
+                    response = self.identity_mgr.list_service_accounts({}, domain_id)
+                    self._domain_service_accounts[domain_id] = response.get(
+                        "results", []
+                    )
+
+        return self._domain_service_accounts[domain_id]
+
+    @staticmethod
+    def _make_target_map(
+        results: List[dict], target_key: str, target_values: List[str]
+    ) -> Dict[str, dict]:
+        # The first result is used for a value, same as a query with 'eq' operator
+        target_value_set = set(target_values)
+        target_map = {}
+
+        for result in results:
+            value = utils.get_dict_value(result, target_key)
+            values = value if isinstance(value, list) else [value]
+
+            for value in values:
+                if isinstance(value, str) and value in target_value_set:
+                    target_map.setdefault(value, result)
+
+        return target_map
+
+    @staticmethod
+    def _add_target_value(target_values: dict, target_key: str, value: any) -> None:
+        # Only string values are resolved in advance, others are queried one by one
+        if value and isinstance(value, str):
+            target_values.setdefault(target_key, set()).add(value)
 
-            if conditions_policy == "ALL":
-                return all(results)
-            else:
-                return any(results)
+    @staticmethod
+    def _make_project_cache_key(
+        domain_id: str, target_key: str, target_value: any
+    ) -> str:
+        return f"identity:project:{domain_id}:{target_key}:{target_value}"
 
     @staticmethod
-    def _check_condition(
-        cloud_service_data: dict, condition: CollectorRuleCondition
-    ) -> bool:
-        cloud_service_value = utils.get_dict_value(cloud_service_data, condition.key)
-        condition_value = condition.value
-        operator = condition.operator
-
-        if cloud_service_value is None:
-            return False
-
-        if operator == "eq":
-            if cloud_service_value == condition_value:
-                return True
-            else:
-                return False
-        elif operator == "contain":
-            if cloud_service_value.lower().find(condition_value.lower()) >= 0:
-                return True
-            else:
-                return False
-        elif operator == "not":
-            if cloud_service_value != condition_value:
-                return True
-            else:
-                return False
-        elif operator == "not_contain":
-            if cloud_service_value.lower().find(condition_value.lower()) < 0:
-                return True
-            else:
-                return False
-
-        return False
-
-    def _get_collector_rules(
+    def _make_service_account_cache_key(
+        domain_id: str, target_key: str, target_value: any
+    ) -> str:
+        return f"inventory:service-account:{domain_id}:{target_key}:{target_value}"
+
+    def _get_collector_rule_programs(
         self, collector_id: str, domain_id: str
-    ) -> Tuple[QuerySet, QuerySet]:
+    ) -> Tuple[CollectorRuleProgram, CollectorRuleProgram]:
         if collector_id in self._collector_rule_info:
-            return self._collector_rule_info[collector_id].get(
-                "managed", []
-            ), self._collector_rule_info[collector_id].get("custom", [])
+            return (
+                self._collector_rule_info[collector_id]["managed"],
+                self._collector_rule_info[collector_id]["custom"],
+            )
 
         managed_query = self._make_collector_rule_query(
             collector_id, "MANAGED", domain_id
@@ -300,11 +434,15 @@ class CollectorRuleManager(BaseManager):
         )
         custom_collector_rule_vos, total_count = self.list_collector_rules(custom_query)
 
+        # Rules are compiled once and reused for all resources of the collector
+        managed_program = CollectorRuleProgram(managed_collector_rule_vos)
+        custom_program = CollectorRuleProgram(custom_collector_rule_vos)
+
         self._collector_rule_info[collector_id] = {}
-        self._collector_rule_info[collector_id]["managed"] = managed_collector_rule_vos
-        self._collector_rule_info[collector_id]["custom"] = custom_collector_rule_vos
+        self._collector_rule_info[collector_id]["managed"] = managed_program
+        self._collector_rule_info[collector_id]["custom"] = custom_program
 
-        return managed_collector_rule_vos, custom_collector_rule_vos
+        return managed_program, custom_program
 
     @staticmethod
     def _make_collector_rule_query(
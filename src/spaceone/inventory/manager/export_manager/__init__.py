@@ -1,10 +1,16 @@
+import csv
+import io
+import itertools
 import tempfile
 import logging
-import pandas as pd
 import re
+import zipfile
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable, List
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Border, PatternFill, Alignment, Side
+from openpyxl.utils import get_column_letter
 
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.manager.file_manager import FileManager
@@ -12,6 +18,9 @@ from spaceone.inventory.error.export import *
 
 _LOGGER = logging.getLogger(__name__)
 
+# Column width is fitted with the first rows, because rows are written as they come
+COLUMN_WIDTH_SAMPLE_SIZE = 100
+
 
 class ExportManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -44,18 +53,26 @@ class ExportManager(BaseManager):
         self._check_results(export_options)
 
         if self._file_format == "EXCEL":
-            with pd.ExcelWriter(self._file_path, mode="w", engine="openpyxl") as writer:
-                idx = 0
+            workbook = Workbook(write_only=True)
+
+            for export_option in export_options:
+                name = export_option["name"]
+                title = export_option.get("title")
+                results = export_option["results"]
+
+                if results:
+                    self._make_excel_file(workbook, name, results, title)
 
+            workbook.save(self._file_path)
+
+        elif self._file_format == "CSV":
+            with zipfile.ZipFile(self._file_path, "w", zipfile.ZIP_DEFLATED) as zf:
                 for export_option in export_options:
                     name = export_option["name"]
-                    title = export_option.get("title")
                     results = export_option["results"]
 
-                    if len(results) > 0:
-                        self._make_excel_file(writer, idx, name, results, title)
-
-                        idx += 1
+                    if results:
+                        self._make_csv_file(zf, name, results)
 
         else:
             raise ERROR_NOT_SUPPORT_FILE_FORMAT(file_format=self._file_format)
@@ -84,21 +101,61 @@ class ExportManager(BaseManager):
             value = illegal_characters_re.sub("", value)
         return value
 
+    @staticmethod
+    def _convert_value(value: Any) -> Any:
+        if value is None or isinstance(value, (str, int, float, bool, datetime)):
+            return ExportManager._sanitize_string(value)
+        else:
+            return ExportManager._sanitize_string(str(value))
+
+    @staticmethod
+    def _get_sample_rows(results: Iterable[dict]) -> (List[dict], Iterable[dict]):
+        if isinstance(results, list):
+            return results[:COLUMN_WIDTH_SAMPLE_SIZE], results
+        else:
+            sample_rows = list(itertools.islice(results, COLUMN_WIDTH_SAMPLE_SIZE))
+            return sample_rows, itertools.chain(sample_rows, results)
+
+    @staticmethod
+    def _get_columns(results: Iterable[dict]) -> List[str]:
+        columns = {}
+        for result in results:
+            for key in result.keys():
+                columns[key] = True
+
+        return list(columns.keys())
+
     @staticmethod
     def _write_excel_file(
-        writer: pd.ExcelWriter, df: pd.DataFrame, sheet_name: str, title: str = None
+        workbook: Workbook, results: Iterable[dict], sheet_name: str, title: str = None
     ) -> None:
         start_row = 1 if title else 0
+        ws = workbook.create_sheet(sheet_name)
+
+        sample_rows, results = ExportManager._get_sample_rows(results)
+
+        if isinstance(results, list):
+            columns = ExportManager._get_columns(results)
+        else:
+            columns = ExportManager._get_columns(sample_rows)
 
-        df = df.map(ExportManager._sanitize_string)
-        df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=start_row)
-        ws = writer.sheets[sheet_name]
+        # Set Column Width
+        for idx, column in enumerate(columns):
+            max_width = len(str(column))
+            for sample_row in sample_rows:
+                for x in str(sample_row.get(column)).split("\n"):
+                    if len(x) > max_width:
+                        max_width = len(x)
+
+            ws.column_dimensions[get_column_letter(idx + 1)].width = (
+                max_width + 2
+            ) * 1.1
 
         # Set Title
         if title:
-            ws = writer.sheets[sheet_name]
-            ws["A1"] = title
-            ws["A1"].font = Font(size=24, bold=True, color="0A3763")
+            cell = WriteOnlyCell(ws, value=title)
+            cell.font = Font(size=24, bold=True, color="0A3763")
+            ws.append([cell])
 
         # Set Excel Style
         # Header Style
@@ -119,40 +176,64 @@ class ExportManager(BaseManager):
         )
         data_fill = PatternFill(patternType="solid", fgColor="F7f7f7")
 
-        for col in ws.columns:
-            max_width = 0
-            for i, cell in enumerate(col):
-                if i >= start_row:
-                    if i == start_row:
-                        cell.alignment = align
-                        cell.font = header_font
-                        cell.border = header_border
-                        cell.fill = header_fill
-                    else:
-                        cell.alignment = align
-                        cell.font = data_font
-                        cell.border = data_border
-
-                        if i % 2 == 0:
-                            cell.fill = data_fill
-
-                    if len(str(cell.value)) > max_width:
-                        for x in str(cell.value).split("\n"):
-                            if len(x) > max_width:
-                                max_width = len(x)
-
-                ws.column_dimensions[col[0].column_letter].width = (max_width + 2) * 1.1
+        header_cells = []
+        for column in columns:
+            cell = WriteOnlyCell(ws, value=ExportManager._convert_value(column))
+            cell.alignment = align
+            cell.font = header_font
+            cell.border = header_border
+            cell.fill = header_fill
+            header_cells.append(cell)
+
+        ws.append(header_cells)
+
+        for i, result in enumerate(results, start_row + 1):
+            data_cells = []
+            for column in columns:
+                cell = WriteOnlyCell(
+                    ws, value=ExportManager._convert_value(result.get(column))
+                )
+                cell.alignment = align
+                cell.font = data_font
+                cell.border = data_border
+
+                if i % 2 == 0:
+                    cell.fill = data_fill
+
+                data_cells.append(cell)
+
+            ws.append(data_cells)
 
     def _make_excel_file(
         self,
-        writer: pd.ExcelWriter,
-        idx: int,
+        workbook: Workbook,
         name: str,
-        results: list,
+        results: Iterable[dict],
         title: str = None,
     ) -> None:
-        df = pd.DataFrame(results)
+        sheet_name = self._get_sheet_name(name)
+        self._write_excel_file(workbook, results, sheet_name, title)
+
+    def _make_csv_file(
+        self, zf: zipfile.ZipFile, name: str, results: Iterable[dict]
+    ) -> None:
+        file_name = f"{self._get_sheet_name(name)}.csv"
+        sample_rows, results = self._get_sample_rows(results)
 
+        if isinstance(results, list):
+            columns = self._get_columns(results)
+        else:
+            columns = self._get_columns(sample_rows)
+
+        with zf.open(file_name, "w", force_zip64=True) as f:
+            with io.TextIOWrapper(f, encoding="utf-8-sig", newline="") as text_file:
+                writer = csv.writer(text_file)
+                writer.writerow(columns)
+
+                for result in results:
+                    writer.writerow([result.get(column) for column in columns])
+
+    def _get_sheet_name(self, name: str) -> str:
         sheet_name = self._change_sheet_name(name)
 
         if sheet_name in self._sheet_name_count:
@@ -164,10 +245,7 @@ class ExportManager(BaseManager):
         else:
             self._sheet_name_count[sheet_name] = 1
 
-        if idx == 0:
-            self._write_excel_file(writer, df, sheet_name, title)
-        else:
-            self._write_excel_file(writer, df, sheet_name, title)
+        return sheet_name
 
     def upload_file(self, domain_id: str, workspace_id: str = None) -> dict:
         file_mgr: FileManager = self.locator.get_manager(FileManager)
@@ -181,9 +259,21 @@ class ExportManager(BaseManager):
 
         for export_option in export_options:
             results = export_option["results"]
-            if len(results) > 0:
+
+            if not isinstance(results, list):
+                # Check only the first row of the results made while exporting
+                results = iter(results)
+                first_result = next(results, None)
+
+                if first_result is None:
+                    results = []
+                else:
+                    results = itertools.chain([first_result], results)
+
+                export_option["results"] = results
+
+            if results:
                 has_results = True
-                break
 
         if not has_results:
             raise ERROR_NO_DATA_TO_EXPORT()
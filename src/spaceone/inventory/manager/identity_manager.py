@@ -52,6 +52,16 @@ class IdentityManager(BaseManager):
         else:
             return self.identity_conn.dispatch("Project.list", params)
 
+    def list_domain_projects(self, query: dict, domain_id: str) -> dict:
+        system_token = config.get_global("TOKEN")
+
+        return self.identity_conn.dispatch(
+            "Project.list",
+            {"query": query},
+            token=system_token,
+            x_domain_id=domain_id,
+        )
+
     def list_project_groups(
         self,
         params: dict,
@@ -101,6 +111,16 @@ class IdentityManager(BaseManager):
         else:
             return self.identity_conn.dispatch("ServiceAccount.list", {"query": query})
 
+    def list_domain_service_accounts(self, query: dict, domain_id: str) -> dict:
+        system_token = config.get_global("TOKEN")
+
+        return self.identity_conn.dispatch(
+            "ServiceAccount.list",
+            {"query": query},
+            token=system_token,
+            x_domain_id=domain_id,
+        )
+
     @cache.cacheable(
         key="inventory:service-account:query:{domain_id}:{query_hash}", expire=3600
     )
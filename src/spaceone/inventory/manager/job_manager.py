@@ -46,6 +46,7 @@ class JobManager(BaseManager):
         job_params["resource_group"] = collector_vo.resource_group
         job_params["workspace_id"] = collector_vo.workspace_id
         job_params["domain_id"] = collector_vo.domain_id
+        job_params["is_changed"] = False
 
         return self.job_model.create(job_params)
 
@@ -80,28 +81,115 @@ class JobManager(BaseManager):
     def stat_jobs(self, query: dict) -> dict:
         return self.job_model.stat(**query)
 
-    def increase_success_tasks(self, job_id: str, domain_id: str) -> None:
-        job_vo: Job = self.get_job(job_id, domain_id)
-        job_vo.increment("success_tasks")
-        self.decrease_remained_tasks_by_vo(job_vo)
+    def increase_success_tasks(
+        self, job_id: str, domain_id: str, is_changed: bool = False
+    ) -> None:
+        self._finish_task(job_id, domain_id, "success_tasks", is_changed)
 
-    def increase_failure_tasks(self, job_id: str, domain_id: str) -> None:
-        job_vo: Job = self.get_job(job_id, domain_id)
-        job_vo.increment("failure_tasks")
-        self.decrease_remained_tasks_by_vo(job_vo)
+    def increase_failure_tasks(
+        self, job_id: str, domain_id: str, is_changed: bool = False
+    ) -> None:
+        self._finish_task(job_id, domain_id, "failure_tasks", is_changed)
+
+    def _finish_task(
+        self, job_id: str, domain_id: str, count_key: str, is_changed: bool
+    ) -> None:
+        # counters of the job are updated with a single find-and-modify
+        update_data = {f"inc__{count_key}": 1, "dec__remained_tasks": 1}
+
+        if is_changed:
+            update_data["set__is_changed"] = True
 
-    def decrease_remained_tasks_by_vo(self, job_vo: Job) -> None:
-        job_vo = job_vo.decrement("remained_tasks")
+        job_vo: Job = self.job_model.filter(job_id=job_id, domain_id=domain_id).modify(
+            new=True, **update_data
+        )
+
+        if job_vo is None:
+            raise ERROR_NOT_FOUND(key="job_id", value=job_id)
 
         if job_vo.remained_tasks == 0:
-            if job_vo.status == "IN_PROGRESS":
-                if job_vo.failure_tasks > 0:
-                    self.make_failure_by_vo(job_vo)
-                else:
-                    self.make_success_by_vo(job_vo)
-
-            if self._is_changed(job_vo):
-                self._run_metric_queries(job_vo.plugin_id, job_vo.domain_id)
+            self._finish_job_by_vo(job_vo)
+
+    def acquire_task_slot(
+        self, job_id: str, domain_id: str, max_concurrency: int, lease_id: str
+    ) -> bool:
+        # running_tasks is used as a semaphore of the job with an atomic update,
+        # and each slot is leased until the job times out
+        expires_at = datetime.utcnow() + timedelta(
+            hours=config.get_global("JOB_TIMEOUT", 2)
+        )
+
+        result = self.job_model._get_collection().update_one(
+            {
+                "job_id": job_id,
+                "domain_id": domain_id,
+                "$or": [
+                    {"running_tasks": {"$lt": max_concurrency}},
+                    {"running_tasks": {"$exists": False}},
+                ],
+            },
+            {
+                "$inc": {"running_tasks": 1},
+                "$set": {f"task_leases.{lease_id}": expires_at},
+            },
+        )
+
+        return result.modified_count > 0
+
+    def release_task_slot(self, job_id: str, domain_id: str, lease_id: str) -> None:
+        self.job_model._get_collection().update_one(
+            {
+                "job_id": job_id,
+                "domain_id": domain_id,
+                f"task_leases.{lease_id}": {"$exists": True},
+            },
+            {"$inc": {"running_tasks": -1}, "$unset": {f"task_leases.{lease_id}": ""}},
+        )
+
+    def release_expired_task_slots(self, job_vo: Job) -> int:
+        """release the slots leaked by workers which were killed while running"""
+
+        now = datetime.utcnow()
+        released_count = 0
+
+        for lease_id, expires_at in (job_vo.task_leases or {}).items():
+            if expires_at < now:
+                result = self.job_model._get_collection().update_one(
+                    {
+                        "job_id": job_vo.job_id,
+                        "domain_id": job_vo.domain_id,
+                        f"task_leases.{lease_id}": {"$lt": now},
+                    },
+                    {
+                        "$inc": {"running_tasks": -1},
+                        "$unset": {f"task_leases.{lease_id}": ""},
+                    },
+                )
+                released_count += result.modified_count
+
+        if released_count > 0:
+            _LOGGER.warning(
+                f"[release_expired_task_slots] release expired slots ({job_vo.job_id}): "
+                f"{released_count}"
+            )
+
+        return released_count
+
+    def _finish_job_by_vo(self, job_vo: Job) -> None:
+        if job_vo.status == "IN_PROGRESS":
+            if job_vo.failure_tasks > 0:
+                self.make_failure_by_vo(job_vo)
+            else:
+                self.make_success_by_vo(job_vo)
+
+        if job_vo.is_changed is None:
+            # jobs created before is_changed was added
+            is_changed = self._is_changed(job_vo)
+        else:
+            is_changed = job_vo.is_changed
+
+        if is_changed:
+            self._run_metric_queries(job_vo.plugin_id, job_vo.domain_id)
 
     def _is_changed(self, job_vo: Job) -> bool:
         job_task_model: JobTask = self.locator.get_model("JobTask")
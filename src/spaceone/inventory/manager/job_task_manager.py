@@ -1,16 +1,18 @@
 import copy
 import logging
 import json
-from typing import Tuple, Union
+from typing import List, Tuple, Union
 from jsonschema import validate
-from datetime import datetime
+from datetime import datetime, timedelta
 from spaceone.core import config, queue, utils
 from spaceone.core.manager import BaseManager
 from spaceone.core.scheduler.task_schema import SPACEONE_TASK_SCHEMA
 from spaceone.core.model.mongo_model import QuerySet
+from spaceone.inventory.lib import bulk_writer
+from spaceone.inventory.lib.job_task_error_buffer import JobTaskErrorBuffer
 from spaceone.inventory.manager.job_manager import JobManager
 from spaceone.inventory.manager.cleanup_manager import CleanupManager
-from spaceone.inventory.model.job_task_model import JobTask
+from spaceone.inventory.model.job_task_model import JobTask, JobTaskError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,6 +21,7 @@ class JobTaskManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.job_task_model: JobTask = self.locator.get_model("JobTask")
+        self.job_task_error_model: JobTaskError = self.locator.get_model("JobTaskError")
 
     def create_job_task(self, params: dict) -> JobTask:
         def _rollback(vo: JobTask):
@@ -58,11 +61,90 @@ class JobTaskManager(BaseManager):
     def stat(self, query: dict) -> dict:
         return self.job_task_model.stat(**query)
 
-    def push_job_task(self, params: dict) -> None:
+    def push_job_task(self, params: dict, delay: float = 0) -> None:
+        if delay > 0:
+            # the job task is pushed again by the retry scheduler when it's due
+            self.add_retry_task(params, delay)
+            return
+
         task = self.create_task_pipeline(copy.deepcopy(params))
         validate(task, schema=SPACEONE_TASK_SCHEMA)
         json_task = json.dumps(task)
-        queue.put(self.get_queue_name(name="collect_queue"), json_task)
+        queue_name = self.get_queue_name(name="collect_queue")
+        queue.put(queue_name, json_task)
+
+    def add_retry_task(self, params: dict, delay: float) -> None:
+        # secret data and token are not stored, they are resolved again at the retry
+        retry_params = {
+            key: value
+            for key, value in params.items()
+            if key not in ["secret_data", "token"]
+        }
+
+        self.job_task_model._get_collection().update_one(
+            {"job_task_id": params["job_task_id"], "domain_id": params["domain_id"]},
+            {
+                "$push": {
+                    "retry_tasks": {
+                        "retry_id": utils.generate_id("retry"),
+                        "retry_at": datetime.utcnow() + timedelta(seconds=delay),
+                        "params": retry_params,
+                    }
+                }
+            },
+        )
+
+    def pop_due_retry_tasks(self) -> List[dict]:
+        """Pop the retry tasks which are due, a retry task is popped only once
+        even if several workers pop them at the same time
+
+        Returns:
+            retry_params (list): params of the job tasks to push again
+        """
+
+        now = datetime.utcnow()
+        collection = self.job_task_model._get_collection()
+        retry_params = []
+
+        for document in collection.find(
+            {"retry_tasks.retry_at": {"$lte": now}}, {"retry_tasks": 1}
+        ):
+            for retry_task in document["retry_tasks"]:
+                if retry_task["retry_at"] > now:
+                    continue
+
+                result = collection.update_one(
+                    {
+                        "_id": document["_id"],
+                        "retry_tasks.retry_id": retry_task["retry_id"],
+                    },
+                    {"$pull": {"retry_tasks": {"retry_id": retry_task["retry_id"]}}},
+                )
+
+                if result.modified_count > 0:
+                    retry_params.append(retry_task["params"])
+
+        return retry_params
+
+    def add_admission_info(
+        self,
+        job_task_id: str,
+        domain_id: str,
+        rejected_count: int = 0,
+        wait_time: float = 0,
+    ) -> None:
+        inc_data = {}
+
+        if rejected_count:
+            inc_data["inc__admission_rejected_count"] = rejected_count
+
+        if wait_time:
+            inc_data["inc__admission_wait_time"] = round(wait_time, 3)
+
+        if inc_data:
+            self.job_task_model.filter(
+                job_task_id=job_task_id, domain_id=domain_id
+            ).update(**inc_data)
 
     @staticmethod
     def add_error(
@@ -81,6 +163,46 @@ class JobTaskManager(BaseManager):
             f"[add_error] {job_task_vo.job_task_id}: {error_info}", exc_info=True
         )
 
+    def flush_errors(
+        self, job_task_vo: JobTask, error_buffer: JobTaskErrorBuffer
+    ) -> None:
+        errors = error_buffer.pop_errors()
+        if len(errors) > 0:
+            # all error groups are pushed with a single update
+            self.job_task_model._get_collection().update_one(
+                {"_id": job_task_vo.pk}, {"$push": {"errors": {"$each": errors}}}
+            )
+
+        self.flush_error_details(job_task_vo, error_buffer)
+
+    def flush_error_details(
+        self, job_task_vo: JobTask, error_buffer: JobTaskErrorBuffer
+    ) -> None:
+        details = error_buffer.pop_details()
+        if len(details) == 0:
+            return
+
+        results = bulk_writer.insert_many(
+            self.job_task_error_model,
+            [
+                {
+                    **error_info,
+                    "job_task_id": job_task_vo.job_task_id,
+                    "job_id": job_task_vo.job_id,
+                    "collector_id": job_task_vo.collector_id,
+                    "domain_id": job_task_vo.domain_id,
+                }
+                for error_info in details
+            ],
+        )
+
+        failure_count = len([r for r in results if isinstance(r, Exception)])
+        if failure_count > 0:
+            _LOGGER.warning(
+                f"[flush_error_details] failed to write error details "
+                f"({job_task_vo.job_task_id}): {failure_count}/{len(details)}"
+            )
+
     @staticmethod
     def _update_job_status_by_vo(
         job_task_vo: JobTask,
@@ -139,39 +261,68 @@ class JobTaskManager(BaseManager):
     def decrease_remained_sub_tasks(
         self, job_task_vo: JobTask, collecting_count_info: dict = None
     ) -> JobTask:
-        if collecting_count_info:
-            self._update_collecting_count_info(job_task_vo, collecting_count_info)
+        # counters and remained_sub_tasks are updated with a single find-and-modify
+        job_task_vo = self._update_collecting_count_info(
+            job_task_vo, collecting_count_info or {}, remained_sub_tasks=-1
+        )
 
-        job_task_vo: JobTask = job_task_vo.decrement("remained_sub_tasks")
         if job_task_vo.remained_sub_tasks == 0:
             job_mgr: JobManager = self.locator.get_manager(JobManager)
             if job_task_vo.status == "IN_PROGRESS":
                 deleted_resources_info = self._update_disconnected_and_deleted_count(
                     job_task_vo
                 )
-                self._update_collecting_count_info(job_task_vo, deleted_resources_info)
+                job_task_vo = self._update_collecting_count_info(
+                    job_task_vo, deleted_resources_info
+                )
 
                 self.make_success_by_vo(job_task_vo)
                 job_mgr.increase_success_tasks(
-                    job_task_vo.job_id, job_task_vo.domain_id
+                    job_task_vo.job_id,
+                    job_task_vo.domain_id,
+                    self._is_changed(job_task_vo),
                 )
             else:
                 job_mgr.increase_failure_tasks(
-                    job_task_vo.job_id, job_task_vo.domain_id
+                    job_task_vo.job_id,
+                    job_task_vo.domain_id,
+                    self._is_changed(job_task_vo),
                 )
 
         return job_task_vo
 
-    @staticmethod
     def _update_collecting_count_info(
-        job_task_vo: JobTask, collecting_count_info: dict
-    ) -> None:
+        self,
+        job_task_vo: JobTask,
+        collecting_count_info: dict,
+        remained_sub_tasks: int = 0,
+    ) -> JobTask:
         _LOGGER.debug(
             f"[_update_collecting_count_info] update collecting count => {utils.dump_json(collecting_count_info)}"
         )
+
+        inc_data = {}
         for key, value in collecting_count_info.items():
             if isinstance(value, int) and value > 0:
-                job_task_vo.increment(key, value)
+                inc_data[f"inc__{key}"] = value
+
+        if remained_sub_tasks:
+            inc_data["inc__remained_sub_tasks"] = remained_sub_tasks
+
+        if len(inc_data) == 0:
+            return job_task_vo
+
+        return self.job_task_model.filter(pk=job_task_vo.pk).modify(
+            new=True, **inc_data
+        )
+
+    @staticmethod
+    def _is_changed(job_task_vo: JobTask) -> bool:
+        return (
+            job_task_vo.created_count > 0
+            or job_task_vo.updated_count > 0
+            or job_task_vo.deleted_count > 0
+        )
 
     def _update_disconnected_and_deleted_count(self, job_task_vo: JobTask) -> dict:
         try:
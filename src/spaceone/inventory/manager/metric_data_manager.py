@@ -1,5 +1,5 @@
 import logging
-from typing import Tuple
+from typing import List, Tuple
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
 
@@ -16,6 +16,7 @@ from spaceone.inventory.error.metric import (
     ERROR_INVALID_PARAMETER_TYPE,
 )
 from spaceone.inventory.manager.identity_manager import IdentityManager
+from spaceone.inventory.lib import bulk_writer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +38,85 @@ class MetricDataManager(BaseManager):
         )
         return monthly_metric_data_vo
 
+    def create_metric_data_many(self, data_list: List[dict]) -> int:
+        return bulk_writer.create_many(self.metric_data_model, data_list)
+
+    def create_monthly_metric_data_many(self, data_list: List[dict]) -> int:
+        return bulk_writer.create_many(self.monthly_metric_data, data_list)
+
+    def aggregate_monthly_metric_data(
+        self,
+        domain_id: str,
+        metric_id: str,
+        metric_job_id: str,
+        created_month: str,
+        label_keys: List[str],
+        data: dict,
+    ) -> int:
+        """Sum up the metric data of a metric job by labels into monthly metric data
+
+        The metric data are grouped in the database, and the results are merged
+        into the monthly metric data collection with $merge (MongoDB 4.2+).
+        If $merge is not supported, the results are inserted by the manager.
+        If $merge fails otherwise, the monthly metric data it may have merged
+        are deleted before they are inserted by the manager.
+
+        Args:
+            domain_id (str): domain_id
+            metric_id (str): metric_id
+            metric_job_id (str): metric_job_id
+            created_month (str): e.g. '2024-01'
+            label_keys (list): e.g. ['workspace_id', 'labels.Region']
+            data (dict): common values of the monthly metric data
+
+        Returns:
+            int: number of the monthly metric data (unknown with $merge: -1)
+        """
+
+        group_id = {}
+        for key in label_keys:
+            group_id[key.rsplit(".", 1)[-1]] = f"${key}"
+
+        project = {"_id": 0, "value": 1}
+        labels = {}
+        for name in group_id.keys():
+            if name in ["service_account_id", "project_id", "workspace_id"]:
+                # empty ids are not stored, as with MongoModel.create()
+                project[name] = {"$ifNull": [f"$_id.{name}", "$$REMOVE"]}
+            else:
+                labels[name] = f"$_id.{name}"
+
+        project["labels"] = labels or {"$literal": {}}
+
+        create_data = bulk_writer.make_create_data(
+            self.monthly_metric_data,
+            {**data, "status": "IN_PROGRESS", "created_month": created_month},
+        )
+        for key, value in create_data.items():
+            if key not in project:
+                project[key] = {"$literal": value}
+
+        job_match = {
+            "domain_id": domain_id,
+            "metric_id": metric_id,
+            "created_month": created_month,
+            "metric_job_id": metric_job_id,
+            "status": "IN_PROGRESS",
+        }
+
+        pipeline = [
+            {"$match": job_match},
+            {"$group": {"_id": group_id, "value": {"$sum": "$value"}}},
+            {"$project": project},
+        ]
+
+        return bulk_writer.aggregate_into(
+            self.metric_data_model._get_collection(),
+            pipeline,
+            self.monthly_metric_data._get_collection(),
+            job_match,
+        )
+
     def delete_metric_data_by_metric_id(self, metric_id: str, domain_id: str):
         _LOGGER.debug(
             f"[delete_metric_data_by_metric_id] Delete all metric data: {metric_id}"
@@ -1,8 +1,9 @@
 import logging
 import copy
+import random
 import time
 from typing import Tuple, Union, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from collections import defaultdict
 
@@ -23,6 +24,8 @@ from spaceone.inventory.manager.metric_data_manager import MetricDataManager
 
 _LOGGER = logging.getLogger(__name__)
 
+_WAIT_INTERVAL = 1  # seconds
+
 
 class MetricManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -30,7 +33,13 @@ class MetricManager(BaseManager):
         self.metric_model = Metric
         self.metric_data_mgr = MetricDataManager()
 
-    def push_task(self, metric_vo: Metric, is_yesterday: bool = False) -> None:
+    def push_task(
+        self,
+        metric_vo: Metric,
+        is_yesterday: bool = False,
+        metric_job_id: str = None,
+        delay: float = 0,
+    ) -> None:
         metric_id = metric_vo.metric_id
         domain_id = metric_vo.domain_id
 
@@ -57,10 +66,68 @@ class MetricManager(BaseManager):
             ],
         }
 
-        _LOGGER.debug(f"[push_task] run metric({domain_id}) {metric_id}")
+        if metric_job_id:
+            task["stages"][0]["params"]["params"]["metric_job_id"] = metric_job_id
 
+        if delay > 0:
+            # the metric job is pushed again by the retry scheduler when it's due
+            self._add_run_retry(metric_vo, is_yesterday, metric_job_id, delay)
+            return
+
+        _LOGGER.debug(f"[push_task] run metric({domain_id}) {metric_id}")
         queue.put("collector_q", utils.dump_json(task))
 
+    def _add_run_retry(
+        self, metric_vo: Metric, is_yesterday: bool, metric_job_id: str, delay: float
+    ) -> None:
+        # only the last metric job of the metric is run, so a retry replaces the old one
+        self.metric_model._get_collection().update_one(
+            {"metric_id": metric_vo.metric_id, "domain_id": metric_vo.domain_id},
+            {
+                "$set": {
+                    "run_retry": {
+                        "retry_id": utils.generate_id("retry"),
+                        "retry_at": datetime.utcnow() + timedelta(seconds=delay),
+                        "metric_job_id": metric_job_id,
+                        "is_yesterday": is_yesterday,
+                    }
+                }
+            },
+        )
+
+    def pop_due_run_retries(self) -> List[dict]:
+        """Pop the retries of metric jobs which are due, a retry is popped only once
+        even if several workers pop them at the same time
+
+        Returns:
+            run_retries (list): retries with metric_id and domain_id of the metrics
+        """
+
+        now = datetime.utcnow()
+        collection = self.metric_model._get_collection()
+        run_retries = []
+
+        for document in collection.find(
+            {"run_retry.retry_at": {"$lte": now}},
+            {"metric_id": 1, "domain_id": 1, "run_retry": 1},
+        ):
+            run_retry = document["run_retry"]
+            result = collection.update_one(
+                {"_id": document["_id"], "run_retry.retry_id": run_retry["retry_id"]},
+                {"$set": {"run_retry": None}},
+            )
+
+            if result.modified_count > 0:
+                run_retries.append(
+                    {
+                        **run_retry,
+                        "metric_id": document["metric_id"],
+                        "domain_id": document["domain_id"],
+                    }
+                )
+
+        return run_retries
+
     def create_metric(self, params: dict) -> Metric:
         def _rollback(vo: Metric):
             _LOGGER.info(f"[create_metric._rollback] " f"Delete metric: {vo.metric_id}")
@@ -134,17 +201,101 @@ class MetricManager(BaseManager):
     def stat_metrics(self, query: dict) -> dict:
         return self.metric_model.stat(**query)
 
-    def run_metric_query(self, metric_vo: Metric, is_yesterday: bool = False) -> None:
-        self._check_metric_status(metric_vo)
+    def queue_metric_query(self, metric_vo: Metric) -> Metric:
+        """Push a metric job to the queue, the metric is IN_PROGRESS until it's done"""
 
         metric_job_id = utils.generate_id("metric-job")
         _LOGGER.debug(
-            f"[run_metric_query] Start metric job ({metric_vo.metric_id}): {metric_job_id}"
+            f"[queue_metric_query] Queue metric job ({metric_vo.metric_id}): {metric_job_id}"
         )
 
-        self.update_metric_by_vo(
+        metric_vo = self.update_metric_by_vo(
             {"status": "IN_PROGRESS", "metric_job_id": metric_job_id}, metric_vo
         )
+        self.push_task(metric_vo, metric_job_id=metric_job_id)
+
+        return metric_vo
+
+    def wait_metric_query(self, metric_vo: Metric, timeout: int) -> Metric:
+        """Wait until the metric job is done, or replaced by a newer job"""
+
+        metric_id = metric_vo.metric_id
+        metric_job_id = metric_vo.metric_job_id
+        timeout = min(timeout, config.get_global("METRIC_RUN_MAX_WAIT", 600))
+        started_at = time.monotonic()
+
+        while True:
+            metric_vo = self.get_metric(metric_id, metric_vo.domain_id)
+
+            if metric_vo.status == "DONE" or metric_vo.metric_job_id != metric_job_id:
+                return metric_vo
+
+            remained_time = timeout - (time.monotonic() - started_at)
+            if remained_time <= 0:
+                _LOGGER.debug(
+                    f"[wait_metric_query] Timeout ({metric_id}): {metric_job_id}"
+                )
+                return metric_vo
+
+            time.sleep(min(_WAIT_INTERVAL, remained_time))
+
+    def run_metric_query(
+        self,
+        metric_vo: Metric,
+        is_yesterday: bool = False,
+        metric_job_id: str = None,
+    ) -> None:
+        if metric_job_id is None:
+            self._check_metric_status(metric_vo)
+
+            metric_job_id = utils.generate_id("metric-job")
+            self.update_metric_by_vo(
+                {"status": "IN_PROGRESS", "metric_job_id": metric_job_id}, metric_vo
+            )
+        elif metric_vo.metric_job_id != metric_job_id:
+            # the queued job is replaced by a newer job of the metric
+            _LOGGER.debug(
+                f"[run_metric_query] Skip replaced metric job ({metric_vo.metric_id}): {metric_job_id}"
+            )
+            return
+        else:
+
+            def _rollback(vo: Metric):
+                vo = self.get_metric(vo.metric_id, vo.domain_id)
+                if vo.metric_job_id == metric_job_id:
+                    _LOGGER.info(
+                        f"[run_metric_query._rollback] Failed metric job ({vo.metric_id}): {metric_job_id}"
+                    )
+                    vo.update({"status": "DONE"})
+
+            self.transaction.add_rollback(_rollback, metric_vo)
+
+        if not self._acquire_run_lease(metric_vo, metric_job_id):
+            # metric data of the metric are replaced by one job at a time
+            retry_interval = config.get_global("METRIC_RUN_RETRY_INTERVAL", 30)
+            _LOGGER.debug(
+                f"[run_metric_query] Another metric job is running ({metric_vo.metric_id}): "
+                f"{metric_job_id}, retry_interval = {retry_interval}s"
+            )
+            self.push_task(
+                metric_vo,
+                is_yesterday=is_yesterday,
+                metric_job_id=metric_job_id,
+                delay=retry_interval * random.uniform(0.8, 1.2),
+            )
+            return
+
+        try:
+            self._run_metric_job(metric_vo, is_yesterday, metric_job_id)
+        finally:
+            self._release_run_lease(metric_vo, metric_job_id)
+
+    def _run_metric_job(
+        self, metric_vo: Metric, is_yesterday: bool, metric_job_id: str
+    ) -> None:
+        _LOGGER.debug(
+            f"[run_metric_query] Start metric job ({metric_vo.metric_id}): {metric_job_id}"
+        )
 
         results = self.analyze_resource(metric_vo, is_yesterday=is_yesterday)
 
@@ -157,8 +308,7 @@ class MetricManager(BaseManager):
             _LOGGER.debug(
                 f"[run_metric_query] Save query results ({metric_vo.metric_id}): {len(results)}"
             )
-            for result in results:
-                self._save_query_result(metric_vo, result, created_at, metric_job_id)
+            self._save_query_results(metric_vo, results, created_at, metric_job_id)
             self._delete_changed_metric_data(metric_vo, created_at, metric_job_id)
 
             if metric_vo.metric_type == "COUNTER":
@@ -188,8 +338,46 @@ class MetricManager(BaseManager):
             self._delete_invalid_metric_data(metric_vo, metric_job_id)
             self._delete_old_metric_data(metric_vo)
             self._delete_analyze_cache(metric_vo.domain_id, metric_vo.metric_id)
+            self.update_metric_by_vo({"status": "DONE", "is_new": False}, metric_vo)
 
-        self.update_metric_by_vo({"status": "DONE", "is_new": False}, metric_vo)
+    def _acquire_run_lease(self, metric_vo: Metric, metric_job_id: str) -> bool:
+        # the lease expires if the worker running the job is killed
+        now = datetime.utcnow()
+        expires_at = now + timedelta(
+            seconds=config.get_global("METRIC_RUN_LEASE_TTL", 3600)
+        )
+
+        result = self.metric_model._get_collection().update_one(
+            {
+                "metric_id": metric_vo.metric_id,
+                "domain_id": metric_vo.domain_id,
+                "$or": [
+                    {"run_lease": None},
+                    {"run_lease.expires_at": {"$lt": now}},
+                    {"run_lease.metric_job_id": metric_job_id},
+                ],
+            },
+            {
+                "$set": {
+                    "run_lease": {
+                        "metric_job_id": metric_job_id,
+                        "expires_at": expires_at,
+                    }
+                }
+            },
+        )
+
+        return result.matched_count > 0
+
+    def _release_run_lease(self, metric_vo: Metric, metric_job_id: str) -> None:
+        self.metric_model._get_collection().update_one(
+            {
+                "metric_id": metric_vo.metric_id,
+                "domain_id": metric_vo.domain_id,
+                "run_lease.metric_job_id": metric_job_id,
+            },
+            {"$set": {"run_lease": None}},
+        )
 
     def _check_metric_status(self, metric_vo: Metric) -> None:
         for i in range(200):
@@ -202,6 +390,26 @@ class MetricManager(BaseManager):
         _LOGGER.warning(f"[_check_metric_status] Timeout: {metric_vo.metric_id}")
         self.update_metric_by_vo({"status": "DONE"}, metric_vo)
 
+    def validate_query_options(
+        self, metric_vo: Metric, workspace_id: str = None, query_options: dict = None
+    ) -> None:
+        """Check the query options with a query matching no resources
+
+        The query is checked by the database without scanning the resources.
+        The query options of identity.User are only used after listing users,
+        so they aren't checked.
+        """
+
+        if metric_vo.resource_type == "identity.User":
+            return
+
+        query = copy.deepcopy(query_options or metric_vo.query_options)
+        query["filter"] = query.get("filter", []) + [
+            {"k": "workspace_id", "v": [], "o": "in"}
+        ]
+
+        self.analyze_resource(metric_vo, workspace_id, query_options=query)
+
     def analyze_resource(
         self,
         metric_vo: Metric,
@@ -376,9 +584,30 @@ class MetricManager(BaseManager):
 
         return True
 
-    def _save_query_result(
-        self, metric_vo: Metric, result: dict, created_at: datetime, metric_job_id: str
+    def _save_query_results(
+        self,
+        metric_vo: Metric,
+        results: List[dict],
+        created_at: datetime,
+        metric_job_id: str,
     ) -> None:
+        bulk_size = max(config.get_global("METRIC_DATA_BULK_SIZE", 1000), 1)
+
+        for idx in range(0, len(results), bulk_size):
+            data_list = [
+                self._make_metric_data(metric_vo, result, created_at, metric_job_id)
+                for result in results[idx : idx + bulk_size]
+            ]
+
+            self.metric_data_mgr.create_metric_data_many(data_list)
+
+            if metric_vo.metric_type == "GAUGE":
+                self.metric_data_mgr.create_monthly_metric_data_many(data_list)
+
+    @staticmethod
+    def _make_metric_data(
+        metric_vo: Metric, result: dict, created_at: datetime, metric_job_id: str
+    ) -> dict:
         data = {
             "metric_id": metric_vo.metric_id,
             "metric_job_id": metric_job_id,
@@ -405,75 +634,34 @@ class MetricManager(BaseManager):
             ]:
                 data["labels"][key] = value
 
-        self.metric_data_mgr.create_metric_data(data)
-
-        if metric_vo.metric_type == "GAUGE":
-            self.metric_data_mgr.create_monthly_metric_data(data)
+        return data
 
     def _aggregate_monthly_metric_data(
         self, metric_vo: Metric, created_at: datetime, metric_job_id: str
     ) -> None:
-        domain_id = metric_vo.domain_id
         metric_id = metric_vo.metric_id
-        created_month = created_at.strftime("%Y-%m")
-        created_year = created_at.strftime("%Y")
-        group_by = []
-
-        for label_info in metric_vo.labels_info:
-            group_by.append(label_info["key"])
-
-        query = {
-            "group_by": group_by,
-            "fields": {
-                "value": {
-                    "key": "value",
-                    "operator": "sum",
-                }
-            },
-            "filter": [
-                {"k": "metric_id", "v": metric_id, "o": "eq"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "created_month", "v": created_month, "o": "eq"},
-                {"k": "metric_job_id", "v": metric_job_id, "o": "eq"},
-            ],
-        }
-
-        response = self.metric_data_mgr.analyze_metric_data(
-            query, domain_id, target="PRIMARY", status="IN_PROGRESS"
-        )
-        results = response.get("results", [])
-
-        _LOGGER.debug(
-            f"[_aggregate_monthly_metric_data] Aggregate query results ({metric_id}): {len(results)}"
-        )
-
-        for result in results:
-            data = {
-                "metric_id": metric_vo.metric_id,
+        label_keys = [label_info["key"] for label_info in metric_vo.labels_info]
+
+        # metric data are summed up by labels in the database
+        aggregated_count = self.metric_data_mgr.aggregate_monthly_metric_data(
+            metric_vo.domain_id,
+            metric_id,
+            metric_job_id,
+            created_at.strftime("%Y-%m"),
+            label_keys,
+            {
+                "metric_id": metric_id,
                 "metric_job_id": metric_job_id,
-                "value": result["value"],
                 "unit": metric_vo.unit,
-                "labels": {},
                 "namespace_id": metric_vo.namespace_id,
-                "service_account_id": result.get("service_account_id"),
-                "project_id": result.get("project_id"),
-                "workspace_id": result["workspace_id"],
                 "domain_id": metric_vo.domain_id,
-                "created_year": created_year,
-                "created_month": created_month,
-            }
+                "created_year": created_at.strftime("%Y"),
+            },
+        )
 
-            for key, value in result.items():
-                if key not in [
-                    "service_account_id",
-                    "project_id",
-                    "workspace_id",
-                    "domain_id",
-                    "value",
-                ]:
-                    data["labels"][key] = value
-
-            self.metric_data_mgr.create_monthly_metric_data(data)
+        _LOGGER.debug(
+            f"[_aggregate_monthly_metric_data] Aggregate query results ({metric_id}): {aggregated_count}"
+        )
 
     def _delete_changed_metric_data(
         self, metric_vo: Metric, created_at: datetime, metric_job_id: str
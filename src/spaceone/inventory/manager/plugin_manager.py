@@ -1,14 +1,31 @@
 import logging
-from typing import Tuple
+from typing import Tuple, Union
 
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.inventory.lib.plugin_endpoint_cache import PluginEndpointCache
 
 __ALL__ = ["PluginManager"]
 
 _LOGGER = logging.getLogger(__name__)
 
+_ENDPOINT_CACHE: Union[PluginEndpointCache, None] = None
+
+
+def get_endpoint_cache() -> PluginEndpointCache:
+    global _ENDPOINT_CACHE
+
+    if _ENDPOINT_CACHE is None:
+        _ENDPOINT_CACHE = PluginEndpointCache(
+            ttl=config.get_global("PLUGIN_ENDPOINT_CACHE_TTL", 60),
+            refresh_interval=config.get_global(
+                "PLUGIN_ENDPOINT_CACHE_REFRESH_INTERVAL", 45
+            ),
+        )
+
+    return _ENDPOINT_CACHE
+
 
 class PluginManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -23,6 +40,26 @@ class PluginManager(BaseManager):
         domain_id: str,
         upgrade_mode: str = "AUTO",
         version: str = None,
+    ) -> Tuple[str, str]:
+        return get_endpoint_cache().get(
+            (plugin_id, version, upgrade_mode, domain_id),
+            lambda: self._get_endpoint(plugin_id, domain_id, upgrade_mode, version),
+        )
+
+    @staticmethod
+    def invalidate_endpoint(endpoint: str) -> None:
+        get_endpoint_cache().invalidate(endpoint)
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        return get_endpoint_cache().get_stats()
+
+    def _get_endpoint(
+        self,
+        plugin_id: str,
+        domain_id: str,
+        upgrade_mode: str,
+        version: Union[str, None],
     ) -> Tuple[str, str]:
         system_token = config.get_global("TOKEN")
 
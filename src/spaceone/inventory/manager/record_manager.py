@@ -1,9 +1,10 @@
 import logging
-from typing import Tuple
+from typing import Tuple, List, Union
 
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.model.record_model import Record
+from spaceone.inventory.lib import bulk_writer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +26,19 @@ class RecordManager(BaseManager):
 
         return record_vo
 
+    def create_records(self, params_list: List[dict]) -> List[Union[Record, Exception]]:
+        def _rollback(record_ids: List[str]):
+            _LOGGER.info(f"[ROLLBACK] Delete Records : {record_ids}")
+            self.filter_records(record_id=record_ids).delete()
+
+        results = bulk_writer.insert_many(self.record_model, params_list)
+        record_ids = [vo.record_id for vo in results if isinstance(vo, Record)]
+
+        if len(record_ids) > 0:
+            self.transaction.add_rollback(_rollback, record_ids)
+
+        return results
+
     def get_record(self, record_id: str, domain_id: str) -> Record:
         return self.record_model.get(record_id=record_id, domain_id=domain_id)
 
@@ -1,17 +1,39 @@
 import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Union
+
+from spaceone.core import config, utils
 from spaceone.core.manager import BaseManager
+from spaceone.inventory.lib.reference_cache import ReferenceCache
 from spaceone.inventory.manager.region_manager import RegionManager
 from spaceone.inventory.manager.identity_manager import IdentityManager
 
 _LOGGER = logging.getLogger(__name__)
 
+_REFERENCE_CACHE: Union[ReferenceCache, None] = None
+
+
+def get_reference_cache() -> ReferenceCache:
+    global _REFERENCE_CACHE
+
+    if _REFERENCE_CACHE is None:
+        _REFERENCE_CACHE = ReferenceCache(
+            max_size=config.get_global("REFERENCE_CACHE_MAX_SIZE", 100),
+            ttl=config.get_global("REFERENCE_CACHE_TTL", 3600),
+            refresh_interval=config.get_global("REFERENCE_CACHE_REFRESH_INTERVAL", 60),
+        )
+
+    return _REFERENCE_CACHE
+
 
 class ReferenceManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.reference_cache = get_reference_cache()
         self._project_map = None
         self._service_account_map = None
         self._region_map = None
+        self._unknown_ids = set()
 
     def get_reference_name(
         self,
@@ -20,53 +42,166 @@ class ReferenceManager(BaseManager):
         domain_id: str,
         workspace_id: str = None,
     ) -> str:
-        if resource_type == "identity.Project":
-            if self._project_map is None:
-                self._init_project(domain_id)
+        if resource_type in ["identity.Project", "identity.ServiceAccount"]:
+            names = self._get_identity_names(resource_type, domain_id)
 
-            return self._project_map.get(resource_id, resource_id)
+            if resource_id not in names:
+                return self._get_unknown_name(resource_type, resource_id, domain_id)
 
-        elif resource_type == "identity.ServiceAccount":
-            if self._service_account_map is None:
-                self._init_service_account(domain_id)
-
-            return self._service_account_map.get(resource_id, resource_id)
+            return names[resource_id]
 
         elif resource_type == "inventory.Region":
             if self._region_map is None:
-                self._init_region(domain_id, workspace_id)
+                self._region_map = self.reference_cache.get_names(
+                    (resource_type, domain_id, workspace_id),
+                    lambda updated_since: self._load_regions(
+                        domain_id, workspace_id, updated_since
+                    ),
+                )
 
             return self._region_map.get(resource_id, resource_id)
 
         else:
             return resource_id
 
-    def _init_project(self, domain_id: str) -> None:
-        self._project_map = {}
+    def load_unknown_names(
+        self, resource_type: str, resource_ids: Iterable[str], domain_id: str
+    ) -> None:
+        """load names of the resources missing in the cached names with one query
+
+        Args:
+            resource_type (str): 'identity.Project' or 'identity.ServiceAccount'
+            resource_ids (list): ids of the resources to be exported
+            domain_id (str): domain_id
+        """
+
+        if resource_type not in ["identity.Project", "identity.ServiceAccount"]:
+            return
+
+        names = self._get_identity_names(resource_type, domain_id)
+        unknown_ids = set()
+
+        for resource_id in resource_ids:
+            if (
+                isinstance(resource_id, str)
+                and resource_id
+                and resource_id not in names
+                and resource_id not in self._unknown_ids
+            ):
+                unknown_ids.add(resource_id)
+
+        if unknown_ids:
+            self._load_unknown_names(resource_type, list(unknown_ids), domain_id)
+
+    def _get_identity_names(self, resource_type: str, domain_id: str) -> dict:
+        # Names shared by all users are loaded with the system token
+        if resource_type == "identity.Project":
+            if self._project_map is None:
+                self._project_map = self.reference_cache.get_names(
+                    (resource_type, domain_id),
+                    lambda updated_since: self._load_projects(domain_id, updated_since),
+                )
+
+            return self._project_map
+
+        else:
+            if self._service_account_map is None:
+                self._service_account_map = self.reference_cache.get_names(
+                    (resource_type, domain_id),
+                    lambda updated_since: self._load_service_accounts(
+                        domain_id, updated_since
+                    ),
+                )
+
+            return self._service_account_map
+
+    def _get_unknown_name(
+        self, resource_type: str, resource_id: str, domain_id: str
+    ) -> str:
+        if resource_id in self._unknown_ids:
+            return resource_id
+
+        names = self._load_unknown_names(resource_type, [resource_id], domain_id)
+        return names.get(resource_id, resource_id)
+
+    def _load_unknown_names(
+        self, resource_type: str, resource_ids: List[str], domain_id: str
+    ) -> Dict[str, str]:
+        # Ids are resources created after the names are cached or deleted ones,
+        # which are not looked up again by this manager
+        self._unknown_ids.update(resource_ids)
+
+        if resource_type == "identity.Project":
+            names = self._load_projects(domain_id, project_ids=resource_ids)
+            self._project_map = {
+                **self._get_identity_names(resource_type, domain_id),
+                **names,
+            }
+        else:
+            names = self._load_service_accounts(
+                domain_id, service_account_ids=resource_ids
+            )
+            self._service_account_map = {
+                **self._get_identity_names(resource_type, domain_id),
+                **names,
+            }
+
+        self.reference_cache.add_names((resource_type, domain_id), names)
+
+        return names
+
+    def _load_projects(
+        self,
+        domain_id: str,
+        updated_since: datetime = None,
+        project_ids: List[str] = None,
+    ) -> Dict[str, str]:
+        project_map = {}
         identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
 
-        query = {"only": ["project_id", "name"]}
+        query = {
+            "filter": self._make_reference_filter(
+                "project_id", project_ids, updated_since
+            ),
+            "only": ["project_id", "name"],
+        }
 
-        response = identity_mgr.list_projects({"query": query}, domain_id)
+        response = identity_mgr.list_domain_projects(query, domain_id)
         for project_info in response.get("results", []):
             project_id = project_info["project_id"]
             project_name = project_info["name"]
-            self._project_map[project_id] = project_name
+            project_map[project_id] = project_name
 
-    def _init_service_account(self, domain_id: str) -> None:
-        self._service_account_map = {}
+        return project_map
+
+    def _load_service_accounts(
+        self,
+        domain_id: str,
+        updated_since: datetime = None,
+        service_account_ids: List[str] = None,
+    ) -> Dict[str, str]:
+        service_account_map = {}
         identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
 
-        query = {"only": ["service_account_id", "name"]}
+        query = {
+            "filter": self._make_reference_filter(
+                "service_account_id", service_account_ids, updated_since
+            ),
+            "only": ["service_account_id", "name"],
+        }
 
-        response = identity_mgr.list_service_accounts(query, domain_id)
+        response = identity_mgr.list_domain_service_accounts(query, domain_id)
         for sa_info in response.get("results", []):
             sa_id = sa_info["service_account_id"]
             sa_name = sa_info["name"]
-            self._service_account_map[sa_id] = sa_name
+            service_account_map[sa_id] = sa_name
+
+        return service_account_map
 
-    def _init_region(self, domain_id: str, workspace_id: str = None) -> None:
-        self._region_map = {}
+    def _load_regions(
+        self, domain_id: str, workspace_id: str = None, updated_since: datetime = None
+    ) -> Dict[str, str]:
+        region_map = {}
         region_mgr: RegionManager = self.locator.get_manager("RegionManager")
 
         conditions = {
@@ -76,9 +211,38 @@ class ReferenceManager(BaseManager):
         if workspace_id:
             conditions["workspace_id"] = workspace_id
 
-        region_vos = region_mgr.filter_regions(**conditions)
+        if updated_since:
+            conditions["updated_at__gte"] = updated_since
+
+        region_vos = region_mgr.filter_regions(**conditions).only("name", "region_code")
         for region_vo in region_vos:
             region_code = region_vo.region_code
             name = region_vo.name
 
-            self._region_map[region_vo.region_code] = f"{name} | {region_code}"
+            region_map[region_code] = f"{name} | {region_code}"
+
+        return region_map
+
+    @staticmethod
+    def _make_reference_filter(
+        id_key: str, resource_ids: List[str] = None, updated_since: datetime = None
+    ) -> list:
+        _filter = []
+
+        if resource_ids:
+            _filter.append({"k": id_key, "v": resource_ids, "o": "in"})
+
+        if updated_since:
+            _filter.append(
+                {
+                    "k": "updated_at",
+                    "v": utils.datetime_to_iso8601(updated_since),
+                    "o": "datetime_gte",
+                }
+            )
+
+        return _filter
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        return get_reference_cache().get_stats()
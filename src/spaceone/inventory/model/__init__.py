@@ -1,7 +1,7 @@
 from spaceone.inventory.model.region_model import Region
 from spaceone.inventory.model.collector_model import Collector
 from spaceone.inventory.model.job_model import Job
-from spaceone.inventory.model.job_task_model import JobTask
+from spaceone.inventory.model.job_task_model import JobTask, JobTaskError
 from spaceone.inventory.model.cloud_service_model import CloudService
 from spaceone.inventory.model.cloud_service_type_model import CloudServiceType
 from spaceone.inventory.model.cloud_service_query_set_model import CloudServiceQuerySet
@@ -43,6 +43,7 @@ class CloudService(MongoModel):
     workspace_id = StringField(max_length=40)
     domain_id = StringField(max_length=40)
     collection_info = EmbeddedDocumentField(CollectionInfo, default=CollectionInfo)
+    content_hash = StringField(max_length=40, default=None, null=True)
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
     deleted_at = DateTimeField(default=None, null=True)
@@ -65,6 +66,7 @@ class CloudService(MongoModel):
             "cloud_service_group",
             "cloud_service_type",
             "collection_info",
+            "content_hash",
             "updated_at",
             "deleted_at",
         ],
@@ -7,6 +7,7 @@ from spaceone.inventory.model.region_model import Region
 
 class CloudServiceStats(MongoModel):
     query_set_id = StringField(max_length=40, required=True)
+    stats_job_id = StringField(max_length=40, default=None, null=True)
     status = StringField(
         max_length=20, default="IN_PROGRESS", choices=("IN_PROGRESS", "DONE")
     )
@@ -73,12 +74,17 @@ class CloudServiceStats(MongoModel):
                 "fields": ["domain_id", "query_set_id"],
                 "name": "COMPOUND_INDEX_FOR_DELETE",
             },
+            {
+                "fields": ["domain_id", "query_set_id", "stats_job_id", "status"],
+                "name": "COMPOUND_INDEX_FOR_STATS_JOB",
+            },
         ],
     }
 
 
 class MonthlyCloudServiceStats(MongoModel):
     query_set_id = StringField(max_length=40, required=True)
+    stats_job_id = StringField(max_length=40, default=None, null=True)
     status = StringField(
         max_length=20, default="IN_PROGRESS", choices=("IN_PROGRESS", "DONE")
     )
@@ -134,6 +140,10 @@ class MonthlyCloudServiceStats(MongoModel):
                 "fields": ["domain_id", "query_set_id"],
                 "name": "COMPOUND_INDEX_FOR_DELETE",
             },
+            {
+                "fields": ["domain_id", "query_set_id", "stats_job_id", "status"],
+                "name": "COMPOUND_INDEX_FOR_STATS_JOB",
+            },
         ],
     }
 
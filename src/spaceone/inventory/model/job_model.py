@@ -15,6 +15,9 @@ class Job(MongoModel):
     remained_tasks = IntField(default=0)
     success_tasks = IntField(min_value=0, default=0)
     failure_tasks = IntField(min_value=0, default=0)
+    running_tasks = IntField(min_value=0, default=0)
+    task_leases = DictField(default={})
+    is_changed = BooleanField(default=None, null=True)
     collector_id = StringField(max_length=40)
     request_secret_id = StringField(max_length=40, null=True, default=None)
     request_workspace_id = StringField(max_length=40, null=True, default=None)
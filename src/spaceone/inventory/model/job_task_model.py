@@ -24,7 +24,12 @@ class JobTask(MongoModel):
     disconnected_count = IntField(default=0)
     failure_count = IntField(default=0)
     total_count = IntField(default=0)
+    match_index_hit_count = IntField(default=0)
+    match_index_miss_count = IntField(default=0)
+    admission_rejected_count = IntField(default=0)
+    admission_wait_time = FloatField(default=0)
     errors = ListField(EmbeddedDocumentField(Error, default=None, null=True))
+    retry_tasks = ListField(DictField(), default=[])
     job_id = StringField(max_length=40)
     secret_id = StringField(max_length=40)
     collector_id = StringField(max_length=40)
@@ -46,6 +51,10 @@ class JobTask(MongoModel):
             "deleted_count",
             "disconnected_count",
             "failure_count",
+            "match_index_hit_count",
+            "match_index_miss_count",
+            "admission_rejected_count",
+            "admission_wait_time",
             "errors",
             "started_at",
             "finished_at",
@@ -82,6 +91,11 @@ class JobTask(MongoModel):
                 "fields": ["domain_id", "workspace_id", "project_id"],
                 "name": "COMPOUND_INDEX_FOR_SEARCH_1",
             },
+            {
+                "fields": ["retry_tasks.retry_at"],
+                "name": "RETRY_TASK_INDEX",
+                "sparse": True,
+            },
             "status",
             "job_id",
             "collector_id",
@@ -90,3 +104,30 @@ class JobTask(MongoModel):
             "domain_id",
         ],
     }
+
+
+class JobTaskError(MongoModel):
+    job_task_id = StringField(max_length=40)
+    job_id = StringField(max_length=40)
+    collector_id = StringField(max_length=40)
+    error_code = StringField()
+    message = StringField()
+    additional = DictField()
+    domain_id = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        "updatable_fields": [],
+        "ordering": ["created_at"],
+        "indexes": [
+            {
+                "fields": ["domain_id", "job_task_id"],
+                "name": "COMPOUND_INDEX_FOR_SEARCH",
+            },
+            {
+                "fields": ["created_at"],
+                "expireAfterSeconds": 604800,  # 7 days
+                "name": "TTL_INDEX",
+            },
+        ],
+    }
@@ -7,6 +7,8 @@ class Metric(MongoModel):
     metric_job_id = StringField(max_length=40)
     name = StringField(max_length=80)
     status = StringField(max_length=20, choices=["IN_PROGRESS", "DONE"], default="DONE")
+    run_lease = DictField(default=None, null=True)
+    run_retry = DictField(default=None, null=True)
     metric_type = StringField(max_length=40, choices=["COUNTER", "GAUGE"])
     resource_type = StringField()
     query_options = DictField(required=True, default=None)
@@ -56,6 +58,11 @@ class Metric(MongoModel):
                 ],
                 "name": "COMPOUND_INDEX_FOR_SEARCH_1",
             },
+            {
+                "fields": ["run_retry.retry_at"],
+                "name": "RUN_RETRY_INDEX",
+                "sparse": True,
+            },
             "metric_type",
             "resource_type",
             "is_managed",
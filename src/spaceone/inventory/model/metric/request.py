@@ -29,6 +29,7 @@ class MetricCreateRequest(BaseModel):
     tags: Union[dict, None] = {}
     namespace_id: str
     resource_group: ResourceGroup
+    wait: Union[int, None] = None
     workspace_id: Union[str, None] = None
     domain_id: str
 
@@ -40,6 +41,7 @@ class MetricUpdateRequest(BaseModel):
     date_field: Union[str, None] = None
     unit: Union[str, None] = None
     tags: Union[dict, None] = None
+    wait: Union[int, None] = None
     workspace_id: Union[str, None] = None
     domain_id: str
 
@@ -52,6 +54,7 @@ class MetricDeleteRequest(BaseModel):
 
 class MetricRunRequest(BaseModel):
     metric_id: str
+    wait: Union[int, None] = None
     workspace_id: Union[str, None] = None
     domain_id: str
 
@@ -4,11 +4,10 @@ from spaceone.core.service import *
 from spaceone.core import config
 from spaceone.inventory.manager.identity_manager import IdentityManager
 from spaceone.inventory.manager.cleanup_manager import CleanupManager
-from spaceone.inventory.manager.cloud_service_manager import CloudServiceManager
-from spaceone.inventory.manager.record_manager import RecordManager
-from spaceone.inventory.manager.note_manager import NoteManager
 from spaceone.inventory.manager.job_manager import JobManager
 from spaceone.inventory.manager.job_task_manager import JobTaskManager
+from spaceone.inventory.manager.metric_manager import MetricManager
+from spaceone.inventory.manager.secret_manager import SecretManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +54,60 @@ class CleanupService(BaseService):
         job_timeout = config.get_global("JOB_TIMEOUT", 2)  # hours
         job_mgr.update_job_timeout_by_hour(job_timeout, domain_id)
 
+    @transaction
+    def push_retry_tasks(self, params: dict) -> None:
+        """Push the job tasks and metric jobs again, whose retries are due
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        job_task_mgr: JobTaskManager = self.locator.get_manager(JobTaskManager)
+        secret_mgr: SecretManager = self.locator.get_manager(SecretManager)
+
+        for retry_params in job_task_mgr.pop_due_retry_tasks():
+            job_task_id = retry_params["job_task_id"]
+            domain_id = retry_params["domain_id"]
+            secret_id = retry_params["secret_info"]["secret_id"]
+
+            try:
+                retry_params["secret_data"] = secret_mgr.get_secret_data(
+                    secret_id, domain_id
+                )
+                job_task_mgr.push_job_task(retry_params)
+            except Exception as e:
+                # the sub task is closed as a failure, not to leave the job task pending
+                if isinstance(e, ERROR_BASE):
+                    error_code, error_message = e.error_code, e.message
+                else:
+                    error_code, error_message = "ERROR_UNKNOWN", str(e)
+
+                job_task_vo = job_task_mgr.get(job_task_id, domain_id)
+                job_task_mgr.add_error(
+                    job_task_vo,
+                    error_code,
+                    f"Failed to retry job task: {error_message}",
+                    {"secret_id": secret_id},
+                )
+                job_task_mgr.make_failure_by_vo(job_task_vo)
+
+        metric_mgr: MetricManager = self.locator.get_manager(MetricManager)
+
+        for run_retry in metric_mgr.pop_due_run_retries():
+            try:
+                metric_vo = metric_mgr.get_metric(
+                    run_retry["metric_id"], run_retry["domain_id"]
+                )
+                metric_mgr.push_task(
+                    metric_vo,
+                    is_yesterday=run_retry["is_yesterday"],
+                    metric_job_id=run_retry["metric_job_id"],
+                )
+            except Exception as e:
+                _LOGGER.error(f"[push_retry_tasks] error: {e}", exc_info=True)
+
     @transaction
     @check_required(["domain_id"])
     def terminate_jobs(self, params):
@@ -105,7 +158,9 @@ class CleanupService(BaseService):
         """Delete resources based on domain's delete policy
         Args:
             params (dict): {
-                'domain_id': 'str'      # required
+                'domain_id': 'str',     # required
+                'resource_type': 'str',
+                'dry_run': 'bool'
             }
 
         Returns:
@@ -117,12 +172,20 @@ class CleanupService(BaseService):
 
         if domain_id not in exclude_domains:
             policies = config.get_global("DEFAULT_DELETE_POLICIES", {})
+            if resource_type := params.get("resource_type"):
+                policies = {
+                    key: value
+                    for key, value in policies.items()
+                    if key == resource_type
+                }
+
+            dry_run = params.get("dry_run", config.get_global("CLEANUP_DRY_RUN", False))
 
             cleanup_mgr: CleanupManager = self.locator.get_manager(CleanupManager)
             for resource_type, hour in policies.items():
                 try:
                     deleted_count = cleanup_mgr.delete_resources_by_policy(
-                        resource_type, hour, domain_id
+                        resource_type, hour, domain_id, dry_run
                     )
                     if deleted_count > 0:
                         _LOGGER.debug(
@@ -140,19 +203,14 @@ class CleanupService(BaseService):
         """
         Args:
             params (dict): {
-                'domain_id': 'str'      # required
+                'domain_id': 'str',     # required
+                'dry_run': 'bool'
             }
 
         Returns:
             None
         """
 
-        cloud_svc_mgr: CloudServiceManager = self.locator.get_manager(
-            CloudServiceManager
-        )
-        record_mgr: RecordManager = self.locator.get_manager(RecordManager)
-        note_mgr: NoteManager = self.locator.get_manager(NoteManager)
-
         domain_id = params["domain_id"]
         termination_time = config.get_global(
             "RESOURCE_TERMINATION_TIME", 3 * 30
@@ -161,39 +219,14 @@ class CleanupService(BaseService):
             f"[terminate_resources] RESOURCE_TERMINATION_TIME: {termination_time} days"
         )
 
-        query = {
-            "filter": [
-                {
-                    "k": "deleted_at",
-                    "v": datetime.utcnow() - timedelta(days=termination_time),
-                    "o": "lt",
-                },
-                {"k": "state", "v": "DELETED", "o": "eq"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-            ],
-            "only": ["cloud_service_id"],
-        }
-
-        cloud_svc_vos, total_count = cloud_svc_mgr.list_cloud_services(query)
+        cleanup_mgr: CleanupManager = self.locator.get_manager(CleanupManager)
+        terminated_count = cleanup_mgr.terminate_cloud_services(
+            termination_time,
+            domain_id,
+            params.get("dry_run", config.get_global("CLEANUP_DRY_RUN", False)),
+        )
 
-        if total_count > 0:
+        if terminated_count > 0:
             _LOGGER.info(
-                f"[terminate_resources] Terminate cloud services: {str(total_count)}"
-            )
-
-        for cloud_svc_vo in cloud_svc_vos:
-            cloud_service_id = cloud_svc_vo.cloud_service_id
-
-            # Cascade Delete Records
-            record_vos = record_mgr.filter_records(
-                cloud_service_id=cloud_service_id, domain_id=domain_id
+                f"[terminate_resources] Terminate cloud services: {str(terminated_count)}"
             )
-            record_vos.delete()
-
-            # Cascade Delete Notes
-            note_vos = note_mgr.filter_notes(
-                cloud_service_id=cloud_service_id, domain_id=domain_id
-            )
-            note_vos.delete()
-
-            cloud_svc_mgr.terminate_cloud_service(cloud_service_id, domain_id)
@@ -362,6 +362,7 @@ class CloudServiceQuerySetService(BaseService):
 
         Args:
             params (dict): {
+                'incremental': 'bool',      # copy the stats of unchanged query sets
                 'domain_id': 'str',         # injected from auth (required)
             }
 
@@ -370,12 +371,16 @@ class CloudServiceQuerySetService(BaseService):
         """
 
         domain_id = params["domain_id"]
+        incremental = params.get(
+            "incremental", config.get_global("STATS_INCREMENTAL", False)
+        )
         query_set_vos = self.cloud_svc_query_set_mgr.filter_cloud_service_query_sets(
             domain_id=domain_id
         )
 
-        for query_set_vo in query_set_vos:
-            self.cloud_svc_query_set_mgr.run_cloud_service_query_set(query_set_vo)
+        self.cloud_svc_query_set_mgr.run_cloud_service_query_sets(
+            list(query_set_vos), incremental
+        )
 
     @transaction()
     def run_all_query_sets(self, params: dict) -> None:
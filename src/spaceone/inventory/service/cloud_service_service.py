@@ -100,75 +100,84 @@ class CloudServiceService(BaseService):
     def create_resource(self, params: dict) -> CloudService:
         ch_mgr: ChangeHistoryManager = self.locator.get_manager("ChangeHistoryManager")
 
-        if json_data := params.get("json_data"):
-            params["data"] = utils.load_json(json_data)
-            if not isinstance(params["data"], dict):
-                raise ERROR_INVALID_PARAMETER_TYPE(
-                    key="json_data", type=type(params["data"])
-                )
+        params = self._convert_create_params(params)
+        params = self._change_cloud_service_data(params)
+        params = self._make_create_params(params)
 
-            del params["json_data"]
-        elif "data" not in params:
-            raise ERROR_REQUIRED_PARAMETER(key="data")
+        cloud_svc_vo = self.cloud_svc_mgr.create_cloud_service(params)
 
-        if json_metadata := params.get("json_metadata"):
-            params["metadata"] = utils.load_json(json_metadata)
-            if not isinstance(params["metadata"], dict):
-                raise ERROR_INVALID_PARAMETER_TYPE(
-                    key="json_metadata", type=type(params["metadata"])
-                )
+        # Create New History
+        ch_mgr.add_new_history(cloud_svc_vo, params)
 
-            del params["json_metadata"]
+        # Create Collection State
+        self.state_mgr.create_collection_state(
+            cloud_svc_vo.cloud_service_id, params["domain_id"]
+        )
 
-        domain_id = params["domain_id"]
-        workspace_id = params["workspace_id"]
-        secret_project_id = self.transaction.get_meta("secret.project_id")
-        provider = params["provider"]
+        return cloud_svc_vo
 
-        if instance_size := params.get("instance_size"):
-            if not isinstance(instance_size, float):
-                raise ERROR_INVALID_PARAMETER_TYPE(key="instance_size", type="float")
+    def create_resources(
+        self, params_list: List[dict]
+    ) -> List[Union[CloudService, Exception]]:
+        """Create cloud services in batch (used by collector)
+        Args:
+            params_list (list): list of create_resource params in the same domain
 
-        if "tags" in params:
-            params["tags"] = self._convert_tags_to_dict(params["tags"])
+        Returns:
+            results (list): created cloud_service_vo or exception per request
+        """
 
-        # Change data through Collector Rule
-        if self._is_created_by_collector():
-            params = self.collector_rule_mgr.change_cloud_service_data(
-                self.collector_id, domain_id, params
-            )
+        ch_mgr: ChangeHistoryManager = self.locator.get_manager("ChangeHistoryManager")
 
-        if "tags" in params:
-            params["tags"], params["tag_keys"] = self._convert_tags_to_hash(
-                params["tags"], provider
-            )
+        results: List[Union[CloudService, Exception]] = [None] * len(params_list)
+        converted_params_list = []
+        create_params_list = []
+        indexes = []
 
-        if "project_id" in params:
-            self.identity_mgr.get_project(params["project_id"], domain_id)
-        elif secret_project_id:
-            params["project_id"] = secret_project_id
+        for idx, params in enumerate(params_list):
+            try:
+                converted_params_list.append((idx, self._convert_create_params(params)))
+            except Exception as e:
+                results[idx] = e
 
-        params["ref_cloud_service_type"] = self._make_cloud_service_type_key(params)
+        # collector rules use the converted sources (e.g. data.* or tags.*)
+        changed_params_list = self._change_cloud_service_data_list(
+            [params for idx, params in converted_params_list]
+        )
 
-        if "region_code" in params:
-            params["ref_region"] = self._make_region_key(
-                domain_id, workspace_id, provider, params["region_code"]
-            )
+        for (idx, _), params in zip(converted_params_list, changed_params_list):
+            if isinstance(params, Exception):
+                results[idx] = params
+                continue
 
-        if "metadata" in params:
-            params["metadata"] = self._convert_metadata(params["metadata"], provider)
+            try:
+                create_params_list.append(self._make_create_params(params))
+                indexes.append(idx)
+            except Exception as e:
+                results[idx] = e
 
-        params["collection_info"] = self._get_collection_info()
+        if len(create_params_list) == 0:
+            return results
 
-        cloud_svc_vo = self.cloud_svc_mgr.create_cloud_service(params)
+        histories = []
+        created_ids = []
+        domain_id = create_params_list[0]["domain_id"]
 
-        # Create New History
-        ch_mgr.add_new_history(cloud_svc_vo, params)
+        create_results = self.cloud_svc_mgr.create_cloud_services(create_params_list)
+        for idx, params, result in zip(indexes, create_params_list, create_results):
+            results[idx] = result
 
-        # Create Collection State
-        self.state_mgr.create_collection_state(cloud_svc_vo.cloud_service_id, domain_id)
+            if isinstance(result, CloudService):
+                histories.append((result, params))
+                created_ids.append(result.cloud_service_id)
 
-        return cloud_svc_vo
+        # Create New Histories
+        ch_mgr.add_new_histories(histories)
+
+        # Create Collection States
+        self.state_mgr.create_collection_states(created_ids, domain_id)
+
+        return results
 
     @transaction(
         permission="inventory:CloudService.write",
@@ -206,6 +215,208 @@ class CloudServiceService(BaseService):
     def update_resource(self, params: dict) -> CloudService:
         ch_mgr: ChangeHistoryManager = self.locator.get_manager("ChangeHistoryManager")
 
+        cloud_service_id = params["cloud_service_id"]
+        workspace_id = params["workspace_id"]
+        user_projects = params.get("user_projects")
+        domain_id = params["domain_id"]
+
+        params = self._convert_update_params(params)
+        params = self._change_cloud_service_data(params)
+        content_hash = self._make_content_hash(params)
+
+        cloud_svc_vo: CloudService = self.cloud_svc_mgr.get_cloud_service(
+            cloud_service_id, domain_id, workspace_id, user_projects
+        )
+
+        if content_hash and content_hash == cloud_svc_vo.content_hash:
+            # Same content as the last collection, update collection info only
+            self.cloud_svc_mgr.update_collection_info_by_vos(
+                [cloud_svc_vo], self._get_collection_info()
+            )
+            self.state_mgr.reset_collection_states([cloud_service_id], domain_id)
+            return cloud_svc_vo
+
+        params["content_hash"] = content_hash
+        params, old_cloud_svc_data = self._make_update_params(params, cloud_svc_vo)
+
+        cloud_svc_vo = self.cloud_svc_mgr.update_cloud_service_by_vo(
+            params, cloud_svc_vo
+        )
+
+        # Create Update History
+        ch_mgr.add_update_history(cloud_svc_vo, params, old_cloud_svc_data)
+
+        # Update Collection History
+        self.state_mgr.reset_collection_states([cloud_service_id], domain_id)
+
+        if "project_id" in params:
+            self._update_project_of_notes(
+                cloud_service_id, params["project_id"], workspace_id, domain_id
+            )
+
+        return cloud_svc_vo
+
+    def update_resources(
+        self, params_list: List[dict]
+    ) -> List[Union[CloudService, Exception]]:
+        """Update cloud services in batch (used by collector)
+        Args:
+            params_list (list): list of update_resource params in the same domain and workspace
+
+        Returns:
+            results (list): updated cloud_service_vo or exception per request
+        """
+
+        ch_mgr: ChangeHistoryManager = self.locator.get_manager("ChangeHistoryManager")
+
+        results: List[Union[CloudService, Exception]] = [None] * len(params_list)
+        converted_params_list = []
+        checked_params_list = []
+
+        for idx, params in enumerate(params_list):
+            try:
+                for key in ["cloud_service_id", "workspace_id", "domain_id"]:
+                    if params.get(key) is None:
+                        raise ERROR_REQUIRED_PARAMETER(key=key)
+
+                converted_params_list.append((idx, self._convert_update_params(params)))
+            except Exception as e:
+                results[idx] = e
+
+        # collector rules use the converted sources (e.g. data.* or tags.*)
+        changed_params_list = self._change_cloud_service_data_list(
+            [params for idx, params in converted_params_list]
+        )
+
+        for (idx, params), changed_params in zip(
+            converted_params_list, changed_params_list
+        ):
+            if isinstance(changed_params, Exception):
+                results[idx] = changed_params
+            else:
+                checked_params_list.append(
+                    (
+                        idx,
+                        params["cloud_service_id"],
+                        params["workspace_id"],
+                        changed_params,
+                    )
+                )
+
+        if len(checked_params_list) == 0:
+            return results
+
+        domain_id = params_list[0]["domain_id"]
+
+        # Load only the fields to check whether the content is changed
+        cloud_svc_vos = self.cloud_svc_mgr.filter_cloud_services(
+            cloud_service_id=[item[1] for item in checked_params_list],
+            domain_id=domain_id,
+        ).only(
+            "cloud_service_id",
+            "state",
+            "workspace_id",
+            "content_hash",
+            "collection_info",
+            "updated_at",
+        )
+        cloud_svc_vo_map = {
+            (cloud_svc_vo.cloud_service_id, cloud_svc_vo.workspace_id): cloud_svc_vo
+            for cloud_svc_vo in cloud_svc_vos
+        }
+
+        unchanged_vos = []
+        changed_params_list = []
+        for idx, cloud_service_id, workspace_id, params in checked_params_list:
+            try:
+                cloud_svc_vo = cloud_svc_vo_map.get((cloud_service_id, workspace_id))
+                if cloud_svc_vo is None:
+                    raise ERROR_NOT_FOUND(
+                        key="cloud_service_id", value=cloud_service_id
+                    )
+                elif cloud_svc_vo.state == "DELETED":
+                    raise ERROR_RESOURCE_ALREADY_DELETED(
+                        resource_type="CloudService", resource_id=cloud_service_id
+                    )
+
+                content_hash = self._make_content_hash(params)
+                if content_hash and content_hash == cloud_svc_vo.content_hash:
+                    results[idx] = cloud_svc_vo
+                    unchanged_vos.append(cloud_svc_vo)
+                else:
+                    params["content_hash"] = content_hash
+                    changed_params_list.append((idx, cloud_service_id, params))
+            except Exception as e:
+                results[idx] = e
+
+        # Same content as the last collection, update collection info only
+        if len(unchanged_vos) > 0:
+            self.cloud_svc_mgr.update_collection_info_by_vos(
+                unchanged_vos, self._get_collection_info()
+            )
+
+        if len(changed_params_list) > 0:
+            cloud_svc_vos = self.cloud_svc_mgr.filter_cloud_services(
+                cloud_service_id=[item[1] for item in changed_params_list],
+                domain_id=domain_id,
+            )
+            cloud_svc_vo_map = {
+                cloud_svc_vo.cloud_service_id: cloud_svc_vo
+                for cloud_svc_vo in cloud_svc_vos
+            }
+
+        updates = []
+        for idx, cloud_service_id, params in changed_params_list:
+            try:
+                cloud_svc_vo = cloud_svc_vo_map[cloud_service_id]
+                params, old_cloud_svc_data = self._make_update_params(
+                    params, cloud_svc_vo
+                )
+                updates.append((idx, cloud_svc_vo, params, old_cloud_svc_data))
+            except Exception as e:
+                results[idx] = e
+
+        update_results = self.cloud_svc_mgr.update_cloud_services_by_vos(
+            [(cloud_svc_vo, params) for idx, cloud_svc_vo, params, old_data in updates]
+        )
+
+        histories = []
+        updated_ids = [cloud_svc_vo.cloud_service_id for cloud_svc_vo in unchanged_vos]
+        for (idx, cloud_svc_vo, params, old_data), result in zip(
+            updates, update_results
+        ):
+            results[idx] = result
+
+            if isinstance(result, CloudService):
+                histories.append((cloud_svc_vo, params, old_data))
+                updated_ids.append(cloud_svc_vo.cloud_service_id)
+
+                if "project_id" in params:
+                    self._update_project_of_notes(
+                        cloud_svc_vo.cloud_service_id,
+                        params["project_id"],
+                        cloud_svc_vo.workspace_id,
+                        domain_id,
+                    )
+
+        # Create Update Histories
+        ch_mgr.add_update_histories(histories)
+
+        # Update Collection States
+        self.state_mgr.reset_collection_states(updated_ids, domain_id)
+
+        return results
+
+    @check_required(
+        [
+            "cloud_service_type",
+            "cloud_service_group",
+            "provider",
+            "workspace_id",
+            "domain_id",
+        ]
+    )
+    def _convert_create_params(self, params: dict) -> dict:
         if json_data := params.get("json_data"):
             params["data"] = utils.load_json(json_data)
             if not isinstance(params["data"], dict):
@@ -214,6 +425,8 @@ class CloudServiceService(BaseService):
                 )
 
             del params["json_data"]
+        elif "data" not in params:
+            raise ERROR_REQUIRED_PARAMETER(key="data")
 
         if json_metadata := params.get("json_metadata"):
             params["metadata"] = utils.load_json(json_metadata)
@@ -224,13 +437,65 @@ class CloudServiceService(BaseService):
 
             del params["json_metadata"]
 
-        secret_project_id = self.transaction.get_meta("secret.project_id")
+        if instance_size := params.get("instance_size"):
+            if not isinstance(instance_size, float):
+                raise ERROR_INVALID_PARAMETER_TYPE(key="instance_size", type="float")
 
-        cloud_service_id = params["cloud_service_id"]
-        workspace_id = params["workspace_id"]
-        user_projects = params.get("user_projects")
+        if "tags" in params:
+            params["tags"] = self._convert_tags_to_dict(params["tags"])
+
+        return params
+
+    def _make_create_params(self, params: dict) -> dict:
         domain_id = params["domain_id"]
-        provider = self._get_provider_from_meta()
+        workspace_id = params["workspace_id"]
+        secret_project_id = self.transaction.get_meta("secret.project_id")
+        provider = params["provider"]
+
+        params["content_hash"] = self._make_content_hash(params)
+
+        if "tags" in params:
+            params["tags"], params["tag_keys"] = self._convert_tags_to_hash(
+                params["tags"], provider
+            )
+
+        if "project_id" in params:
+            self.identity_mgr.get_project(params["project_id"], domain_id)
+        elif secret_project_id:
+            params["project_id"] = secret_project_id
+
+        params["ref_cloud_service_type"] = self._make_cloud_service_type_key(params)
+
+        if "region_code" in params:
+            params["ref_region"] = self._make_region_key(
+                domain_id, workspace_id, provider, params["region_code"]
+            )
+
+        if "metadata" in params:
+            params["metadata"] = self._convert_metadata(params["metadata"], provider)
+
+        params["collection_info"] = self._get_collection_info()
+
+        return params
+
+    def _convert_update_params(self, params: dict) -> dict:
+        if json_data := params.get("json_data"):
+            params["data"] = utils.load_json(json_data)
+            if not isinstance(params["data"], dict):
+                raise ERROR_INVALID_PARAMETER_TYPE(
+                    key="json_data", type=type(params["data"])
+                )
+
+            del params["json_data"]
+
+        if json_metadata := params.get("json_metadata"):
+            params["metadata"] = utils.load_json(json_metadata)
+            if not isinstance(params["metadata"], dict):
+                raise ERROR_INVALID_PARAMETER_TYPE(
+                    key="json_metadata", type=type(params["metadata"])
+                )
+
+            del params["json_metadata"]
 
         if "ip_addresses" in params and params["ip_addresses"] is None:
             del params["ip_addresses"]
@@ -242,15 +507,35 @@ class CloudServiceService(BaseService):
         if "tags" in params:
             params["tags"] = self._convert_tags_to_dict(params["tags"])
 
+        return params
+
+    def _change_cloud_service_data(self, params: dict) -> dict:
         # Change data through Collector Rule
         if self._is_created_by_collector():
             params = self.collector_rule_mgr.change_cloud_service_data(
-                self.collector_id, domain_id, params
+                self.collector_id, params["domain_id"], params
             )
 
-        cloud_svc_vo: CloudService = self.cloud_svc_mgr.get_cloud_service(
-            cloud_service_id, domain_id, workspace_id, user_projects
-        )
+        return params
+
+    def _change_cloud_service_data_list(
+        self, params_list: List[dict]
+    ) -> List[Union[dict, Exception]]:
+        # Change data of the batch through Collector Rule, rule by rule
+        if self._is_created_by_collector() and len(params_list) > 0:
+            self._prefetch_collector_rule_targets(params_list)
+            return self.collector_rule_mgr.change_cloud_service_data_list(
+                self.collector_id, params_list[0]["domain_id"], params_list
+            )
+
+        return params_list
+
+    def _make_update_params(
+        self, params: dict, cloud_svc_vo: CloudService
+    ) -> Tuple[dict, dict]:
+        secret_project_id = self.transaction.get_meta("secret.project_id")
+        domain_id = params["domain_id"]
+        provider = self._get_provider_from_meta()
 
         if "project_id" in params:
             self.identity_mgr.get_project(params["project_id"], domain_id)
@@ -296,32 +581,18 @@ class CloudServiceService(BaseService):
 
         params = self.cloud_svc_mgr.merge_data(params, old_cloud_svc_data)
 
-        cloud_svc_vo = self.cloud_svc_mgr.update_cloud_service_by_vo(
-            params, cloud_svc_vo
-        )
-
-        # Create Update History
-        ch_mgr.add_update_history(cloud_svc_vo, params, old_cloud_svc_data)
-
-        # Update Collection History
-        state_vo = self.state_mgr.get_collection_state(cloud_service_id, domain_id)
-        if state_vo:
-            self.state_mgr.reset_collection_state(state_vo)
-        else:
-            self.state_mgr.create_collection_state(cloud_service_id, domain_id)
-
-        if "project_id" in params:
-            note_mgr: NoteManager = self.locator.get_manager("NoteManager")
+        return params, old_cloud_svc_data
 
-            # Update Project ID from Notes
-            note_vos = note_mgr.filter_notes(
-                cloud_service_id=cloud_service_id, domain_id=domain_id
-            )
-            note_vos.update(
-                {"project_id": params["project_id"], "workspace_id": workspace_id}
-            )
+    def _update_project_of_notes(
+        self, cloud_service_id: str, project_id: str, workspace_id: str, domain_id: str
+    ) -> None:
+        note_mgr: NoteManager = self.locator.get_manager("NoteManager")
 
-        return cloud_svc_vo
+        # Update Project ID from Notes
+        note_vos = note_mgr.filter_notes(
+            cloud_service_id=cloud_service_id, domain_id=domain_id
+        )
+        note_vos.update({"project_id": project_id, "workspace_id": workspace_id})
 
     @transaction(
         permission="inventory:CloudService.write",
@@ -629,6 +900,29 @@ class CloudServiceService(BaseService):
         else:
             return False
 
+    def _make_content_hash(self, params: dict) -> Union[str, None]:
+        if self._is_created_by_collector():
+            return self.cloud_svc_mgr.make_content_hash(
+                params,
+                self.transaction.get_meta("secret.provider"),
+                self.transaction.get_meta("secret.project_id"),
+            )
+        else:
+            return None
+
+    def _prefetch_collector_rule_targets(self, params_list: List[dict]) -> None:
+        if self._is_created_by_collector() and len(params_list) > 0:
+            try:
+                self.collector_rule_mgr.prefetch_targets(
+                    self.collector_id, params_list[0]["domain_id"], params_list
+                )
+            except Exception as e:
+                # Targets that are not prefetched are resolved one by one
+                _LOGGER.warning(
+                    f"[_prefetch_collector_rule_targets] prefetch error: {e}",
+                    exc_info=True,
+                )
+
     def _get_provider_from_meta(self) -> str:
         if self._is_created_by_collector():
             return self.transaction.get_meta("secret.provider")
@@ -1,8 +1,9 @@
 import logging
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Generator, List, Tuple, Union
 from spaceone.core.service import *
 from spaceone.core.model.mongo_model import QuerySet
-from spaceone.core import utils
+from spaceone.core import config, utils
 from spaceone.inventory.error import *
 from spaceone.inventory.manager.collection_state_manager import CollectionStateManager
 from spaceone.inventory.manager.collector_manager import CollectorManager
@@ -283,9 +284,9 @@ class CollectorService(BaseService):
 
         endpoint, updated_version = plugin_manager.get_endpoint(
             plugin_info["plugin_id"],
-            plugin_info.get("version"),
-            plugin_info.get("upgrade_mode", "AUTO"),
             domain_id,
+            plugin_info.get("upgrade_mode", "AUTO"),
+            plugin_info.get("version"),
         )
 
         secret_ids = self._get_secret_ids_from_filter(
@@ -463,7 +464,6 @@ class CollectorService(BaseService):
 
         plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
         job_mgr: JobManager = self.locator.get_manager(JobManager)
-        job_task_mgr: JobTaskManager = self.locator.get_manager(JobTaskManager)
 
         collector_id = params["collector_id"]
         domain_id = params["domain_id"]
@@ -497,14 +497,11 @@ class CollectorService(BaseService):
                 endpoint, updated_version, plugin_info, collector_vo
             )
 
-        tasks = self._get_tasks(
-            params,
-            endpoint,
-            collector_id,
-            collector_vo.provider,
-            plugin_info,
+        secret_infos = self._get_secrets_from_filter(
             secret_filter,
+            collector_vo.provider,
             domain_id,
+            params.get("secret_id"),
             collector_workspace_id,
         )
 
@@ -517,59 +514,19 @@ class CollectorService(BaseService):
 
         # create job
         params["plugin_id"] = plugin_id
-        params["total_tasks"] = len(tasks)
-        params["remained_tasks"] = len(tasks)
+        params["total_tasks"] = len(secret_infos)
+        params["remained_tasks"] = len(secret_infos)
         job_vo = job_mgr.create_job(collector_vo, params)
 
-        _LOGGER.debug(f"[collect] total tasks ({job_vo.job_id}): {len(tasks)}")
-
-        if len(tasks) > 0:
-            for task in tasks:
-                secret_info = task["secret_info"]
-                sub_tasks = task.get("sub_tasks", [])
-                if len(sub_tasks) == 0:
-                    sub_task_count = 1
-                else:
-                    sub_task_count = len(sub_tasks)
-
-                if "sub_tasks" in task:
-                    del task["sub_tasks"]
-
-                create_params = {
-                    "total_sub_tasks": sub_task_count,
-                    "remained_sub_tasks": sub_task_count,
-                    "job_id": job_vo.job_id,
-                    "collector_id": job_vo.collector_id,
-                    "secret_id": secret_info.get("secret_id"),
-                    "service_account_id": secret_info.get("service_account_id"),
-                    "project_id": secret_info.get("project_id"),
-                    "workspace_id": secret_info.get("workspace_id"),
-                    "domain_id": domain_id,
-                }
-
-                task.update({"collector_id": collector_id, "job_id": job_vo.job_id})
+        _LOGGER.debug(f"[collect] total tasks ({job_vo.job_id}): {len(secret_infos)}")
 
+        if len(secret_infos) > 0:
+            # job tasks are created and pushed as soon as each secret is resolved
+            for secret_info, task in self._get_tasks(
+                endpoint, collector_id, plugin_info, secret_infos, domain_id
+            ):
                 try:
-                    # create job task
-                    job_task_vo = job_task_mgr.create_job_task(create_params)
-                    task.update({"job_task_id": job_task_vo.job_task_id})
-
-                    if len(sub_tasks) > 0:
-                        for sub_task in sub_tasks:
-                            task_options = sub_task.get("task_options", {})
-                            task.update(
-                                {"task_options": task_options, "is_sub_task": True}
-                            )
-                            _LOGGER.debug(
-                                f"[collect] push sub task ({job_task_vo.job_task_id}) => {utils.dump_json(task_options)}"
-                            )
-                            job_task_mgr.push_job_task(task)
-                    else:
-                        _LOGGER.debug(
-                            f"[collect] push job task ({job_task_vo.job_task_id})"
-                        )
-                        job_task_mgr.push_job_task(task)
-
+                    self._create_job_task(job_vo, secret_info, task)
                 except Exception as e:
                     _LOGGER.error(
                         f"[collect] Error to create job task ({job_vo.job_id}): {e}",
@@ -584,33 +541,96 @@ class CollectorService(BaseService):
             job_mgr.make_success_by_vo(job_vo)
             return job_vo
 
+    def _create_job_task(
+        self, job_vo: Job, secret_info: dict, task: Union[dict, Exception]
+    ) -> None:
+        job_mgr: JobManager = self.locator.get_manager(JobManager)
+        job_task_mgr: JobTaskManager = self.locator.get_manager(JobTaskManager)
+
+        if isinstance(task, Exception):
+            sub_tasks = []
+        else:
+            sub_tasks = task.pop("sub_tasks", [])
+
+        if len(sub_tasks) == 0:
+            sub_task_count = 1
+        else:
+            sub_task_count = len(sub_tasks)
+
+        create_params = {
+            "total_sub_tasks": sub_task_count,
+            "remained_sub_tasks": sub_task_count,
+            "job_id": job_vo.job_id,
+            "collector_id": job_vo.collector_id,
+            "secret_id": secret_info.get("secret_id"),
+            "service_account_id": secret_info.get("service_account_id"),
+            "project_id": secret_info.get("project_id"),
+            "workspace_id": secret_info.get("workspace_id"),
+            "domain_id": job_vo.domain_id,
+        }
+
+        # create job task
+        job_task_vo = job_task_mgr.create_job_task(create_params)
+
+        if isinstance(task, Exception):
+            # the job task of a secret failed to be resolved is closed as a failure
+            if isinstance(task, ERROR_BASE):
+                error_code, error_message = task.error_code, task.message
+            else:
+                error_code, error_message = "ERROR_UNKNOWN", str(task)
+
+            job_task_mgr.add_error(
+                job_task_vo,
+                error_code,
+                f"Failed to get secret: {error_message}",
+                {"secret_id": secret_info.get("secret_id")},
+            )
+            job_task_mgr.make_failure_by_vo(job_task_vo)
+            return
+
+        task.update(
+            {
+                "collector_id": job_vo.collector_id,
+                "job_id": job_vo.job_id,
+                "job_task_id": job_task_vo.job_task_id,
+            }
+        )
+
+        if len(sub_tasks) > 0:
+            for sub_task in sub_tasks:
+                task_options = sub_task.get("task_options", {})
+                task.update({"task_options": task_options, "is_sub_task": True})
+                _LOGGER.debug(
+                    f"[collect] push sub task ({job_task_vo.job_task_id}) => {utils.dump_json(task_options)}"
+                )
+                job_task_mgr.push_job_task(task)
+        else:
+            _LOGGER.debug(f"[collect] push job task ({job_task_vo.job_task_id})")
+            job_task_mgr.push_job_task(task)
+
     def _get_tasks(
         self,
-        params: dict,
         endpoint: str,
         collector_id: str,
-        collector_provider: str,
         plugin_info: dict,
-        secret_filter: dict,
+        secret_infos: List[dict],
         domain_id: str,
-        workspace_id: str = None,
-    ) -> list:
+    ) -> Generator[Tuple[dict, Union[dict, Exception]], None, None]:
+        """get tasks of the secrets in parallel, in the order they are resolved
+
+        Yields:
+            secret_info (dict): secret info from secret list
+            task (dict | Exception): task of the secret,
+                or an exception, if the secret data can't be resolved
+        """
+
         secret_mgr: SecretManager = self.locator.get_manager(SecretManager)
         collector_plugin_mgr: CollectorPluginManager = self.locator.get_manager(
             CollectorPluginManager
         )
 
-        tasks = []
-        secret_ids = self._get_secret_ids_from_filter(
-            secret_filter,
-            collector_provider,
-            domain_id,
-            params.get("secret_id"),
-            workspace_id,
-        )
-
-        for secret_id in secret_ids:
-            secret_info = secret_mgr.get_secret(secret_id, domain_id)
+        def _get_task(secret_info: dict) -> dict:
+            secret_id = secret_info["secret_id"]
             secret_data = secret_mgr.get_secret_data(secret_id, domain_id)
             _task = {
                 "plugin_info": plugin_info,
@@ -629,11 +649,30 @@ class CollectorService(BaseService):
                 _task["sub_tasks"] = response.get("tasks", [])
 
             except Exception as e:
-                pass
+                # plugins without sub tasks are collected with a single task
+                _LOGGER.debug(f"[get_tasks] no sub tasks ({secret_id}): {e}")
+
+            return _task
 
-            tasks.append(_task)
+        max_workers = config.get_global("COLLECT_SECRET_CONCURRENCY", 10)
+
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            future_map = {
+                executor.submit(_get_task, secret_info): secret_info
+                for secret_info in secret_infos
+            }
 
-        return tasks
+            for future in as_completed(future_map):
+                secret_info = future_map[future]
+
+                try:
+                    yield secret_info, future.result()
+                except Exception as e:
+                    _LOGGER.error(
+                        f"[get_tasks] failed to get secret data "
+                        f"({secret_info.get('secret_id')}): {e}"
+                    )
+                    yield secret_info, e
 
     @staticmethod
     def _check_secrets(
@@ -795,6 +834,19 @@ class CollectorService(BaseService):
         domain_id: str,
         secret_id: str = None,
         workspace_id: str = None,
+    ) -> list:
+        secret_infos = self._get_secrets_from_filter(
+            secret_filter, provider, domain_id, secret_id, workspace_id
+        )
+        return [secret_info.get("secret_id") for secret_info in secret_infos]
+
+    def _get_secrets_from_filter(
+        self,
+        secret_filter: dict,
+        provider: str,
+        domain_id: str,
+        secret_id: str = None,
+        workspace_id: str = None,
     ) -> list:
         secret_manager: SecretManager = self.locator.get_manager(SecretManager)
 
@@ -805,9 +857,7 @@ class CollectorService(BaseService):
         }
         response = secret_manager.list_secrets(query, domain_id)
 
-        return [
-            secret_info.get("secret_id") for secret_info in response.get("results", [])
-        ]
+        return response.get("results", [])
 
     @check_required(["hour"])
     def scheduled_collectors(self, params: dict) -> Tuple[QuerySet, int]:
@@ -1,6 +1,7 @@
 import logging
 from typing import Union
 
+from spaceone.core import config
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 from spaceone.core.error import *
@@ -44,6 +45,7 @@ class MetricService(BaseService):
                 'unit': 'str',
                 'tags': 'dict',
                 'namespace_id': 'str',          # required
+                'wait': 'int',                  # seconds to wait for the metric job
                 'workspace_id': 'str',          # injected from auth
                 'domain_id': 'str',             # injected from auth (required)
             }
@@ -65,10 +67,10 @@ class MetricService(BaseService):
                 params.namespace_id, params.domain_id
             )
 
-        metric_vo = self.metric_mgr.create_metric(params.dict())
+        metric_vo = self.metric_mgr.create_metric(params.dict(exclude={"wait"}))
 
-        self.metric_mgr.analyze_resource(metric_vo, params.workspace_id)
-        self.metric_mgr.run_metric_query(metric_vo)
+        self.metric_mgr.validate_query_options(metric_vo, params.workspace_id)
+        metric_vo = self._run_metric_query(metric_vo, params.wait)
 
         return MetricResponse(**metric_vo.to_dict())
 
@@ -87,6 +89,7 @@ class MetricService(BaseService):
                 'query_options': 'dict',
                 'unit': 'str',
                 'tags': 'dict',
+                'wait': 'int',                  # seconds to wait for the metric job
                 'workspace_id': 'str',          # injected from auth
                 'domain_id': 'str',             # injected from auth (required)
             }
@@ -105,15 +108,15 @@ class MetricService(BaseService):
             raise ERROR_PERMISSION_DENIED()
 
         if params.query_options:
-            self.metric_mgr.analyze_resource(
+            self.metric_mgr.validate_query_options(
                 metric_vo, params.workspace_id, params.query_options
             )
 
         metric_vo = self.metric_mgr.update_metric_by_vo(
-            params.dict(exclude_unset=True), metric_vo
+            params.dict(exclude_unset=True, exclude={"wait"}), metric_vo
         )
 
-        self.metric_mgr.run_metric_query(metric_vo)
+        metric_vo = self._run_metric_query(metric_vo, params.wait)
 
         return MetricResponse(**metric_vo.to_dict())
 
@@ -158,6 +161,7 @@ class MetricService(BaseService):
         Args:
             params (dict): {
                 'metric_id': 'str',             # required
+                'wait': 'int',                  # seconds to wait for the metric job
                 'workspace_id': 'str',          # injected from auth
                 'domain_id': 'str',             # injected from auth (required)
             }
@@ -176,7 +180,7 @@ class MetricService(BaseService):
             workspace_id,
         )
 
-        self.metric_mgr.run_metric_query(metric_vo)
+        self._run_metric_query(metric_vo, params.wait)
 
     @transaction(
         permission="inventory:Metric.read",
@@ -323,7 +327,8 @@ class MetricService(BaseService):
             params (dict): {
                 'metric_id': 'str',
                 'domain_id': 'str',
-                'is_yesterday': 'bool'
+                'is_yesterday': 'bool',
+                'metric_job_id': 'str'      # queued metric job
             }
 
         Returns:
@@ -333,10 +338,13 @@ class MetricService(BaseService):
         metric_id = params["metric_id"]
         domain_id = params["domain_id"]
         is_yesterday = params.get("is_yesterday", False)
+        metric_job_id = params.get("metric_job_id")
 
         metric_vo = self.metric_mgr.get_metric(metric_id, domain_id)
 
-        self.metric_mgr.run_metric_query(metric_vo, is_yesterday=is_yesterday)
+        self.metric_mgr.run_metric_query(
+            metric_vo, is_yesterday=is_yesterday, metric_job_id=metric_job_id
+        )
 
     @transaction()
     def run_all_metric_queries(self, params: dict) -> None:
@@ -359,6 +367,22 @@ class MetricService(BaseService):
                     exc_info=True,
                 )
 
+    @transaction()
+    @check_required(["domain_id"])
+    def run_metric_queries_by_domain(self, params: dict) -> None:
+        """Run metric queries by domain
+
+        Args:
+            params (dict): {
+                'domain_id': 'str',
+            }
+
+        Returns:
+            None
+        """
+
+        self.run_metric_query_by_domain(params["domain_id"])
+
     def run_metric_query_by_domain(self, domain_id: str) -> None:
         self.metric_mgr.create_managed_metric(domain_id)
         metric_vos = self.metric_mgr.filter_metrics(domain_id=domain_id)
@@ -366,6 +390,17 @@ class MetricService(BaseService):
         for metric_vo in metric_vos:
             self.metric_mgr.push_task(metric_vo, is_yesterday=True)
 
+    def _run_metric_query(self, metric_vo, wait: int = None):
+        metric_vo = self.metric_mgr.queue_metric_query(metric_vo)
+
+        if wait is None:
+            wait = config.get_global("METRIC_RUN_WAIT_TIMEOUT", 0)
+
+        if wait > 0:
+            metric_vo = self.metric_mgr.wait_metric_query(metric_vo, wait)
+
+        return metric_vo
+
     @staticmethod
     def _get_all_domains_info() -> list:
         identity_mgr = IdentityManager()
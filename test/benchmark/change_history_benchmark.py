@@ -0,0 +1,228 @@
+"""
+Benchmark of change history diff
+
+Compares ChangeHistoryManager._make_diff() with the previous implementation,
+which walked and sorted every value in place, on cloud service data of
+a realistic size.
+
+Usage:
+    python test/benchmark/change_history_benchmark.py [resource_count]
+"""
+
+import copy
+import random
+import sys
+import timeit
+from operator import itemgetter
+
+from spaceone.core import utils
+from spaceone.inventory.manager.change_history_manager import (
+    ChangeHistoryManager,
+    DIFF_KEYS,
+    MAX_KEY_DEPTH,
+)
+
+
+class PreviousChangeHistory(object):
+    # previous implementation of ChangeHistoryManager._make_diff()
+
+    def make_diff(self, new_data: dict, old_data: dict, exclude_keys: list) -> list:
+        diff = []
+        for key in DIFF_KEYS:
+            if key in new_data:
+                old_value = old_data.get(key) if old_data else None
+                diff += self._get_diff_data(key, new_data[key], old_value, exclude_keys)
+
+        return diff
+
+    def _get_diff_data(
+        self, key, new_value, old_value, exclude_keys, depth=1, parent_key=None
+    ) -> list:
+        diff = []
+
+        if depth == MAX_KEY_DEPTH:
+            if new_value != old_value:
+                diff_data = self._generate_diff_data(
+                    key, parent_key, new_value, old_value, exclude_keys
+                )
+                if diff_data:
+                    diff.append(diff_data)
+        elif isinstance(new_value, dict):
+            parent_key = f"{parent_key}.{key}" if parent_key else key
+
+            for sub_key, sub_value in new_value.items():
+                if isinstance(old_value, dict):
+                    sub_old_value = old_value.get(sub_key)
+                else:
+                    sub_old_value = None
+
+                diff += self._get_diff_data(
+                    sub_key,
+                    sub_value,
+                    sub_old_value,
+                    exclude_keys,
+                    depth + 1,
+                    parent_key,
+                )
+        else:
+            if new_value != old_value:
+                diff_data = self._generate_diff_data(
+                    key, parent_key, new_value, old_value, exclude_keys
+                )
+                if diff_data:
+                    diff.append(diff_data)
+
+        return diff
+
+    def _generate_diff_data(self, key, parent_key, new_value, old_value, exclude_keys):
+        diff_type = "ADDED" if old_value is None else "CHANGED"
+        before = self._change_diff_value(old_value)
+        after = self._change_diff_value(new_value)
+        diff_key = key if parent_key is None else f"{parent_key}.{key}"
+
+        if diff_key in exclude_keys or before == after:
+            return None
+
+        return {"key": diff_key, "before": before, "after": after, "type": diff_type}
+
+    def _change_diff_value(self, value):
+        if isinstance(value, dict):
+            return utils.dump_json(self._sort_dict_value(value))
+        elif isinstance(value, list):
+            return utils.dump_json(self._sort_list_values(value))
+        elif value is None:
+            return value
+        else:
+            return str(value)
+
+    def _sort_dict_value(self, value):
+        try:
+            for k, v in value.items():
+                if isinstance(v, dict):
+                    value[k] = self._sort_dict_value(v)
+                elif isinstance(v, list):
+                    value[k] = self._sort_list_values(v)
+
+            return dict(sorted(value.items()))
+        except Exception:
+            pass
+
+        return value
+
+    def _sort_list_values(self, values):
+        if len(values) > 0:
+            if isinstance(values[0], dict):
+                changed_list_values = [self._sort_dict_value(v) for v in values]
+                sort_keys = list(changed_list_values[0].keys())
+
+                if len(sort_keys) > 0:
+                    try:
+                        return sorted(
+                            changed_list_values, key=itemgetter(*sort_keys[:3])
+                        )
+                    except Exception:
+                        pass
+
+                return changed_list_values
+            else:
+                return sorted(values)
+
+        return values
+
+
+def make_data(idx: int) -> dict:
+    return {
+        "name": f"instance-{idx}",
+        "ip_addresses": [f"10.0.{idx % 256}.{i}" for i in range(3)],
+        "account": "123456789012",
+        "instance_type": "m5.large",
+        "instance_size": 2.0,
+        "reference": {"resource_id": f"i-{idx:012d}", "external_link": "https://x"},
+        "region_code": "ap-northeast-2",
+        "project_id": "project-abcde12345",
+        "tags": {f"tag-{i}": f"value-{i}" for i in range(10)},
+        "data": {
+            "compute": {
+                "instance_id": f"i-{idx:012d}",
+                "instance_state": "RUNNING",
+                "launched_at": "2024-01-01T00:00:00Z",
+                "security_groups": [
+                    {"id": f"sg-{i}", "name": f"sg-name-{i}", "display": f"sg {i}"}
+                    for i in range(5)
+                ],
+            },
+            "disks": [
+                {
+                    "device": f"/dev/sd{chr(97 + i)}",
+                    "size": 100 + i,
+                    "tags": {"volume_id": f"vol-{i}", "iops": 3000, "encrypted": True},
+                }
+                for i in range(4)
+            ],
+            "nics": [
+                {
+                    "device_index": i,
+                    "ip_addresses": [f"10.0.0.{i}"],
+                    "tags": {"eni_id": f"eni-{i}", "subnet_id": f"subnet-{i}"},
+                }
+                for i in range(2)
+            ],
+            "hardware": {"core": 2, "memory": 8.0},
+            "os": {"os_type": "LINUX", "details": "Amazon Linux 2"},
+            "monitoring": {
+                "cloudwatch": {
+                    "namespace": "AWS/EC2",
+                    "dimensions": [{"Name": "InstanceId", "Value": f"i-{idx}"}],
+                }
+            },
+        },
+    }
+
+
+def change_data(data: dict) -> dict:
+    data = copy.deepcopy(data)
+    data["data"]["compute"]["instance_state"] = random.choice(["RUNNING", "STOPPED"])
+    data["data"]["compute"]["security_groups"].reverse()
+    data["data"]["disks"][0]["size"] += random.randint(0, 1)
+    data["tags"]["tag-0"] = random.choice(["value-0", "changed"])
+    return data
+
+
+def main():
+    resource_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    random.seed(0)
+    histories = []
+    for idx in range(resource_count):
+        old_data = make_data(idx)
+        histories.append((change_data(old_data), old_data))
+
+    manager = ChangeHistoryManager.__new__(ChangeHistoryManager)
+    previous = PreviousChangeHistory()
+
+    def run_previous():
+        return [
+            previous.make_diff(new_data, old_data, [])
+            for new_data, old_data in copy.deepcopy(histories)
+        ]
+
+    def run_current():
+        return [
+            manager._make_diff(new_data, old_data, [])
+            for new_data, old_data in copy.deepcopy(histories)
+        ]
+
+    assert run_current() == run_previous(), "diff is different from the previous one"
+
+    copy_time = min(timeit.repeat(lambda: copy.deepcopy(histories), number=1, repeat=3))
+
+    print(f"resources = {resource_count} (deepcopy of data: {copy_time:.3f}s excluded)")
+    for name, func in [("previous", run_previous), ("current", run_current)]:
+        elapsed = min(timeit.repeat(func, number=1, repeat=3)) - copy_time
+        print(
+            f"{name:>10}: {elapsed:.3f}s ({elapsed / resource_count * 1e6:.1f}us/resource)"
+        )
+
+
+if __name__ == "__main__":
+    main()
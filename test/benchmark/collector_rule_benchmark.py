@@ -0,0 +1,161 @@
+"""
+Benchmark of collector rule evaluation
+
+Compares the compiled collector rules (CollectorRuleProgram) with the previous
+evaluation, which interpreted the conditions of each rule for each resource.
+
+Usage:
+    python test/benchmark/collector_rule_benchmark.py [rule_count] [resource_count]
+"""
+
+import copy
+import functools
+import random
+import sys
+import timeit
+
+from spaceone.core import utils
+from spaceone.inventory.lib.collector_rule_program import CollectorRuleProgram
+from spaceone.inventory.model.collector_rule_model import (
+    CollectorRule,
+    CollectorRuleCondition,
+    CollectorRuleOptions,
+)
+
+KEYS = ["provider", "region_code", "name", "data.vpc.vpc_id", "tags.Environment"]
+OPERATORS = ["eq", "eq", "contain", "not", "not_contain"]
+
+
+def make_rules(rule_count: int) -> list:
+    rules = []
+    for idx in range(rule_count):
+        conditions = []
+        for _ in range(random.randint(1, 4)):
+            key = random.choice(KEYS)
+            conditions.append(
+                CollectorRuleCondition(
+                    key=key,
+                    value=f"{key.rsplit('.', 1)[-1]}-{random.randint(0, 20)}",
+                    operator=random.choice(OPERATORS),
+                )
+            )
+
+        rules.append(
+            CollectorRule(
+                collector_rule_id=f"collector-rule-{idx}",
+                order=idx,
+                conditions=conditions,
+                conditions_policy=random.choice(["ALL", "ANY", "ANY"]),
+                actions={"change_project": f"project-{idx}"},
+                options=CollectorRuleOptions(stop_processing=idx % 50 == 49),
+            )
+        )
+
+    return rules
+
+
+def make_resources(resource_count: int) -> list:
+    resources = []
+    for _ in range(resource_count):
+        resources.append(
+            {
+                "provider": f"provider-{random.randint(0, 20)}",
+                "region_code": f"region_code-{random.randint(0, 20)}",
+                "name": f"NAME-{random.randint(0, 20)}",
+                "data": {"vpc": {"vpc_id": f"vpc_id-{random.randint(0, 20)}"}},
+                "tags": {"Environment": f"Environment-{random.randint(0, 20)}"},
+            }
+        )
+
+    return resources
+
+
+def change_data(data: dict, actions: dict) -> dict:
+    data.setdefault("applied", []).append(actions["change_project"])
+    return data
+
+
+def check_condition(cloud_service_data: dict, condition: CollectorRuleCondition):
+    # previous evaluation of CollectorRuleManager._check_condition()
+    cloud_service_value = utils.get_dict_value(cloud_service_data, condition.key)
+    condition_value = condition.value
+    operator = condition.operator
+
+    if cloud_service_value is None:
+        return False
+
+    if operator == "eq":
+        return cloud_service_value == condition_value
+    elif operator == "contain":
+        return cloud_service_value.lower().find(condition_value.lower()) >= 0
+    elif operator == "not":
+        return cloud_service_value != condition_value
+    elif operator == "not_contain":
+        return cloud_service_value.lower().find(condition_value.lower()) < 0
+
+    return False
+
+
+def apply_rules(data: dict, rules: list) -> dict:
+    # previous evaluation of CollectorRuleManager._apply_collector_rule_to_cloud_service_data()
+    for rule in rules:
+        if rule.conditions_policy == "ALWAYS":
+            is_match = True
+        else:
+            results = list(
+                map(functools.partial(check_condition, data), rule.conditions)
+            )
+
+            if rule.conditions_policy == "ALL":
+                is_match = all(results)
+            else:
+                is_match = any(results)
+
+        if is_match:
+            data = change_data(data, rule.actions)
+
+        if is_match and rule.options.stop_processing:
+            break
+
+    return data
+
+
+def main():
+    rule_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    resource_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    random.seed(0)
+    rules = make_rules(rule_count)
+    resources = make_resources(resource_count)
+
+    def run_previous():
+        return [apply_rules(data, rules) for data in copy.deepcopy(resources)]
+
+    def run_compiled():
+        program = CollectorRuleProgram(rules)
+        return [program.apply(data, change_data) for data in copy.deepcopy(resources)]
+
+    def run_compiled_batch():
+        program = CollectorRuleProgram(rules)
+        return program.apply_many(copy.deepcopy(resources), change_data)
+
+    expected = run_previous()
+    assert run_compiled() == expected, "compiled rules return different results"
+    assert (
+        run_compiled_batch() == expected
+    ), "batch evaluation returns different results"
+
+    print(f"rules = {rule_count}, resources = {resource_count}")
+    for name, func in [
+        ("previous", run_previous),
+        ("compiled", run_compiled),
+        ("compiled (batch)", run_compiled_batch),
+    ]:
+        elapsed = min(timeit.repeat(func, number=1, repeat=3))
+        print(
+            f"{name:>20}: {elapsed:.3f}s ({elapsed / resource_count * 1e6:.1f}us/resource)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+
+from spaceone.inventory.interface.task.v1 import domain_scheduler
+from spaceone.inventory.interface.task.v1.domain_scheduler import DomainScheduler
+
+
+class _Cache(object):
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self):
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None):
+        self.data[key] = value
+
+    def increment(self, key, amount=1):
+        self.data[key] = self.data.get(key, 0) + amount
+        return self.data[key]
+
+
+class _DomainScheduler(DomainScheduler):
+    def create_stages(self, target):
+        return []
+
+
+class TestDomainScheduler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True, TOKEN="token")
+        super().setUpClass()
+
+    def setUp(self, *args) -> None:
+        self.cache = _Cache()
+
+        patcher = patch.object(domain_scheduler, "cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.scheduler = _DomainScheduler("test_q", 1)
+
+    def test_get_slots_to_run(self, *args):
+        # started in the middle of the hour, previous slots are skipped
+        self.assertEqual([3], self.scheduler._get_slots_to_run("2024-01-01T00", 3))
+
+        # the slot of the last tick is run only once
+        self.assertEqual([], self.scheduler._get_slots_to_run("2024-01-01T00", 3))
+
+        # slots are not skipped when ticks are delayed
+        self.assertEqual(
+            [4, 5, 6], self.scheduler._get_slots_to_run("2024-01-01T00", 6)
+        )
+
+        # a new hour starts from the first slot
+        self.assertEqual([0, 1], self.scheduler._get_slots_to_run("2024-01-01T01", 1))
+
+    def test_acquire_lease(self, *args):
+        self.assertTrue(self.scheduler._acquire_lease("2024-01-01T00", "domain-1"))
+
+        # the task is pushed by the replica acquiring the lease
+        self.assertFalse(self.scheduler._acquire_lease("2024-01-01T00", "domain-1"))
+
+        self.assertTrue(self.scheduler._acquire_lease("2024-01-01T00", "domain-2"))
+        self.assertTrue(self.scheduler._acquire_lease("2024-01-01T01", "domain-1"))
+
+    def test_acquire_lease_without_cache(self, *args):
+        with patch.object(self.cache, "is_set", return_value=False):
+            self.assertTrue(self.scheduler._acquire_lease("2024-01-01T00", "domain-1"))
+            self.assertTrue(self.scheduler._acquire_lease("2024-01-01T00", "domain-1"))
+
+        with patch.object(
+            self.cache, "increment", side_effect=Exception("connection error")
+        ):
+            self.assertTrue(self.scheduler._acquire_lease("2024-01-01T00", "domain-1"))
+
+    def test_create_stages_not_implemented(self, *args):
+        with self.assertRaises(TypeError):
+            DomainScheduler("test_q", 1)
+
+    def test_get_slot(self, *args):
+        slots = [self.scheduler._get_slot(f"domain-{idx}") for idx in range(100)]
+
+        # a target is pushed in the same slot every hour
+        self.assertEqual(
+            slots, [self.scheduler._get_slot(f"domain-{idx}") for idx in range(100)]
+        )
+        self.assertTrue(all(0 <= slot < self.scheduler._slot_count for slot in slots))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
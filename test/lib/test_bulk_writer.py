@@ -0,0 +1,155 @@
+import unittest
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+
+from spaceone.inventory.lib import bulk_writer
+from spaceone.inventory.model.metric.database import Metric
+
+
+class TestBulkWriter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        Metric.ensure_indexes()
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self, *args) -> None:
+        Metric.objects.filter().delete()
+
+    def _make_metric_data(self, metric_id, **kwargs):
+        return {
+            "metric_id": metric_id,
+            "name": metric_id,
+            "query_options": {"group_by": ["region_code"]},
+            "domain_id": self.domain_id,
+            **kwargs,
+        }
+
+    def test_insert_many(self, *args):
+        results = bulk_writer.insert_many(
+            Metric,
+            [
+                self._make_metric_data("metric-1"),
+                self._make_metric_data("metric-2"),
+            ],
+        )
+
+        self.assertEqual(
+            ["metric-1", "metric-2"], [metric_vo.metric_id for metric_vo in results]
+        )
+        self.assertEqual(2, Metric.objects.filter(domain_id=self.domain_id).count())
+
+        metric_vo = Metric.objects.get(metric_id="metric-1", domain_id=self.domain_id)
+        self.assertEqual(results[0].pk, metric_vo.pk)
+        self.assertEqual("DONE", metric_vo.status)
+        self.assertIsNotNone(metric_vo.created_at)
+
+    def test_insert_many_with_errors(self, *args):
+        results = bulk_writer.insert_many(
+            Metric,
+            [
+                self._make_metric_data("metric-1"),
+                self._make_metric_data("metric-1"),
+                self._make_metric_data("metric-2", metric_type="UNKNOWN"),
+                self._make_metric_data("metric-3"),
+            ],
+        )
+
+        # a duplicate key and a validation error fail only their own items
+        self.assertIsInstance(results[0], Metric)
+        self.assertIsInstance(results[1], Exception)
+        self.assertIsInstance(results[2], Exception)
+        self.assertIsInstance(results[3], Metric)
+
+        metric_ids = Metric.objects.filter(domain_id=self.domain_id).distinct(
+            "metric_id"
+        )
+        self.assertEqual(["metric-1", "metric-3"], sorted(metric_ids))
+
+    def test_create_many(self, *args):
+        self.assertEqual(
+            1, bulk_writer.create_many(Metric, [self._make_metric_data("metric-1")])
+        )
+
+        with self.assertRaises(Exception):
+            bulk_writer.create_many(
+                Metric,
+                [
+                    self._make_metric_data("metric-1"),
+                    self._make_metric_data("metric-2"),
+                ],
+            )
+
+        self.assertEqual(2, Metric.objects.filter(domain_id=self.domain_id).count())
+
+    def test_aggregate_into(self, *args):
+        collection = Metric._get_collection()
+        into = collection.database["test_aggregate_into"]
+        bulk_writer.insert_many(
+            Metric,
+            [
+                self._make_metric_data("metric-1"),
+                self._make_metric_data("metric-2"),
+            ],
+        )
+
+        # $merge is not supported by mongomock, so the results are inserted
+        inserted_count = bulk_writer.aggregate_into(
+            collection,
+            [
+                {"$match": {"domain_id": self.domain_id}},
+                {"$project": {"_id": 0, "metric_id": 1, "domain_id": 1}},
+            ],
+            into,
+            {"domain_id": self.domain_id},
+        )
+
+        self.assertEqual(2, inserted_count)
+        self.assertEqual(2, into.count_documents({"domain_id": self.domain_id}))
+        into.drop()
+
+    def test_upsert_many(self, *args):
+        bulk_writer.insert_many(
+            Metric, [self._make_metric_data("metric-1", version="1.0")]
+        )
+
+        pks = bulk_writer.upsert_many(
+            Metric,
+            [
+                {"metric_id": "metric-1", "domain_id": self.domain_id},
+                {"metric_id": "metric-2", "domain_id": self.domain_id},
+            ],
+            {"version": "2.0"},
+        )
+
+        self.assertEqual(1, len(pks))
+        self.assertEqual(2, Metric.objects.filter(domain_id=self.domain_id).count())
+
+        for metric_vo in Metric.objects.filter(domain_id=self.domain_id):
+            self.assertEqual("2.0", metric_vo.version)
+
+        self.assertEqual("metric-2", Metric.objects.get(pk=pks[0]).metric_id)
+
+    def test_upsert_many_without_conditions(self, *args):
+        self.assertEqual([], bulk_writer.upsert_many(Metric, [], {"version": "2.0"}))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,186 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+
+from spaceone.inventory.lib import chunked_sweeper
+from spaceone.inventory.lib.chunked_sweeper import ChunkedSweeper
+from spaceone.inventory.model.cloud_service_model import CloudService
+
+
+class _Cache(object):
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self):
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+class TestChunkedSweeper(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self, *args) -> None:
+        self.cache = _Cache()
+        self.clock = _Clock()
+        self.swept_ids = []
+
+        patchers = [
+            patch.object(chunked_sweeper, "cache", self.cache),
+            patch.object(chunked_sweeper.time, "monotonic", self.clock.monotonic),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.started_at = datetime(2024, 1, 1)
+        for idx in range(10):
+            self._create_cloud_service(
+                f"cloud-svc-{idx}", self.started_at + timedelta(minutes=idx)
+            )
+
+    def tearDown(self, *args) -> None:
+        CloudService.objects.filter().delete()
+
+    def _create_cloud_service(self, cloud_service_id, updated_at):
+        cloud_service_vo = CloudService(
+            cloud_service_id=cloud_service_id,
+            provider="aws",
+            cloud_service_group="EC2",
+            cloud_service_type="Instance",
+            state="DISCONNECTED",
+            domain_id=self.domain_id,
+            workspace_id="workspace-1",
+        )
+        document = cloud_service_vo.to_mongo()
+        document["updated_at"] = updated_at
+        CloudService._get_collection().insert_one(document)
+
+    def _get_queryset(self):
+        return CloudService.objects.filter(
+            domain_id=self.domain_id, state="DISCONNECTED"
+        )
+
+    def _delete(self, documents):
+        # each chunk takes a second
+        self.clock.now += 1
+        self.swept_ids += [document["cloud_service_id"] for document in documents]
+        result = CloudService._get_collection().update_many(
+            {"_id": {"$in": [document["_id"] for document in documents]}},
+            {"$set": {"state": "DELETED"}},
+        )
+        return result.modified_count
+
+    def test_sweep(self, *args):
+        sweeper = ChunkedSweeper("test_sweep", chunk_size=3, time_budget=60)
+        sweep_info = sweeper.sweep(
+            self._get_queryset(),
+            "updated_at",
+            self._delete,
+            fields=["cloud_service_id"],
+        )
+
+        self.assertEqual(10, sweep_info["swept_count"])
+        self.assertEqual(0, sweep_info["remained_count"])
+        self.assertTrue(sweep_info["is_completed"])
+        self.assertEqual([f"cloud-svc-{idx}" for idx in range(10)], self.swept_ids)
+        self.assertEqual({}, self.cache.data)
+
+    def test_resume_from_checkpoint(self, *args):
+        sweeper = ChunkedSweeper("test_resume", chunk_size=3, time_budget=1.5)
+        sweep_info = sweeper.sweep(
+            self._get_queryset(),
+            "updated_at",
+            self._delete,
+            fields=["cloud_service_id"],
+        )
+
+        # the sweep is stopped after 2 chunks, when the time budget is used up
+        self.assertEqual(6, sweep_info["swept_count"])
+        self.assertEqual(4, sweep_info["remained_count"])
+        self.assertFalse(sweep_info["is_completed"])
+        self.assertEqual(
+            (self.started_at + timedelta(minutes=5)).isoformat(),
+            self.cache.get("inventory:cleanup-checkpoint:test_resume"),
+        )
+
+        # the next sweep resumes from the checkpoint, older resources are left
+        self._create_cloud_service("cloud-svc-old", self.started_at - timedelta(days=1))
+        self.swept_ids = []
+
+        sweeper = ChunkedSweeper("test_resume", chunk_size=3, time_budget=60)
+        sweep_info = sweeper.sweep(
+            self._get_queryset(),
+            "updated_at",
+            self._delete,
+            fields=["cloud_service_id"],
+        )
+
+        self.assertEqual(4, sweep_info["swept_count"])
+        self.assertTrue(sweep_info["is_completed"])
+        self.assertEqual([f"cloud-svc-{idx}" for idx in range(6, 10)], self.swept_ids)
+        self.assertIsNone(self.cache.get("inventory:cleanup-checkpoint:test_resume"))
+        self.assertEqual(1, self._get_queryset().count())
+
+    def test_stop_without_progress(self, *args):
+        sweeper = ChunkedSweeper("test_stop", chunk_size=3, time_budget=60)
+        sweep_info = sweeper.sweep(
+            self._get_queryset(), "updated_at", lambda documents: 0
+        )
+
+        self.assertEqual(0, sweep_info["swept_count"])
+        self.assertEqual(10, sweep_info["remained_count"])
+        self.assertFalse(sweep_info["is_completed"])
+
+    def test_dry_run(self, *args):
+        sweeper = ChunkedSweeper("test_dry_run", chunk_size=3, time_budget=60)
+        sweep_info = sweeper.sweep(
+            self._get_queryset(), "updated_at", self._delete, dry_run=True
+        )
+
+        self.assertEqual(0, sweep_info["swept_count"])
+        self.assertEqual(10, sweep_info["remained_count"])
+        self.assertTrue(sweep_info["dry_run"])
+        self.assertEqual([], self.swept_ids)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,108 @@
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.inventory.lib.job_task_error_buffer import (
+    JobTaskErrorBuffer,
+    make_message_template,
+)
+
+
+class TestJobTaskErrorBuffer(unittest.TestCase):
+
+    def test_make_message_template(self, *args):
+        self.assertEqual(
+            "Instance <str> not found (region = <id>)",
+            make_message_template("Instance 'i-0abc' not found (region = us-east-1)"),
+        )
+        self.assertEqual(
+            "Timeout after <id> seconds",
+            make_message_template("Timeout after 30 seconds"),
+        )
+
+    def test_group_errors(self, *args):
+        error_buffer = JobTaskErrorBuffer("job-task-1", max_groups=10, max_samples=2)
+
+        for idx in range(3):
+            error_buffer.add(
+                "ERROR_PLUGIN",
+                f"Instance 'i-{idx}' not found",
+                {"resource_id": f"i-{idx}"},
+            )
+
+        error_buffer.add("ERROR_PLUGIN", "Access denied")
+        error_buffer.add("ERROR_MATCH_RULE", "Instance 'i-9' not found")
+
+        self.assertEqual(5, len(error_buffer))
+
+        errors = error_buffer.pop_errors()
+        self.assertEqual(3, len(errors))
+
+        # the first message of a group is kept with the error count and samples
+        self.assertEqual(
+            {
+                "error_code": "ERROR_PLUGIN",
+                "message": "Instance 'i-0' not found",
+                "additional": {
+                    "resource_id": "i-0",
+                    "error_count": 3,
+                    "samples": [{"resource_id": "i-1"}],
+                },
+            },
+            errors[0],
+        )
+        self.assertEqual(
+            {"error_code": "ERROR_PLUGIN", "message": "Access denied"}, errors[1]
+        )
+        self.assertEqual(
+            {"error_code": "ERROR_MATCH_RULE", "message": "Instance 'i-9' not found"},
+            errors[2],
+        )
+
+        self.assertEqual(0, len(error_buffer))
+        self.assertEqual([], error_buffer.pop_errors())
+
+    def test_group_errors_over_max_groups(self, *args):
+        error_buffer = JobTaskErrorBuffer("job-task-1", max_groups=2, max_samples=0)
+
+        error_buffer.add("ERROR_PLUGIN", "Access denied")
+        error_buffer.add("ERROR_PLUGIN", "Throttled")
+        error_buffer.add("ERROR_PLUGIN", "Invalid region")
+        error_buffer.add("ERROR_PLUGIN", "Service unavailable")
+
+        errors = error_buffer.pop_errors()
+
+        # errors beyond the max groups are grouped by error code
+        self.assertEqual(
+            ["Access denied", "Throttled", "Invalid region"],
+            [error_info["message"] for error_info in errors],
+        )
+        self.assertEqual({"error_count": 2}, errors[2]["additional"])
+
+    def test_keep_details(self, *args):
+        error_buffer = JobTaskErrorBuffer(
+            "job-task-1", max_groups=10, max_samples=1, keep_details=True
+        )
+
+        error_buffer.add(
+            "ERROR_PLUGIN", "Instance 'i-0' not found ", {"resource_id": "i-0"}
+        )
+        error_buffer.add("ERROR_PLUGIN", "Instance 'i-1' not found")
+
+        self.assertEqual(
+            [
+                {
+                    "error_code": "ERROR_PLUGIN",
+                    "message": "Instance 'i-0' not found",
+                    "additional": {"resource_id": "i-0"},
+                },
+                {"error_code": "ERROR_PLUGIN", "message": "Instance 'i-1' not found"},
+            ],
+            error_buffer.pop_details(),
+        )
+        self.assertEqual([], error_buffer.pop_details())
+        self.assertEqual(1, len(error_buffer.pop_errors()))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,296 @@
+import inspect
+import unittest
+from unittest.mock import patch, MagicMock
+import mongomock
+from mongoengine import connect, disconnect
+from mongomock.collection import BulkOperationBuilder
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import transaction
+from spaceone.core import utils
+from spaceone.core.locator import Locator
+
+from spaceone.inventory.conf.collector_conf import CREATED, UPDATED, ERROR
+from spaceone.inventory.manager.collecting_manager import CollectingManager
+from spaceone.inventory.manager.identity_manager import IdentityManager
+from spaceone.inventory.model.cloud_service_model import CloudService
+from spaceone.inventory.model.collector_rule_model import CollectorRule
+from spaceone.inventory.model.job_task_model import JobTask
+from spaceone.inventory.model.record_model import Record
+
+
+def _patch_bulk_update():
+    # mongomock doesn't accept the sort option of UpdateOne (pymongo >= 4.11)
+    add_update = BulkOperationBuilder.add_update
+    if "sort" in inspect.signature(add_update).parameters:
+        return None
+
+    def _add_update(self, *args, sort=None, **kwargs):
+        return add_update(self, *args, **kwargs)
+
+    return patch.object(BulkOperationBuilder, "add_update", _add_update)
+
+
+class TestCollectingManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self, *args) -> None:
+        transaction.create_transaction(meta={})
+
+        patchers = [
+            patch.object(Locator, "get_connector", return_value=MagicMock()),
+            patch.object(IdentityManager, "get_project", return_value={}),
+            _patch_bulk_update(),
+        ]
+        for patcher in filter(None, patchers):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self, *args) -> None:
+        for model in [CloudService, CollectorRule, JobTask, Record]:
+            model.objects.filter().delete()
+
+    @staticmethod
+    def _make_resource(idx, name=None, state="SUCCESS"):
+        return {
+            "resource_type": "inventory.CloudService",
+            "state": state,
+            "match_rules": {
+                "1": [
+                    "reference.resource_id",
+                    "provider",
+                    "cloud_service_type",
+                    "cloud_service_group",
+                ]
+            },
+            "resource": {
+                "name": name or f"instance-{idx}",
+                "provider": "aws",
+                "cloud_service_group": "EC2",
+                "cloud_service_type": "Instance",
+                "data": {"index": idx},
+                "tags": {"Name": name or f"instance-{idx}"},
+                "reference": {"resource_id": f"i-{idx}"},
+                "region_code": "ap-northeast-2",
+            },
+        }
+
+    @staticmethod
+    def _make_params(domain_id):
+        job_task_vo = JobTask.create(
+            {
+                "job_id": "job-1",
+                "collector_id": "collector-1",
+                "secret_id": "secret-1",
+                "domain_id": domain_id,
+            }
+        )
+
+        params = {
+            "collector_id": "collector-1",
+            "job_id": "job-1",
+            "job_task_id": job_task_vo.job_task_id,
+            "workspace_id": "workspace-1",
+            "domain_id": domain_id,
+            "plugin_info": {"plugin_id": "plugin-1"},
+            "secret_info": {
+                "secret_id": "secret-1",
+                "provider": "aws",
+                "service_account_id": "sa-1",
+                "project_id": "project-1",
+            },
+        }
+
+        return params, job_task_vo
+
+    def _upsert(self, domain_id, resources, batch_size):
+        config.set_global(COLLECTING_BATCH_SIZE=batch_size)
+        params, job_task_vo = self._make_params(domain_id)
+
+        collecting_mgr = CollectingManager()
+        return collecting_mgr._upsert_collecting_resources(
+            iter(resources), params, job_task_vo
+        )
+
+    @staticmethod
+    def _get_cloud_services(domain_id):
+        cloud_services = []
+        for cloud_svc_vo in CloudService.objects.filter(domain_id=domain_id):
+            cloud_services.append(
+                {
+                    "name": cloud_svc_vo.name,
+                    "state": cloud_svc_vo.state,
+                    "data": cloud_svc_vo.data,
+                    "tags": cloud_svc_vo.tags,
+                    "reference": cloud_svc_vo.reference.to_dict(),
+                    "region_code": cloud_svc_vo.region_code,
+                    "project_id": cloud_svc_vo.project_id,
+                    "record_count": Record.objects.filter(
+                        cloud_service_id=cloud_svc_vo.cloud_service_id
+                    ).count(),
+                }
+            )
+
+        return sorted(cloud_services, key=lambda cloud_service: cloud_service["name"])
+
+    def test_upsert_cloud_service_batch(self, *args):
+        domain_ids = {}
+        for batch_size in [0, 100]:
+            domain_id = domain_ids[batch_size] = utils.generate_id("domain")
+
+            # resources are changed by the upsert, so they are made for each run
+            created_resources = [self._make_resource(idx) for idx in range(5)]
+            created_resources += [
+                # matches a new resource of the same batch
+                self._make_resource(2, name="instance-2-updated"),
+                self._make_resource(9, state="FAILURE"),
+            ]
+
+            self.assertEqual(
+                {
+                    "total_count": 7,
+                    "created_count": 5,
+                    "updated_count": 1,
+                    "failure_count": 1,
+                },
+                self._upsert(domain_id, created_resources, batch_size),
+            )
+
+            updated_resources = [
+                self._make_resource(idx, name=f"updated-{idx}") for idx in range(7)
+            ]
+
+            self.assertEqual(
+                {
+                    "total_count": 7,
+                    "created_count": 2,
+                    "updated_count": 5,
+                    "failure_count": 0,
+                },
+                self._upsert(domain_id, updated_resources, batch_size),
+            )
+
+        sequential_cloud_services = self._get_cloud_services(domain_ids[0])
+        self.assertEqual(7, len(sequential_cloud_services))
+        self.assertEqual(
+            sequential_cloud_services, self._get_cloud_services(domain_ids[100])
+        )
+
+    def test_upsert_cloud_service_batch_with_collector_rules(self, *args):
+        project_info = {"project_id": "project-2", "workspace_id": "workspace-1"}
+        response = {"results": [project_info], "total_count": 1}
+
+        with patch.object(
+            IdentityManager, "list_projects", return_value=response
+        ), patch.object(
+            IdentityManager, "list_projects_with_cache", return_value=response
+        ):
+            for batch_size in [0, 100]:
+                domain_id = utils.generate_id("domain")
+                CollectorRule.create(
+                    {
+                        "rule_type": "CUSTOM",
+                        "order": 1,
+                        "conditions": [
+                            {"key": "name", "value": "instance-1", "operator": "eq"}
+                        ],
+                        "conditions_policy": "ALL",
+                        "actions": {"change_project": "project-2"},
+                        "collector_id": "collector-1",
+                        "resource_group": "DOMAIN",
+                        "domain_id": domain_id,
+                    }
+                )
+
+                resources = [self._make_resource(idx) for idx in range(3)]
+                self._upsert(domain_id, resources, batch_size)
+
+                self.assertEqual(
+                    ["project-1", "project-2", "project-1"],
+                    [
+                        cloud_service["project_id"]
+                        for cloud_service in self._get_cloud_services(domain_id)
+                    ],
+                )
+
+    def test_upsert_cloud_service_batch_results(self, *args):
+        domain_id = utils.generate_id("domain")
+        params, job_task_vo = self._make_params(domain_id)
+        collecting_mgr = CollectingManager()
+        collecting_mgr._set_transaction_meta(params)
+
+        results = collecting_mgr._upsert_cloud_service_batch(
+            [
+                self._make_resource(0),
+                self._make_resource(1, state="FAILURE"),
+                self._make_resource(0, name="instance-0-updated"),
+            ],
+            params,
+            job_task_vo,
+        )
+
+        self.assertEqual([CREATED, ERROR, UPDATED], results)
+        self.assertEqual(
+            ["instance-0-updated"],
+            [
+                cloud_svc_vo.name
+                for cloud_svc_vo in CloudService.objects.filter(domain_id=domain_id)
+            ],
+        )
+
+    def test_make_match_map(self, *args):
+        resource_mgr = MagicMock()
+        resource_mgr.find_resources_by_match_keys.return_value = [
+            (
+                {"cloud_service_id": "cloud-svc-1"},
+                {"name": "instance-1", "ip_addresses": ["10.0.0.1", "10.0.0.2"]},
+            ),
+            (
+                {"cloud_service_id": "cloud-svc-2"},
+                {"name": "instance-2", "ip_addresses": "10.0.0.3"},
+            ),
+            (
+                {"cloud_service_id": "cloud-svc-3"},
+                {"name": "instance-1", "ip_addresses": ["10.0.0.1"]},
+            ),
+        ]
+
+        match_map = CollectingManager._make_match_map(
+            resource_mgr, {}, ["name", "ip_addresses"]
+        )
+
+        # an array field matches each of its values
+        self.assertEqual(
+            {
+                ("instance-1", "10.0.0.1"): {
+                    ("cloud-svc-1",): {"cloud_service_id": "cloud-svc-1"},
+                    ("cloud-svc-3",): {"cloud_service_id": "cloud-svc-3"},
+                },
+                ("instance-1", "10.0.0.2"): {
+                    ("cloud-svc-1",): {"cloud_service_id": "cloud-svc-1"},
+                },
+                ("instance-2", "10.0.0.3"): {
+                    ("cloud-svc-2",): {"cloud_service_id": "cloud-svc-2"},
+                },
+            },
+            match_map,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,109 @@
+import unittest
+from datetime import datetime, timedelta
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import transaction
+from spaceone.core import utils
+
+from spaceone.inventory.manager.job_manager import JobManager
+from spaceone.inventory.model.job_model import Job
+
+
+class TestJobManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self, *args) -> None:
+        transaction.create_transaction(meta={})
+        self.job_mgr = JobManager()
+        self.job_vo = Job.create(
+            {"collector_id": "collector-1", "domain_id": self.domain_id}
+        )
+
+    def tearDown(self, *args) -> None:
+        Job.objects.filter().delete()
+
+    def _get_job(self):
+        return Job.objects.get(job_id=self.job_vo.job_id)
+
+    def test_acquire_task_slot(self, *args):
+        job_id = self.job_vo.job_id
+
+        self.assertTrue(
+            self.job_mgr.acquire_task_slot(job_id, self.domain_id, 2, "task-lease-1")
+        )
+        self.assertTrue(
+            self.job_mgr.acquire_task_slot(job_id, self.domain_id, 2, "task-lease-2")
+        )
+        self.assertFalse(
+            self.job_mgr.acquire_task_slot(job_id, self.domain_id, 2, "task-lease-3")
+        )
+
+        job_vo = self._get_job()
+        self.assertEqual(2, job_vo.running_tasks)
+        self.assertEqual(
+            ["task-lease-1", "task-lease-2"], sorted(job_vo.task_leases.keys())
+        )
+
+        self.job_mgr.release_task_slot(job_id, self.domain_id, "task-lease-1")
+        self.assertTrue(
+            self.job_mgr.acquire_task_slot(job_id, self.domain_id, 2, "task-lease-3")
+        )
+
+    def test_release_task_slot_once(self, *args):
+        job_id = self.job_vo.job_id
+        self.job_mgr.acquire_task_slot(job_id, self.domain_id, 2, "task-lease-1")
+
+        self.job_mgr.release_task_slot(job_id, self.domain_id, "task-lease-1")
+        self.job_mgr.release_task_slot(job_id, self.domain_id, "task-lease-1")
+
+        job_vo = self._get_job()
+        self.assertEqual(0, job_vo.running_tasks)
+        self.assertEqual({}, job_vo.task_leases)
+
+    def test_release_expired_task_slots(self, *args):
+        job_id = self.job_vo.job_id
+        self.job_mgr.acquire_task_slot(job_id, self.domain_id, 2, "task-lease-1")
+        self.job_mgr.acquire_task_slot(job_id, self.domain_id, 2, "task-lease-2")
+
+        # the worker running the first task is killed
+        Job._get_collection().update_one(
+            {"job_id": job_id},
+            {
+                "$set": {
+                    "task_leases.task-lease-1": datetime.utcnow() - timedelta(seconds=1)
+                }
+            },
+        )
+
+        self.assertEqual(1, self.job_mgr.release_expired_task_slots(self._get_job()))
+
+        job_vo = self._get_job()
+        self.assertEqual(1, job_vo.running_tasks)
+        self.assertEqual(["task-lease-2"], list(job_vo.task_leases.keys()))
+
+        # the slot of an expired lease is released only once
+        self.job_mgr.release_task_slot(job_id, self.domain_id, "task-lease-1")
+        self.assertEqual(1, self._get_job().running_tasks)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
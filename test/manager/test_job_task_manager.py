@@ -0,0 +1,108 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import queue
+from spaceone.core import transaction
+from spaceone.core import utils
+
+from spaceone.inventory.manager.job_task_manager import JobTaskManager
+from spaceone.inventory.model.job_task_model import JobTask
+
+
+class TestJobTaskManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self, *args) -> None:
+        transaction.create_transaction(meta={"token": "token"})
+        self.job_task_mgr = JobTaskManager()
+        self.job_task_vo = JobTask.create(
+            {
+                "job_id": "job-1",
+                "collector_id": "collector-1",
+                "secret_id": "secret-1",
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def tearDown(self, *args) -> None:
+        JobTask.objects.filter().delete()
+
+    def _make_params(self):
+        return {
+            "collector_id": "collector-1",
+            "job_id": "job-1",
+            "job_task_id": self.job_task_vo.job_task_id,
+            "domain_id": self.domain_id,
+            "secret_info": {"secret_id": "secret-1"},
+            "secret_data": {"data": {"password": "secret"}},
+            "token": "token",
+        }
+
+    def _expire_retry_tasks(self):
+        retry_tasks = JobTask.objects.get(pk=self.job_task_vo.pk).retry_tasks
+        for retry_task in retry_tasks:
+            retry_task["retry_at"] = datetime.utcnow()
+
+        JobTask._get_collection().update_one(
+            {"_id": self.job_task_vo.pk}, {"$set": {"retry_tasks": retry_tasks}}
+        )
+
+    def test_push_job_task_with_delay(self, *args):
+        with patch.object(queue, "put") as queue_put:
+            self.job_task_mgr.push_job_task(self._make_params(), delay=60)
+            self.job_task_mgr.push_job_task(self._make_params(), delay=60)
+
+        # retries are stored in the job task, not in the queue
+        queue_put.assert_not_called()
+
+        retry_tasks = JobTask.objects.get(pk=self.job_task_vo.pk).retry_tasks
+        self.assertEqual(2, len(retry_tasks))
+
+        for retry_task in retry_tasks:
+            self.assertGreater(
+                retry_task["retry_at"], datetime.utcnow() + timedelta(seconds=50)
+            )
+            self.assertNotIn("secret_data", retry_task["params"])
+            self.assertNotIn("token", retry_task["params"])
+
+    def test_pop_due_retry_tasks(self, *args):
+        self.job_task_mgr.push_job_task(self._make_params(), delay=60)
+        self.assertEqual([], self.job_task_mgr.pop_due_retry_tasks())
+
+        self._expire_retry_tasks()
+        self.job_task_mgr.push_job_task(self._make_params(), delay=60)
+
+        retry_params = self.job_task_mgr.pop_due_retry_tasks()
+        self.assertEqual(1, len(retry_params))
+        self.assertEqual(self.job_task_vo.job_task_id, retry_params[0]["job_task_id"])
+
+        # a retry task is popped only once, the retry not due is kept
+        self.assertEqual([], self.job_task_mgr.pop_due_retry_tasks())
+        self.assertEqual(
+            1, len(JobTask.objects.get(pk=self.job_task_vo.pk).retry_tasks)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
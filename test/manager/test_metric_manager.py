@@ -0,0 +1,85 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import queue
+from spaceone.core import transaction
+from spaceone.core import utils
+
+from spaceone.inventory.manager.metric_manager import MetricManager
+from spaceone.inventory.model.metric.database import Metric
+
+
+class TestMetricManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self, *args) -> None:
+        transaction.create_transaction(meta={"token": "token"})
+        self.metric_mgr = MetricManager()
+        self.metric_vo = Metric.create(
+            {
+                "metric_id": "metric-1",
+                "name": "metric-1",
+                "query_options": {"group_by": ["region_code"]},
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def tearDown(self, *args) -> None:
+        Metric.objects.filter().delete()
+
+    def _get_run_retry(self):
+        return Metric.objects.get(pk=self.metric_vo.pk).run_retry
+
+    def test_pop_due_run_retries(self, *args):
+        with patch.object(queue, "put") as queue_put:
+            self.metric_mgr.push_task(
+                self.metric_vo, metric_job_id="metric-job-1", delay=60
+            )
+
+        # the retry is stored in the metric, not in the queue
+        queue_put.assert_not_called()
+        self.assertGreater(
+            self._get_run_retry()["retry_at"],
+            datetime.utcnow() + timedelta(seconds=50),
+        )
+        self.assertEqual([], self.metric_mgr.pop_due_run_retries())
+
+        Metric._get_collection().update_one(
+            {"_id": self.metric_vo.pk},
+            {"$set": {"run_retry.retry_at": datetime.utcnow()}},
+        )
+
+        run_retries = self.metric_mgr.pop_due_run_retries()
+        self.assertEqual(1, len(run_retries))
+        self.assertEqual("metric-1", run_retries[0]["metric_id"])
+        self.assertEqual("metric-job-1", run_retries[0]["metric_job_id"])
+        self.assertFalse(run_retries[0]["is_yesterday"])
+
+        # a retry is popped only once
+        self.assertEqual([], self.metric_mgr.pop_due_run_retries())
+        self.assertIsNone(self._get_run_retry())
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)